@@ -2,9 +2,22 @@
 
 from sphinx.application import Sphinx
 
+from sphinxcontrib.sphinx_pandera.cache import (
+    clear_schema_cache,
+    reset_shared_store,
+    resolve_cache_dir,
+)
+from sphinxcontrib.sphinx_pandera.dictionary import (
+    merge_data_dictionary,
+    purge_data_dictionary,
+    write_data_dictionary,
+)
 from sphinxcontrib.sphinx_pandera.directives import (
     PanderaCheck,
     PanderaField,
+    PanderaFieldNodes,
+    PanderaFieldTable,
+    PanderaLazyFields,
     PanderaModel,
     PanderaModelConfig,
     PanderaSchema,
@@ -12,17 +25,55 @@ from sphinxcontrib.sphinx_pandera.directives import (
 from sphinxcontrib.sphinx_pandera.documenters import (
     PanderaCheckDocumenter,
     PanderaFieldDocumenter,
+    PanderaFieldsDocumenter,
     PanderaModelConfigDocumenter,
     PanderaModelDocumenter,
+    PanderaModuleDocumenter,
     PanderaSchemaDocumenter,
+    PanderaSchemaFileDocumenter,
+)
+from sphinxcontrib.sphinx_pandera.domain import PanderaDomain
+from sphinxcontrib.sphinx_pandera.environment import (
+    get_outdated_docs,
+    merge_fingerprints,
+    purge_fingerprints,
+)
+from sphinxcontrib.sphinx_pandera.lazy import (
+    LazyFieldsTransform,
+    add_script,
+    depart_lazy_field,
+    lazy_field,
+    merge_lazy_fields,
+    purge_lazy_fields,
+    visit_lazy_field,
+    write_lazy_fields,
+)
+from sphinxcontrib.sphinx_pandera.prefetch import (
+    prefetch_descriptions,
+    prewarm_modules,
+    unfreeze_objects,
 )
+from sphinxcontrib.sphinx_pandera.profiling import (
+    init_profiler,
+    merge_timings,
+    purge_timings,
+    write_profile,
+)
+from sphinxcontrib.sphinx_pandera.reloading import reload_modules
+from sphinxcontrib.sphinx_pandera.split import generate_pages
 
 
 def setup(app: Sphinx) -> dict:
     add_configuration_values(app)
 
+    app.add_domain(PanderaDomain)
     app.add_directive_to_domain("py", "pandera_check", PanderaCheck)
     app.add_directive_to_domain("py", "pandera_field", PanderaField)
+    app.add_directive_to_domain("py", "pandera_field_nodes", PanderaFieldNodes)
+    app.add_directive_to_domain("py", "pandera_field_table", PanderaFieldTable)
+    app.add_directive_to_domain("py", "pandera_lazy_fields", PanderaLazyFields)
+    app.add_node(lazy_field, html=(visit_lazy_field, depart_lazy_field))
+    app.add_post_transform(LazyFieldsTransform)
     app.add_directive_to_domain("py", "pandera_model", PanderaModel)
     app.add_directive_to_domain("py", "pandera_schema", PanderaSchema)
     app.add_directive_to_domain(
@@ -36,9 +87,37 @@ def setup(app: Sphinx) -> dict:
     app.add_autodocumenter(PanderaModelDocumenter)
     app.add_autodocumenter(PanderaSchemaDocumenter)
     app.add_autodocumenter(PanderaModelConfigDocumenter)
+    app.add_autodocumenter(PanderaModuleDocumenter)
+    app.add_autodocumenter(PanderaSchemaFileDocumenter)
+    app.add_autodocumenter(PanderaFieldsDocumenter)
+
+    app.connect("config-inited", resolve_cache_dir)
+    app.connect("builder-inited", reload_modules)
+    app.connect("builder-inited", reset_shared_store)
+    app.connect("builder-inited", init_profiler)
+    app.connect("builder-inited", prefetch_descriptions)
+    app.connect("builder-inited", prewarm_modules)
+    app.connect("builder-inited", generate_pages)
+    app.connect("env-get-outdated", get_outdated_docs)
+    app.connect("env-purge-doc", purge_fingerprints)
+    app.connect("env-purge-doc", purge_timings)
+    app.connect("env-purge-doc", purge_lazy_fields)
+    app.connect("env-purge-doc", purge_data_dictionary)
+    app.connect("env-merge-info", merge_fingerprints)
+    app.connect("env-merge-info", merge_timings)
+    app.connect("env-merge-info", merge_lazy_fields)
+    app.connect("env-merge-info", merge_data_dictionary)
+    app.connect("html-page-context", add_script)
+    app.connect("build-finished", write_profile)
+    app.connect("build-finished", write_lazy_fields)
+    app.connect("build-finished", write_data_dictionary)
+    app.connect("build-finished", clear_schema_cache)
+    app.connect("build-finished", unfreeze_objects)
 
     return {
         "version": "0.0.1",
+        # bump whenever the metadata stored on the environment changes
+        "env_version": 1,
         "parallel_read_safe": True,
         "parallel_write_safe": True,
     }
@@ -58,3 +137,55 @@ def add_configuration_values(app: Sphinx):
     app.add_config_value(f"{stem}field_signature_prefix", "column", "env", str)
 
     app.add_config_value(f"{stem}check_signature_prefix", "check", "env", str)
+
+    # Directory caching model and schema descriptions across builds
+    app.add_config_value(f"{stem}cache_dir", None, "", [str])
+
+    # Share descriptions between the processes of parallel builds, when no
+    # cache directory is configured
+    app.add_config_value(f"{stem}shared_store", False, "", bool)
+
+    # Keep descriptions in memory across the builds run by the process, and
+    # reload the modules whose source changed before each build
+    app.add_config_value(f"{stem}memory_cache", False, "", bool)
+
+    # Modules and packages whose models and schemas are described in a pool
+    # of processes before reading documents, and the size of the pool
+    app.add_config_value(f"{stem}prefetch_modules", [], "", [list])
+    app.add_config_value(f"{stem}prefetch_workers", None, "", [int])
+
+    # Describe the models and schemas of the prefetched modules in the build
+    # process, before parallel readers are forked, instead of in a pool
+    app.add_config_value(f"{stem}prewarm", False, "", bool)
+
+    # Read models and schemas from source instead of importing them
+    app.add_config_value(f"{stem}static", False, "env", bool)
+
+    # Report of the time spent documenting each object, relative to the
+    # output directory, written when set
+    app.add_config_value(f"{stem}profile", None, "", [str])
+
+    # Render the fields of models and schemas as a single table
+    app.add_config_value(f"{stem}fields_table", False, "env", bool)
+
+    # Number of fields above which the fields of models and schemas are
+    # documented on pages of their own, the number of fields per page, and
+    # the directory of the pages, relative to the source directory
+    app.add_config_value(f"{stem}split_threshold", None, "env", [int])
+    app.add_config_value(f"{stem}split_size", 500, "env", int)
+    app.add_config_value(f"{stem}split_dir", "_pandera", "env", str)
+
+    # Load the details of fields when they are expanded, in HTML builds
+    app.add_config_value(f"{stem}lazy_fields", False, "env", bool)
+
+    # Build the content of fields from their records instead of parsing
+    # generated rST
+    app.add_config_value(f"{stem}build_nodes", False, "env", bool)
+
+    # Reference the members models inherit from other models instead of
+    # documenting them again on every subclass
+    app.add_config_value(f"{stem}reference_inherited", False, "env", bool)
+
+    # Data dictionary of the documented fields, written as JSON Lines and
+    # CSV files named after it, relative to the output directory
+    app.add_config_value(f"{stem}data_dictionary", None, "env", [str])
@@ -0,0 +1,31 @@
+"""Lazy access to the pandera backend.
+
+Importing pandera pulls in pandas, which is slow: the extension only
+imports it once the first pandera object is documented.
+
+"""
+
+import sys
+from types import ModuleType
+from typing import Optional
+
+
+def import_pandera() -> ModuleType:
+    """Import pandera's pandas API."""
+    # pylint: disable-next=import-outside-toplevel
+    import pandera.pandas as pa
+
+    return pa
+
+
+def get_pandera() -> Optional[ModuleType]:
+    """Get pandera's pandas API if pandera was already imported.
+
+    Pandera objects cannot exist before pandera is imported by the documented
+    code, so anything can be ruled out as a pandera object without importing
+    pandera when this returns None.
+
+    """
+    if "pandera" not in sys.modules:
+        return None
+    return import_pandera()
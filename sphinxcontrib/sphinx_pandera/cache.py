@@ -0,0 +1,412 @@
+"""Build-wide caches shared by the pandera documenters."""
+
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Hashable,
+    Optional,
+    Tuple,
+)
+
+from sphinx.application import Sphinx
+from sphinx.config import Config
+from sphinx.environment import BuildEnvironment
+
+from sphinxcontrib.sphinx_pandera.backend import get_pandera
+from sphinxcontrib.sphinx_pandera.discovery import MODEL, SCHEMA
+from sphinxcontrib.sphinx_pandera.info import (
+    FieldInfo,
+    SchemaInfo,
+    build_schema_info,
+)
+from sphinxcontrib.sphinx_pandera.metadata import (
+    CheckedFields,
+    describe_model,
+    describe_schema,
+    fingerprint,
+    index_checks,
+    index_components,
+)
+from sphinxcontrib.sphinx_pandera.profiling import (
+    DESCRIBE,
+    TO_SCHEMA,
+    Profiler,
+    get_profiler,
+)
+from sphinxcontrib.sphinx_pandera.reloading import track_modules
+from sphinxcontrib.sphinx_pandera.static import StaticObject
+from sphinxcontrib.sphinx_pandera.store import (
+    MEMORY_STORE,
+    DiskCache,
+    MemoryStore,
+    SharedStore,
+    Store,
+    get_source_modules,
+    source_key,
+)
+
+if TYPE_CHECKING:
+    from pandera.pandas import DataFrameSchema
+
+ENV_ATTRIBUTE = "sphinx_pandera_cache"
+
+# Database shared by parallel readers, in the doctree directory
+SHARED_STORE = "sphinx_pandera.sqlite"
+
+CacheKey = Tuple[Any, Hashable]
+
+# Documented object, as a module name and an object path within the module
+ObjectPath = Tuple[str, str]
+
+
+def get_cache_key(obj: Any) -> CacheKey:
+    """Key a documented object by its defining module and qualified name.
+
+    Schema instances carry neither, so they are keyed by identity instead:
+    the cache entry keeps the instance alive, hence its id cannot be reused
+    while the entry exists.
+
+    """
+    if isinstance(obj, type):
+        return obj.__module__, obj.__qualname__
+    return None, id(obj)
+
+
+def get_object_path(obj: Any, location: Optional[ObjectPath]) -> ObjectPath:
+    """Get where a documented object is defined, which must be given for
+    schema instances.
+
+    """
+    if location is not None:
+        return location
+    if not isinstance(obj, type):
+        raise ValueError(f"Location of {obj!r} must be given")
+    return obj.__module__, obj.__qualname__
+
+
+def _dropped() -> None:
+    """Stand in for a schema cache once unpickled."""
+    return None
+
+
+class SchemaCache:
+    """Caches values derived from pandera models and schemas for one build.
+
+    Every value is computed at most once per documented object, whatever the
+    number of documenters asking for it. Entries remember the object they
+    were computed from: when the defining module is reloaded, the model class
+    changes and all the entries of that module are dropped.
+
+    Descriptions prefetched by worker processes are used first, then
+    descriptions are read through the optional disk cache, so that models
+    whose sources did not change since a previous build are neither converted
+    to schemas nor introspected. Parallel builds without disk cache read them
+    through a store shared by the readers instead, so that each object is
+    introspected by one reader only. Processes building several times can
+    keep descriptions in memory instead.
+
+    The cache never leaves the process that filled it: once pickled, as
+    Sphinx does when it saves the environment or merges parallel readers, it
+    unpickles as None and a new cache is created on first use.
+
+    """
+
+    def __init__(
+        self,
+        disk: Optional[Store] = None,
+        profiler: Optional[Profiler] = None,
+    ) -> None:
+        self.disk = disk
+        self.profiler = profiler
+        self._entries: Dict[CacheKey, Tuple[Any, Dict[str, Any]]] = {}
+        # Descriptions computed in other processes, by object path
+        self.prefetched: Dict[ObjectPath, Dict[str, Any]] = {}
+
+    def __reduce__(self):
+        return _dropped, ()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, obj: Any, name: str, factory: Callable[[Any], Any]) -> Any:
+        """Get the value `name` computed by `factory` for the object `obj`."""
+        key = get_cache_key(obj)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] is not obj:
+            # the defining module was reloaded, its other entries are stale
+            self.drop_module(key[0])
+            entry = None
+        if entry is None:
+            entry = self._entries[key] = (obj, {})
+
+        values = entry[1]
+        if name not in values:
+            values[name] = factory(obj)
+        return values[name]
+
+    def schema(self, model: Any) -> "DataFrameSchema":
+        """Get the schema of a pandera model, converting it only once."""
+        return self.get(model, "schema", self._to_schema)
+
+    def components(self, model: Any) -> Dict[Any, Any]:
+        """Get the columns and index levels of the schema of a pandera
+        model, by name.
+
+        """
+        return self.get(
+            model,
+            "components",
+            lambda model: index_components(self.schema(model)),
+        )
+
+    def _to_schema(self, model: Any) -> "DataFrameSchema":
+        with self.timed(model, TO_SCHEMA):
+            return model.to_schema()
+
+    def timed(
+        self, obj: Any, phase: str, location: Optional[ObjectPath] = None
+    ) -> ContextManager[None]:
+        """Time converting or describing an object, when profiling."""
+        if self.profiler is None:
+            return nullcontext()
+        modname, objpath = get_object_path(obj, location)
+        objtype = MODEL if isinstance(obj, type) else SCHEMA
+        return self.profiler.phase(f"{modname}.{objpath}", objtype, phase)
+
+    def description(
+        self, obj: Any, location: Optional[ObjectPath] = None
+    ) -> Dict[str, Any]:
+        """Get the description of a pandera model or schema, defined at
+        `location` for schema instances.
+
+        """
+        if isinstance(obj, StaticObject):
+            return obj.description
+        return self.get(
+            obj, "description", lambda obj: self._describe(obj, location)
+        )
+
+    def _describe(
+        self, obj: Any, location: Optional[ObjectPath]
+    ) -> Dict[str, Any]:
+        with self.timed(obj, DESCRIBE, location):
+            return self._extract(obj, location)
+
+    def _extract(
+        self, obj: Any, location: Optional[ObjectPath]
+    ) -> Dict[str, Any]:
+        description = self.pop_prefetched(obj, location)
+        if description is not None:
+            return description
+
+        modname, objpath = get_object_path(obj, location)
+        name = f"{modname}.{objpath}"
+        key = None
+        if self.disk is not None:
+            modules = get_source_modules(obj, modname)
+            if isinstance(self.disk, MemoryStore):
+                # reloaded when their source changes, for the next builds
+                track_modules(modules)
+            key = source_key(modules)
+            description = self.disk.get(name, key) if key else None
+            if description is not None:
+                return description
+
+        try:
+            if isinstance(obj, type):
+                description = describe_model(obj, self.schema(obj))
+            else:
+                description = describe_schema(obj)
+        except Exception:
+            if isinstance(self.disk, SharedStore) and key is not None:
+                # let another reader describe the object it claimed
+                self.disk.release(name, key)
+            raise
+
+        if self.disk is not None and key is not None:
+            self.disk.put(name, key, description)
+        return description
+
+    def pop_prefetched(
+        self, obj: Any, location: Optional[ObjectPath]
+    ) -> Optional[Dict[str, Any]]:
+        """Pop the description prefetched for an object, whatever the module
+        it is documented from.
+
+        Workers describe models by their defining module and qualified name,
+        as they are cached, and schemas where they are assigned: schemas
+        documented where they are re-exported are found by identity.
+
+        """
+        if isinstance(obj, type):
+            return self.prefetched.pop(get_object_path(obj, None), None)
+        description = self.prefetched.pop(get_object_path(obj, location), None)
+        if description is not None:
+            return description
+        for modname, objpath in list(self.prefetched):
+            if getattr(sys.modules.get(modname), objpath, None) is obj:
+                return self.prefetched.pop((modname, objpath))
+        return None
+
+    def fingerprint(
+        self, obj: Any, location: Optional[ObjectPath] = None
+    ) -> str:
+        """Get the fingerprint of a pandera model or schema."""
+        return self.get(
+            obj,
+            "fingerprint",
+            lambda obj: fingerprint(self.description(obj, location)),
+        )
+
+    def fingerprint_fields(
+        self,
+        obj: Any,
+        start: int,
+        stop: int,
+        location: Optional[ObjectPath] = None,
+    ) -> str:
+        """Get the fingerprint of a slice of the fields of a pandera model or
+        schema.
+
+        """
+        fields = self.description(obj, location)["fields"][start:stop]
+        return fingerprint({"fields": fields})
+
+    def check_index(
+        self, obj: Any, location: Optional[ObjectPath] = None
+    ) -> Dict[str, CheckedFields]:
+        """Get the custom checks of a pandera model or schema, by name."""
+        return self.get(
+            obj,
+            "check_index",
+            lambda obj: index_checks(self.description(obj, location)),
+        )
+
+    def info(
+        self, obj: Any, location: Optional[ObjectPath] = None
+    ) -> SchemaInfo:
+        """Get the records rendered of a pandera model or schema."""
+        return self.get(obj, "info", lambda obj: self._build(obj, location))
+
+    def _build(self, obj: Any, location: Optional[ObjectPath]) -> SchemaInfo:
+        if isinstance(obj, StaticObject):
+            modname = obj.modname
+        else:
+            modname = get_object_path(obj, location)[0]
+        return build_schema_info(self.description(obj, location), modname)
+
+    def fields(
+        self, obj: Any, location: Optional[ObjectPath] = None
+    ) -> Dict[Any, FieldInfo]:
+        """Get the fields of a pandera model or schema, by name."""
+        return self.get(
+            obj,
+            "fields",
+            lambda obj: {
+                field.name: field for field in self.info(obj, location).fields
+            },
+        )
+
+    def member_kinds(self, obj: Any) -> Dict[str, str]:
+        """Get the kind of every member of a pandera model, by name.
+
+        Anything else than a pandera model has no classified member.
+
+        """
+        if isinstance(obj, StaticObject):
+            return obj.description.get("members", {})
+        if not is_model(obj):
+            return {}
+        return self.description(obj)["members"]
+
+    def inherited_members(self, obj: Any) -> Dict[str, str]:
+        """Get the full name of the base model defining each member a pandera
+        model inherits, by name.
+
+        """
+        if isinstance(obj, StaticObject):
+            return obj.description.get("inherited", {})
+        if not is_model(obj):
+            return {}
+        return self.description(obj).get("inherited", {})
+
+    def drop_module(self, modname: str) -> None:
+        """Drop the entries of all the objects defined in module `modname`."""
+        for key in [key for key in self._entries if key[0] == modname]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self.prefetched.clear()
+
+
+def is_model(obj: Any) -> bool:
+    """Tell whether an object is a pandera model."""
+    pa = get_pandera()
+    return (
+        pa is not None
+        and isinstance(obj, type)
+        and issubclass(obj, pa.DataFrameModel)
+    )
+
+
+def get_schema_cache(env: BuildEnvironment) -> SchemaCache:
+    """Get the schema cache of the current build, creating it if needed."""
+    cache = getattr(env, ENV_ATTRIBUTE, None)
+    if cache is None:
+        cache = SchemaCache(get_store(env), get_profiler(env))
+        setattr(env, ENV_ATTRIBUTE, cache)
+    return cache
+
+
+def get_store(env: BuildEnvironment) -> Optional[Store]:
+    """Get the storage of descriptions outside of the build: the disk cache
+    if configured, else the memory of the process if enabled, else the store
+    shared by parallel readers.
+
+    """
+    cache_dir = env.config.sphinx_pandera_cache_dir
+    if cache_dir:
+        return DiskCache(Path(cache_dir))
+    if env.config.sphinx_pandera_memory_cache:
+        return MEMORY_STORE
+    if env.config.sphinx_pandera_shared_store and env.app.parallel > 1:
+        return SharedStore(Path(env.doctreedir, SHARED_STORE))
+    return None
+
+
+def reset_shared_store(app: Sphinx) -> None:
+    """Empty the store shared by parallel readers when a build starts, so
+    that descriptions are only shared within a build.
+
+    """
+    store = get_store(app.env)
+    if isinstance(store, SharedStore):
+        store.reset()
+
+
+def resolve_cache_dir(app: Sphinx, config: Config) -> None:
+    """Resolve the disk cache directory relatively to the configuration
+    directory.
+
+    """
+    if config.sphinx_pandera_cache_dir:
+        config.sphinx_pandera_cache_dir = str(
+            Path(app.confdir, config.sphinx_pandera_cache_dir).resolve()
+        )
+
+
+def clear_schema_cache(  # pylint: disable=unused-argument
+    app: Sphinx, exception: Optional[Exception]
+) -> None:
+    """Drop the schema cache once the build is finished."""
+    cache = getattr(app.env, ENV_ATTRIBUTE, None)
+    if cache is not None:
+        cache.clear()
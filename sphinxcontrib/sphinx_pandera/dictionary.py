@@ -0,0 +1,134 @@
+"""Data dictionary of the documented models and schemas.
+
+The fields of every model and schema the documenters render are recorded
+per document, from the same records the pages are rendered from, and
+written once the build is finished as JSON Lines and CSV files: one record
+per field, without importing any model again.
+
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx.util import logging
+
+from sphinxcontrib.sphinx_pandera.info import SchemaInfo
+
+logger = logging.getLogger(__name__)
+
+ENV_ATTRIBUTE = "sphinx_pandera_data_dictionary"
+
+# Columns of the data dictionary, in order
+COLUMNS = (
+    "schema",
+    "column",
+    "index",
+    "dtype",
+    "nullable",
+    "unique",
+    "coerce",
+    "required",
+    "title",
+    "description",
+    "checks",
+)
+
+
+def get_data_dictionary(
+    env: BuildEnvironment,
+) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    """Get the fields documented in each document, by model or schema."""
+    if not hasattr(env, ENV_ATTRIBUTE):
+        setattr(env, ENV_ATTRIBUTE, {})
+    return getattr(env, ENV_ATTRIBUTE)
+
+
+def record_schema(env: BuildEnvironment, name: str, info: SchemaInfo) -> None:
+    """Record the fields of a model or schema documented in the current
+    document, if the data dictionary is written.
+
+    """
+    if not env.config.sphinx_pandera_data_dictionary:
+        return
+    records = []
+    for field in info.fields:
+        constraints = dict(field.constraints)
+        records.append(
+            {
+                "schema": name,
+                "column": str(field.name),
+                "index": field.is_index,
+                "dtype": field.dtype,
+                "nullable": constraints["nullable"],
+                "unique": constraints["unique"],
+                "coerce": constraints["coerce"],
+                # index levels are always required
+                "required": field.is_index or constraints["required"],
+                "title": field.title,
+                "description": field.description,
+                # builtin checks by their message, custom ones by name
+                "checks": [
+                    check.error or check.name for check in field.checks
+                ],
+            }
+        )
+    get_data_dictionary(env).setdefault(env.docname, {})[name] = records
+
+
+def purge_data_dictionary(  # pylint: disable=unused-argument
+    app: Sphinx, env: BuildEnvironment, docname: str
+) -> None:
+    """Forget the fields recorded for a document about to be read."""
+    get_data_dictionary(env).pop(docname, None)
+
+
+def merge_data_dictionary(  # pylint: disable=unused-argument
+    app: Sphinx,
+    env: BuildEnvironment,
+    docnames: Set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Merge the fields recorded by a parallel reader."""
+    dictionary = get_data_dictionary(env)
+    other_dictionary = get_data_dictionary(other)
+    for docname in docnames:
+        if docname in other_dictionary:
+            dictionary[docname] = other_dictionary[docname]
+
+
+def write_data_dictionary(app: Sphinx, exception: Optional[Exception]) -> None:
+    """Write the data dictionary once the build is finished, if enabled."""
+    stem = app.config.sphinx_pandera_data_dictionary
+    if exception is not None or not stem:
+        return
+
+    # models and schemas documented several times are written once
+    schemas: Dict[str, List[Dict[str, Any]]] = {}
+    for docname in sorted(get_data_dictionary(app.env)):
+        schemas.update(get_data_dictionary(app.env)[docname])
+    records = [record for name in sorted(schemas) for record in schemas[name]]
+
+    path = Path(app.outdir, stem)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.with_name(f"{path.name}.jsonl").open(
+        "w", encoding="utf-8"
+    ) as file:
+        for record in records:
+            file.write(json.dumps(record) + "\n")
+    with path.with_name(f"{path.name}.csv").open(
+        "w", encoding="utf-8", newline=""
+    ) as file:
+        writer = csv.DictWriter(file, COLUMNS)
+        writer.writeheader()
+        for record in records:
+            writer.writerow({**record, "checks": "; ".join(record["checks"])})
+
+    logger.info(
+        "[sphinx-pandera] data dictionary of %d fields written to %s",
+        len(records),
+        path.parent,
+    )
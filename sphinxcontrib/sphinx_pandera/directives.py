@@ -1,9 +1,16 @@
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 from docutils import nodes
 from docutils.nodes import Text
-from docutils.parsers.rst.directives import unchanged
-from sphinx.addnodes import desc_annotation, desc_sig_space, desc_signature
+from docutils.parsers.rst.directives import flag, unchanged, unchanged_required
+from docutils.parsers.rst.directives.tables import ListTable
+from docutils.statemachine import StringList
+from sphinx.addnodes import (
+    desc_annotation,
+    desc_content,
+    desc_sig_space,
+    desc_signature,
+)
 from sphinx.domains.python import (
     PyAttribute,
     PyClasslike,
@@ -11,9 +18,29 @@ from sphinx.domains.python import (
     PyVariable,
     py_sig_re,
 )
+from sphinx.util.docstrings import prepare_docstring
+from sphinx.util.docutils import SphinxDirective
+from sphinx.util.nodes import make_id
+
+from sphinxcontrib.sphinx_pandera.domain import note_pandera_object
+from sphinxcontrib.sphinx_pandera.info import (
+    CheckInfo,
+    FieldInfo,
+    format_check,
+)
+from sphinxcontrib.sphinx_pandera.lazy import (
+    find_document_fields,
+    lazy_fields,
+    make_list_field,
+    summarize_field,
+)
 
 TupleStr = Tuple[str, str]
 
+# Records of the fields whose nodes are built, by record name, in the
+# temporary data of the document being read
+FIELD_NODES = "sphinx_pandera_field_nodes"
+
 
 class PanderaDirectiveBase:
     """Base class for pandera directive providing common functionality."""
@@ -35,6 +62,25 @@ class PanderaDirectiveBase:
 
         return [Text(value), desc_sig_space()]
 
+    def add_target_and_index(
+        self, name_cls: TupleStr, sig: str, signode: desc_signature
+    ) -> None:
+        """Also record the described object in the pandera domain."""
+        # pylint: disable-next=no-member
+        super().add_target_and_index(name_cls, sig, signode)  # type: ignore
+        # pylint: disable-next=no-member
+        modname = self.options.get(  # type: ignore[attr-defined]
+            "module", self.env.ref_context.get("py:module")  # type: ignore
+        )
+        fullname = ".".join(filter(None, [modname, name_cls[0]]))
+        if signode["ids"]:
+            note_pandera_object(
+                self.env,  # type: ignore[attr-defined]
+                fullname,
+                self.config_name,
+                signode["ids"][0],
+            )
+
 
 class PanderaSchema(PanderaDirectiveBase, PyVariable):  # type: ignore
     """Specialized directive for pandera models."""
@@ -66,18 +112,28 @@ class PanderaModelConfig(PanderaDirectiveBase, PyClasslike):  # type: ignore
 
 
 class PanderaField(PanderaDirectiveBase, PyAttribute):  # type: ignore
-    """Specialized directive for pandera fields."""
+    """Specialized directive for pandera fields.
+
+    The content of fields whose record is given, by the `record` option or
+    by the directive running them, is built from the record instead of being
+    parsed from generated rST. Only the description, written by users, and
+    checks, which may be references, are parsed.
+
+    """
 
     option_spec = PyAttribute.option_spec.copy()  # type: ignore[misc]
     option_spec.update(
         {
             "title": unchanged,  # to display field title property
+            "record": unchanged,  # to build the content from a field record
         }
     )
 
     config_name = "field"
     default_prefix = "attribute"
 
+    field: Optional[FieldInfo] = None
+
     def get_field_name(self, sig: str) -> str:
         """Get field name from signature. Borrows implementation from
         `PyObject.handle_signature`.
@@ -98,6 +154,54 @@ class PanderaField(PanderaDirectiveBase, PyAttribute):  # type: ignore
 
         return fullname, prefix
 
+    def transform_content(self, content_node: desc_content) -> None:
+        """Build the content of the field from its record, if given, after
+        the parsed content, before doc fields are transformed.
+
+        """
+        super().transform_content(content_node)
+        field = self.field
+        if field is None and "record" in self.options:
+            records = self.env.temp_data.get(FIELD_NODES, {})
+            field = records.pop(self.options["record"], None)
+        if field is not None:
+            content_node.extend(self.build_content(field))
+
+    def build_content(self, field: FieldInfo) -> List[nodes.Node]:
+        """Build the description, constraints and checks of a field."""
+        result: List[nodes.Node] = []
+        if field.description is not None:
+            holder = nodes.Element()
+            self.state.nested_parse(
+                StringList(prepare_docstring(field.description)),
+                self.content_offset,
+                holder,
+            )
+            result.extend(holder.children)
+
+        field_list = nodes.field_list()
+        field_list += make_list_field(
+            "Constraints",
+            [
+                [nodes.strong(text=key), Text(f" = {value}")]
+                for key, value in field.constraints
+            ],
+        )
+        if field.checks:
+            field_list += make_list_field(
+                "Validated by",
+                [self.parse_check(check) for check in field.checks],
+            )
+        result.append(field_list)
+        return result
+
+    def parse_check(self, check: CheckInfo) -> List[nodes.Node]:
+        """Parse the inline markup of a check."""
+        children, messages = self.state.inline_text(
+            format_check(check), self.lineno
+        )
+        return [*children, *messages]
+
 
 class PanderaCheck(PanderaDirectiveBase, PyMethod):  # type: ignore
 
@@ -121,3 +225,119 @@ class PanderaCheck(PanderaDirectiveBase, PyMethod):  # type: ignore
         ]:
             signode.children.remove(remove)
         return fullname, prefix
+
+
+def register_field(
+    directive: SphinxDirective, node: nodes.Element, name: str
+) -> None:
+    """Make a node the target of references to a field, named relatively to
+    the current module and class.
+
+    """
+    modname = directive.env.ref_context.get("py:module")
+    fullname = ".".join(filter(None, [modname, name]))
+    node_id = make_id(directive.env, directive.state.document, "", fullname)
+    node["ids"].append(node_id)
+    directive.state.document.note_explicit_target(node)
+    directive.env.get_domain("py").note_object(  # type: ignore[attr-defined]
+        fullname, "pandera_field", node_id, location=node
+    )
+    note_pandera_object(directive.env, fullname, "field", node_id)
+
+
+class PanderaFieldTable(SphinxDirective, ListTable):
+    """Table of the fields of a pandera model or schema, one row per field.
+
+    The first cell of every row names the field: the row is the target of
+    references to it, as the field directive would be, without rendering a
+    description for each field.
+
+    """
+
+    option_spec = ListTable.option_spec.copy()
+    option_spec.update({"no-index": flag})
+
+    def run(self) -> List[nodes.Node]:
+        result = super().run()
+        if "no-index" in self.options:
+            return result
+
+        # fields of models are in their class, fields of schemas are named
+        # after the schema given as argument
+        prefix = [self.env.ref_context.get("py:class"), *self.arguments]
+        for table in result:
+            for tbody in table.findall(nodes.tbody):
+                for row in tbody.children:
+                    name = ".".join(filter(None, [*prefix, row[0].astext()]))
+                    register_field(self, row, name)
+        return result
+
+
+class PanderaLazyFields(SphinxDirective):
+    """Fields of a pandera model or schema whose details are loaded by the
+    browser when they are expanded.
+
+    Only the summaries of the fields, named in the data file of the fields,
+    are built when reading: they are the targets of references to the fields,
+    as the field directive would be. Fields are described in full, from their
+    records, when writing for builders other than HTML ones.
+
+    """
+
+    optional_arguments = 1
+    option_spec = {"data": unchanged_required, "no-index": flag}
+
+    def run(self) -> List[nodes.Node]:
+        name = self.options["data"]
+        node = lazy_fields(classes=["pandera-fields"], data=name)
+        # fields of models are in their class, fields of schemas are named
+        # after the schema given as argument
+        prefix = [self.env.ref_context.get("py:class"), *self.arguments]
+        for index, field in enumerate(find_document_fields(self.env, name)):
+            summary = summarize_field(name, index, field)
+            if "no-index" not in self.options:
+                fullname = ".".join(filter(None, [*prefix, field["name"]]))
+                register_field(self, summary, fullname)
+            node += summary
+        return [node]
+
+
+class PanderaFieldNodes(SphinxDirective):
+    """Fields of a pandera schema, whose nodes are built from their records
+    rather than parsed from generated rST.
+
+    The argument names the schema the fields are documented in, the records
+    are taken from the temporary data of the current document.
+
+    """
+
+    required_arguments = 1
+    option_spec = {"data": unchanged_required}
+
+    def run(self) -> List[nodes.Node]:
+        records = self.env.temp_data.get(FIELD_NODES, {})
+        fields: Optional[List[FieldInfo]] = records.pop(
+            self.options["data"], None
+        )
+        if fields is None:
+            return []
+
+        result: List[nodes.Node] = []
+        for field in fields:
+            options = {"type": field.type}
+            if field.title is not None:
+                options["title"] = field.title
+            directive = PanderaField(
+                "py:pandera_field",
+                [f"{self.arguments[0]}.{field.name}"],
+                options,
+                StringList(),
+                self.lineno,
+                self.content_offset,
+                self.block_text,
+                self.state,
+                self.state_machine,
+            )
+            directive.field = field
+            result.extend(directive.run())
+        return result
@@ -0,0 +1,142 @@
+"""Discovery of the pandera models and schemas defined in modules."""
+
+import importlib
+import importlib.util
+import pkgutil
+from types import ModuleType
+from typing import Iterable, Iterator, List, NamedTuple, Set
+
+from sphinx.pycode import ModuleAnalyzer, PycodeError
+from sphinx.util import logging
+
+from sphinxcontrib.sphinx_pandera.backend import get_pandera
+
+logger = logging.getLogger(__name__)
+
+MODEL = "pandera_model"
+SCHEMA = "pandera_schema"
+
+
+class PanderaObject(NamedTuple):
+    """A pandera object, and the documenter it is documented with."""
+
+    modname: str
+    name: str
+    objtype: str
+
+
+def iter_modules(modname: str) -> Iterator[ModuleType]:
+    """Import a module, then each module of the package it is, once.
+
+    Submodules which fail to import are skipped with a warning.
+
+    """
+    module = importlib.import_module(modname)
+    yield module
+
+    path = getattr(module, "__path__", None)
+    if path is None:
+        return
+    for info in pkgutil.walk_packages(
+        path, prefix=f"{modname}.", onerror=warn_import_error
+    ):
+        try:
+            yield importlib.import_module(info.name)
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                "[sphinx-pandera] cannot import %s: %s", info.name, exc
+            )
+
+
+def iter_module_names(modname: str) -> Iterator[str]:
+    """Iterate over the name of a module, then of each module of the package
+    it is, importing at most its parent packages.
+
+    """
+    spec = importlib.util.find_spec(modname)
+    if spec is None:
+        raise ImportError(f"No module named {modname!r}")
+    yield modname
+    if spec.submodule_search_locations:
+        yield from iter_submodule_names(
+            modname, spec.submodule_search_locations
+        )
+
+
+def iter_submodule_names(modname: str, path: Iterable[str]) -> Iterator[str]:
+    """Iterate over the names of the modules of a package found in `path`,
+    without importing them.
+
+    """
+    for info in pkgutil.iter_modules(path, prefix=f"{modname}."):
+        yield info.name
+        if not info.ispkg:
+            continue
+        spec = info.module_finder.find_spec(info.name)  # type: ignore
+        if spec is not None and spec.submodule_search_locations:
+            yield from iter_submodule_names(
+                info.name, spec.submodule_search_locations
+            )
+
+
+def warn_import_error(modname: str) -> None:
+    """Warn about a package which cannot be imported while walking."""
+    logger.warning("[sphinx-pandera] cannot import %s", modname)
+
+
+def get_defined_names(module: ModuleType) -> Set[str]:
+    """Get the names assigned at the top level of a module's source, or all
+    its names when its source is unavailable.
+
+    """
+    try:
+        analyzer = ModuleAnalyzer.for_module(module.__name__)
+        analyzer.analyze()
+    except PycodeError:
+        return set(vars(module))
+    return set(analyzer.tagorder)
+
+
+def find_pandera_objects(module: ModuleType) -> List[PanderaObject]:
+    """Find the models and schemas defined in a module, in source order.
+
+    Models are found by the module they are defined in, schemas by the names
+    assigned in the module source, so that imported objects are skipped.
+
+    """
+    pa = get_pandera()
+    if pa is None:
+        return []
+
+    found = []
+    seen = set()
+    defined_names = None
+    modname = module.__name__
+    for name, obj in vars(module).items():
+        if name.startswith("_") or id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if (
+            isinstance(obj, type)
+            and issubclass(obj, pa.DataFrameModel)
+            and obj.__module__ == modname
+        ):
+            found.append(PanderaObject(modname, name, MODEL))
+        elif isinstance(obj, pa.DataFrameSchema):
+            if defined_names is None:
+                defined_names = get_defined_names(module)
+            if name in defined_names:
+                found.append(PanderaObject(modname, name, SCHEMA))
+
+    return found
+
+
+def discover(modname: str) -> List[PanderaObject]:
+    """Find the models and schemas of a module, or of all the modules of a
+    package.
+
+    """
+    found = []
+    for module in iter_modules(modname):
+        found.extend(find_pandera_objects(module))
+    return found
@@ -1,38 +1,390 @@
 import inspect
-from typing import Any, List, Optional
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
-import pandera.pandas as pa
-from docutils.parsers.rst.directives import unchanged
+from docutils.parsers.rst.directives import nonnegative_int, unchanged
 from docutils.statemachine import StringList
 from sphinx.ext.autodoc import (
     ALL,
     AttributeDocumenter,
     ClassDocumenter,
     DataDocumenter,
+    Documenter,
     MethodDocumenter,
+    ModuleDocumenter,
     ObjectMember,
+    Options,
+    bool_option,
     get_class_members,
 )
-from sphinx.ext.autodoc.directive import DocumenterBridge
+from sphinx.pycode import ModuleAnalyzer
+from sphinx.util import logging
 from sphinx.util.docstrings import prepare_docstring
+from sphinx.util.inspect import object_description
+from sphinx.util.rst import escape
+
+from sphinxcontrib.sphinx_pandera.backend import get_pandera
+from sphinxcontrib.sphinx_pandera.cache import ObjectPath, get_schema_cache
+from sphinxcontrib.sphinx_pandera.dictionary import record_schema
+from sphinxcontrib.sphinx_pandera.directives import FIELD_NODES
+from sphinxcontrib.sphinx_pandera.discovery import discover
+from sphinxcontrib.sphinx_pandera.environment import record_fingerprint
+from sphinxcontrib.sphinx_pandera.info import (
+    FieldInfo,
+    SchemaInfo,
+    format_check,
+)
+from sphinxcontrib.sphinx_pandera.lazy import record_lazy_fields
+from sphinxcontrib.sphinx_pandera.metadata import (
+    CHECK,
+    CONFIG,
+    DATAFRAME_CHECK,
+    FIELD,
+    INDEX,
+)
+from sphinxcontrib.sphinx_pandera.profiling import (
+    FILTER,
+    IMPORT,
+    RENDER,
+    profile_phase,
+)
+from sphinxcontrib.sphinx_pandera.serialization import get_schema_file_object
+from sphinxcontrib.sphinx_pandera.split import (
+    FieldSlice,
+    get_page_name,
+    get_page_slices,
+)
+from sphinxcontrib.sphinx_pandera.static import (
+    StaticMember,
+    StaticObject,
+    discover_static,
+    get_static_object,
+)
+
+if TYPE_CHECKING:
+    from pandera.pandas import DataFrameSchema, Field
+
+logger = logging.getLogger(__name__)
+
+# Roles referencing inherited members, by kind
+INHERITED_ROLES = {
+    FIELD: "field",
+    INDEX: "field",
+    CHECK: "check",
+    DATAFRAME_CHECK: "check",
+}
+
+#############
+# Profiling #
+#############
+
+
+class ProfiledDocumenterMixin:
+    """
+    Times importing, filtering the members of and rendering pandera objects
+    when profiling is enabled
+    """
+
+    def generate(self, *args, **kwargs) -> None:
+        with profile_phase(self, RENDER):
+            super().generate(*args, **kwargs)  # type: ignore[misc]
+
+    def import_object(self, raiseerror: bool = False) -> bool:
+        with profile_phase(self, IMPORT):
+            return super().import_object(raiseerror)  # type: ignore[misc]
+
+    def document_members(self, all_members: bool = False) -> None:
+        # members are timed on their own, leaving the time spent finding and
+        # filtering them
+        with profile_phase(self, FILTER):
+            super().document_members(all_members)  # type: ignore[misc]
+
+
+##########
+# Static #
+##########
+
+
+def add_docstring(documenter: Documenter, doc: Optional[str]) -> None:
+    """Add a docstring read from source, as autodoc would."""
+    if not doc:
+        return
+    tabsize = documenter.directive.state.document.settings.tab_width
+    docstrings = [prepare_docstring(doc, tabsize=tabsize)]
+    source_name = documenter.get_sourcename()
+    for i, line in enumerate(documenter.process_doc(docstrings)):
+        documenter.add_line(line, source_name, i)
+
+
+def add_attribute_docs(documenter: Documenter) -> None:
+    """Add the documentation comments of an attribute, as autodoc would."""
+    attr_docs = documenter.analyzer.find_attr_docs()
+    key = (".".join(documenter.objpath[:-1]), documenter.objpath[-1])
+    if key not in attr_docs:
+        return
+    source_name = documenter.get_sourcename()
+    docstrings = [list(attr_docs[key])]
+    for i, line in enumerate(documenter.process_doc(docstrings)):
+        documenter.add_line(line, source_name, i)
+
+
+class StaticDocumenterMixin(ABC):
+    """
+    Documents pandera objects read from source when static extraction is
+    enabled, importing them only when they cannot be read statically
+    """
+
+    def generate(
+        self,
+        more_content: Optional[StringList] = None,
+        real_modname: Optional[str] = None,
+        check_module: bool = False,
+        all_members: bool = False,
+    ) -> None:
+        if self.config.sphinx_pandera_static and self.generate_static(
+            more_content
+        ):
+            return
+        super().generate(  # type: ignore[misc]
+            more_content, real_modname, check_module, all_members
+        )
+
+    def generate_static(self, more_content: Optional[StringList]) -> bool:
+        """Document the object read from source, if it can be."""
+        if not self.parse_name():
+            return False
+        obj = get_static_object(self.modname, ".".join(self.objpath))
+        if obj is None:
+            return False
+
+        self.object = obj
+        self.real_modname = self.modname
+        self.analyzer = ModuleAnalyzer.for_file(str(obj.source), self.modname)
+        self.directive.record_dependencies.add(str(obj.source))
+        self.record_fingerprint()
+
+        source_name = self.get_sourcename()
+        self.add_line("", source_name)
+        Documenter.add_directive_header(self, "")
+        self.add_line("", source_name)
+        self.indent += self.content_indent
+        self.add_static_content(more_content)
+        return True
+
+    @abstractmethod
+    def add_static_content(self, more_content: Optional[StringList]) -> None:
+        """Add the content of the object read from source."""
+
+    def get_member_documenter(self, objtype: str, name: str) -> Documenter:
+        """Create the documenter of a member read from source."""
+        objpath = [*self.objpath, name]
+        documenter = self.documenters[objtype](
+            self.directive, ".".join(objpath), self.indent
+        )
+        documenter.modname = self.modname
+        documenter.real_modname = self.modname
+        documenter.objpath = objpath
+        documenter.fullname = f"{self.modname}.{'.'.join(objpath)}"
+        documenter.parent = self.object
+        documenter.object = name
+        documenter.object_name = name
+        documenter.analyzer = self.analyzer
+        return documenter
+
 
 ##########
 # Schema #
 ##########
 
 
-class PanderaSchemaDocumenter(DataDocumenter):
+def use_fields_table(documenter: Documenter) -> bool:
+    """Tell whether fields are rendered as a single table."""
+    return bool(
+        documenter.options.fields_table
+        or documenter.config.sphinx_pandera_fields_table
+    )
+
+
+def use_lazy_fields(documenter: Documenter) -> bool:
+    """Tell whether the details of fields are loaded when they are expanded,
+    in HTML outputs.
+
+    """
+    return bool(
+        documenter.options.lazy_fields
+        or documenter.config.sphinx_pandera_lazy_fields
+    )
+
+
+def use_inherited_references(documenter: Documenter) -> bool:
+    """Tell whether the members a model inherits from other models are
+    referenced rather than documented again.
+
+    """
+    return bool(
+        documenter.options.reference_inherited
+        or documenter.config.sphinx_pandera_reference_inherited
+    )
+
+
+def use_field_nodes(documenter: Documenter) -> bool:
+    """Tell whether the content of fields is built from their records rather
+    than parsed from generated rST.
+
+    """
+    return bool(documenter.config.sphinx_pandera_build_nodes)
+
+
+def add_field_nodes(
+    documenter: Documenter,
+    fields: Sequence[FieldInfo],
+    key: str,
+    schema_name: str,
+) -> None:
+    """Add fields whose nodes are built by a single directive from their
+    records, kept under `key` until the directive runs.
+
+    """
+    documenter.env.temp_data.setdefault(FIELD_NODES, {})[key] = fields
+    source_name = documenter.get_sourcename()
+    documenter.add_line(
+        f".. py:pandera_field_nodes:: {schema_name}", source_name
+    )
+    documenter.add_line(f"   :data: {key}", source_name)
+    documenter.add_line("", source_name)
+
+
+def use_compact_fields(documenter: Documenter) -> bool:
+    """Tell whether fields are rendered all at once rather than each by its
+    own directive.
+
+    """
+    return use_lazy_fields(documenter) or use_fields_table(documenter)
+
+
+def add_compact_fields(
+    documenter: Documenter,
+    fields: Sequence[FieldInfo],
+    key: str,
+    schema_name: Optional[str] = None,
+) -> None:
+    """Add fields whose details are loaded when they are expanded, or else a
+    table of fields. Fields are recorded under `key`, the name of the model
+    or schema in full.
+
+    """
+    if not use_lazy_fields(documenter):
+        add_fields_table(documenter, fields, schema_name)
+        return
+    if not fields:
+        return
+    name = record_lazy_fields(documenter.env, key, fields)
+    source_name = documenter.get_sourcename()
+    documenter.add_line(
+        f".. py:pandera_lazy_fields:: {schema_name or ''}".rstrip(),
+        source_name,
+    )
+    documenter.add_line(f"   :data: {name}", source_name)
+    if documenter.options.no_index:
+        documenter.add_line("   :no-index:", source_name)
+    documenter.add_line("", source_name)
+
+
+def add_field_pages(documenter: Documenter, fullname: str, count: int) -> None:
+    """Add the table of contents of the pages documenting the fields of a
+    split model or schema.
+
+    """
+    source_name = documenter.get_sourcename()
+    documenter.add_line(".. toctree::", source_name)
+    documenter.add_line("   :maxdepth: 1", source_name)
+    documenter.add_line("", source_name)
+    for index in range(1, count + 1):
+        page = get_page_name(documenter.config, fullname, index)
+        documenter.add_line(f"   /{page}", source_name)
+    documenter.add_line("", source_name)
+
+
+def add_fields_table(
+    documenter: Documenter,
+    fields: Sequence[FieldInfo],
+    schema_name: Optional[str] = None,
+) -> None:
+    """Add a table of fields, one row per field, instead of a directive per
+    field. Fields of schemas are named after the schema.
+
+    """
+    if not fields:
+        return
+    source_name = documenter.get_sourcename()
+    tabsize = documenter.directive.state.document.settings.tab_width
+    header = [
+        "Field",
+        "Type",
+        "Title",
+        *(key.capitalize() for key, _ in fields[0].constraints),
+        "Validated by",
+        "Description",
+    ]
+
+    documenter.add_line(
+        f".. py:pandera_field_table:: {schema_name or ''}".rstrip(),
+        source_name,
+    )
+    documenter.add_line("   :header-rows: 1", source_name)
+    documenter.add_line("   :widths: auto", source_name)
+    documenter.add_line("   :class: pandera-fields", source_name)
+    if documenter.options.no_index:
+        documenter.add_line("   :no-index:", source_name)
+    documenter.add_line("", source_name)
+    documenter.add_line(f"   * - {header[0]}", source_name)
+    for title in header[1:]:
+        documenter.add_line(f"     - {title}", source_name)
+
+    for field in fields:
+        cells = [
+            [escape(str(field.name))],
+            [escape(field.type)],
+            [escape(field.title)] if field.title else [],
+            *([str(value)] for _, value in field.constraints),
+            [f"* {format_check(check)}" for check in field.checks],
+            (
+                prepare_docstring(field.description, tabsize=tabsize)[:-1]
+                if field.description
+                else []
+            ),
+        ]
+        for i, lines in enumerate(cells):
+            bullet = "   * -" if i == 0 else "     -"
+            if not lines:
+                documenter.add_line(bullet, source_name)
+                continue
+            documenter.add_line(f"{bullet} {lines[0]}", source_name)
+            for line in lines[1:]:
+                documenter.add_line(f"       {line}".rstrip(), source_name)
+    documenter.add_line("", source_name)
+
+
+class PanderaSchemaDocumenter(
+    ProfiledDocumenterMixin, StaticDocumenterMixin, DataDocumenter
+):
     objtype = "pandera_schema"
     directivetype = "pandera_schema"
 
     priority = 10 + DataDocumenter.priority
 
     option_spec = dict(DataDocumenter.option_spec)
+    option_spec["fields-table"] = bool_option
+    option_spec["lazy-fields"] = bool_option
 
     @classmethod
     def can_document_member(
         cls, member: Any, membername: str, isattr: bool, parent: Any
     ) -> bool:
+        pa = get_pandera()
+        if pa is None:
+            return False
         try:
             is_val = super().can_document_member(
                 member, membername, isattr, parent
@@ -43,12 +395,41 @@ class PanderaSchemaDocumenter(DataDocumenter):
         except TypeError:
             return False
 
+    def import_object(self, raiseerror: bool = False) -> bool:
+        ret = super().import_object(raiseerror)
+        if ret:
+            self.record_fingerprint()
+        return ret
+
+    @property
+    def location(self) -> ObjectPath:
+        """Where the documented schema is defined."""
+        return self.modname, ".".join(self.objpath)
+
+    @property
+    def schema_info(self) -> SchemaInfo:
+        """Provide the records of the documented schema."""
+        return get_schema_cache(self.env).info(self.object, self.location)
+
+    def record_fingerprint(self) -> None:
+        """Record the schema fingerprint to detect changes on later builds."""
+        value = get_schema_cache(self.env).fingerprint(
+            self.object, self.location
+        )
+        record_fingerprint(self.env, self.object, *self.location, value)
+
+    def add_static_content(self, more_content: Optional[StringList]) -> None:
+        self.add_content(more_content)
+
     def add_content(  # pylint: disable=unused-argument
         self,
         more_content: Optional[StringList],
         **kwargs,
     ) -> None:
         """Delegate additional content creation."""
+        record_schema(
+            self.env, ".".join(filter(None, self.location)), self.schema_info
+        )
         self.add_title()
         self.add_description()
         self.add_config()
@@ -57,13 +438,14 @@ class PanderaSchemaDocumenter(DataDocumenter):
         self.add_schema_validators()
 
     def add_title(self):
-        if not self.object.title:
+        title = self.schema_info.title
+        if not title:
             return
-        self.add_line(f"   :title: {self.object.title}", self.get_sourcename())
+        self.add_line(f"   :title: {title}", self.get_sourcename())
 
     def add_description(self):
         """Adds description from schema if present."""
-        description = self.object.description
+        description = self.schema_info.description
 
         if not description:
             return
@@ -81,12 +463,7 @@ class PanderaSchemaDocumenter(DataDocumenter):
         """
         source_name = self.get_sourcename()
         self.add_line(":Schema Configuration:", source_name)
-        config = {
-            "coerce": self.object.coerce,
-            "ordered": self.object.ordered,
-            "strict": self.object.strict,
-        }
-        for key, value in config.items():
+        for key, value in self.schema_info.config:
             self.add_line(f"      - **{key}** = {value}", source_name)
         self.add_line("", source_name)
 
@@ -95,22 +472,42 @@ class PanderaSchemaDocumenter(DataDocumenter):
         Adds fields description
         """
         source_name = self.get_sourcename()
-        for field in self.object.columns.values():
+        # HACK: index levels are only described if they are named
+        # We should find a better way to identify if the index was specified
+        # explicitely in the schema
+        slices = self.get_field_slices()
+        if slices:
+            add_field_pages(self, ".".join(self.location), len(slices))
+            return
+        if use_compact_fields(self):
+            add_compact_fields(
+                self,
+                self.schema_info.fields,
+                ".".join(self.location),
+                ".".join(self.objpath),
+            )
+            return
+        if use_field_nodes(self):
+            add_field_nodes(
+                self,
+                self.schema_info.fields,
+                ".".join(self.location),
+                ".".join(self.objpath),
+            )
+            return
+        for field in self.schema_info.fields:
             self.add_field(field, source_name)
 
-        if isinstance(self.object.index, pa.MultiIndex):
-            indices = self.object.index.named_indexes
-        else:
-            indices = {self.object.index.name: self.object.index}
+    def get_field_slices(self) -> List[FieldSlice]:
+        """Get the slices of fields documented on pages of their own, if the
+        schema is split.
 
-        for idx_name, idx in indices.items():
-            # HACK: this determines if an index will be documented or not
-            # We should find a better way to identify if the index was specified
-            # explicitely in the schema
-            if idx.name is not None:
-                self.add_field(idx, idx_name, is_index=True)
+        """
+        return get_page_slices(
+            self.env, ".".join(self.location), len(self.schema_info.fields)
+        )
 
-    def add_field(self, field, source_name, is_index=False):
+    def add_field(self, field: FieldInfo, source_name: str) -> None:
         """
         Adds a field with custom prefix if the field is an index
         """
@@ -120,31 +517,17 @@ class PanderaSchemaDocumenter(DataDocumenter):
             source_name,
         )
 
-        if is_index:
-            self.add_line(f"   :type: Index[{field.dtype }]", source_name)
-        else:
-            self.add_line(f"   :type: {field.dtype }", source_name)
+        self.add_line(f"   :type: {field.type}", source_name)
         if field.title is not None:
             self.add_line(f"   :title: {field.title}", source_name)
 
-        constraints = {
-            "nullable": field.nullable,
-            "unique": field.unique,
-            "coerce": field.coerce,
-        }
-
-        try:
-            constraints["required"] = field.required
-        except AttributeError:  # Field is an Index or MultiIndex
-            constraints["required"] = "True (Index)"
-
         if field.description is not None:
             self.add_line("", source_name)
             self.add_line(f"   {field.description}", source_name)
 
         self.add_line("", source_name)
         self.add_line("   :Constraints:", source_name)
-        for key, value in constraints.items():
+        for key, value in field.constraints:
             self.add_line(f"      - **{key}** = {value}", source_name)
 
         self.add_line("", source_name)
@@ -152,16 +535,9 @@ class PanderaSchemaDocumenter(DataDocumenter):
         if not field.checks:
             return
 
-        source_name = self.get_sourcename()
         self.add_line("   :Validated by:", source_name)
         for check in field.checks:
-            # HACK: standard checks implement nice error message
-            if check.error:
-                line = f"      - **{check.error}**"
-            else:
-                ref = f"{self.modname}.{check.name}"
-                line = f"      - :py:obj:`{check.name} <{ref}>`"
-            self.add_line(line, source_name)
+            self.add_line(f"      - {format_check(check)}", source_name)
 
         self.add_line("", source_name)
 
@@ -169,31 +545,23 @@ class PanderaSchemaDocumenter(DataDocumenter):
         """
         Add custom field validators
         """
-        field_validators = {}
         source_name = self.get_sourcename()
-        for field in list(self.object.columns.values()) + [self.object.index]:
-            for check in field.checks:
-                # HACK: standard checks implement nice error message
-                if check.error:
-                    continue
-                check_d = field_validators.setdefault(
-                    check.name,
-                    {
-                        "doc": check._check_fn.__doc__.strip(),  # pylint: disable=protected-access
-                        "fields": [],
-                    },
-                )
-                check_d["fields"].append(field.name)
+        check_index = get_schema_cache(self.env).check_index(
+            self.object, self.location
+        )
 
-        for check_name, check_d in field_validators.items():
+        for check_name, (doc, fields) in check_index.items():
             self.add_line(f".. py:pandera_check:: {check_name}", source_name)
             self.add_line("", source_name)
-            self.add_line(f"   {check_d['doc']}", source_name)
+            self.add_line(f"   {doc}", source_name)
             self.add_line("", source_name)
             self.add_line("   :Validates:", source_name)
 
-            for field in check_d["fields"]:
-                self.add_line(f"      - :py:obj:`{field}`", source_name)
+            for field in fields:
+                ref = ".".join(filter(None, [*self.location, field]))
+                self.add_line(
+                    f"      - :pandera:field:`{field} <{ref}>`", source_name
+                )
 
         self.add_line("", source_name)
 
@@ -202,19 +570,181 @@ class PanderaSchemaDocumenter(DataDocumenter):
         Add custom schema validators
         """
         source_name = self.get_sourcename()
-        if not self.object.checks:
-            return
+        for check in self.schema_info.checks:
+            self.add_line(f".. py:pandera_check:: {check.name}", source_name)
+            self.add_line("", source_name)
+            self.add_line(f"   {check.description}", source_name)
 
-        for check in self.object.checks:
-            if isinstance(check, pa.Check):
-                name = check.name
-                doc = check.description
-            else:
-                name = check.__name__
-                doc = check.__doc__.strip()
-            self.add_line(f".. py:pandera_check:: {name}", source_name)
+
+class PanderaSchemaFileDocumenter(PanderaSchemaDocumenter):
+    """
+    Documents a schema from its pandera YAML or JSON serialization, in the
+    current module, without importing pandas nor pandera
+    """
+
+    objtype = "pandera_schema_file"
+    directivetype = "pandera_schema"
+
+    @classmethod
+    def can_document_member(
+        cls, member: Any, membername: str, isattr: bool, parent: Any
+    ) -> bool:
+        return False
+
+    def generate(  # pylint: disable=unused-argument
+        self,
+        more_content: Optional[StringList] = None,
+        real_modname: Optional[str] = None,
+        check_module: bool = False,
+        all_members: bool = False,
+    ) -> None:
+        """Document the schema serialized in the file given relatively to
+        the current document, or to the source directory if absolute.
+
+        """
+        with profile_phase(self, RENDER):
+            if not self.import_object():
+                return
+
+            source_name = self.get_sourcename()
             self.add_line("", source_name)
-            self.add_line(f"   {doc}", source_name)
+            self.add_directive_header("")
+            self.add_line("", source_name)
+            self.indent += self.content_indent
+            self.add_content(more_content)
+
+    def import_object(self, raiseerror: bool = False) -> bool:
+        """Read the schema serialized in the file, in the current module."""
+        with profile_phase(self, IMPORT):
+            _, path = self.env.relfn2path(self.name, self.env.docname)
+            self.directive.record_dependencies.add(path)
+            modname = self.env.ref_context.get("py:module")
+            try:
+                self.object = get_schema_file_object(modname, Path(path))
+            except (OSError, ValueError, ImportError) as exc:
+                logger.warning(
+                    "[sphinx-pandera] cannot read schema file %s: %s",
+                    self.name,
+                    exc,
+                    type="autodoc",
+                )
+                return False
+
+            self.modname = self.real_modname = self.object.modname
+            self.objpath = [self.object.qualname]
+            self.fullname = ".".join(
+                filter(None, [self.modname, *self.objpath])
+            )
+            return True
+
+    def add_directive_header(self, sig: str) -> None:
+        """Add the directive header, in the current module if any."""
+        source_name = self.get_sourcename()
+        self.add_line(
+            f".. py:{self.directivetype}:: {self.object.qualname}{sig}",
+            source_name,
+        )
+        if self.options.no_index:
+            self.add_line("   :no-index:", source_name)
+        if self.modname:
+            self.add_line(f"   :module: {self.modname}", source_name)
+
+    def get_sourcename(self) -> str:
+        return f"{self.object.source}:docstring of {self.fullname}"
+
+    def get_field_slices(self) -> List[FieldSlice]:
+        """Serialized schemas are never split, as their pages are generated
+        before the current module of their directive is known.
+
+        """
+        return []
+
+
+class PanderaFieldsDocumenter(PanderaSchemaDocumenter):
+    """
+    Documents a slice of the fields of a model or a schema, on the pages
+    generated for split models and schemas
+    """
+
+    objtype = "pandera_fields"
+
+    option_spec = {
+        "start": nonnegative_int,
+        "stop": nonnegative_int,
+        "fields-table": bool_option,
+        "lazy-fields": bool_option,
+        "no-index": bool_option,
+    }
+
+    @classmethod
+    def can_document_member(
+        cls, member: Any, membername: str, isattr: bool, parent: Any
+    ) -> bool:
+        return False
+
+    @property
+    def field_slice(self) -> FieldSlice:
+        """The slice of fields documented."""
+        start = self.options.start or 0
+        stop = self.options.stop
+        if stop is None:
+            stop = len(self.schema_info.fields)
+        return start, stop
+
+    def record_fingerprint(self) -> None:
+        """Record the fingerprint of the documented fields only, so that the
+        page is read again only once they changed.
+
+        """
+        start, stop = self.field_slice
+        value = get_schema_cache(self.env).fingerprint_fields(
+            self.object, start, stop, self.location
+        )
+        objpath = f"{'.'.join(self.objpath)}[{start}:{stop}]"
+        record_fingerprint(self.env, self.object, self.modname, objpath, value)
+
+    def generate(  # pylint: disable=unused-argument
+        self,
+        more_content: Optional[StringList] = None,
+        real_modname: Optional[str] = None,
+        check_module: bool = False,
+        all_members: bool = False,
+    ) -> None:
+        """Document the fields in the module of the model or schema, as
+        they would be documented in it.
+
+        The module is not recorded as a dependency of the page: the page is
+        read again once the fingerprint of its fields changed, instead of
+        whenever the module changed.
+
+        """
+        if not self.parse_name():
+            return
+
+        obj = None
+        if self.config.sphinx_pandera_static:
+            obj = get_static_object(self.modname, ".".join(self.objpath))
+        if obj is not None:
+            self.object = obj
+            self.record_fingerprint()
+        elif not self.import_object():
+            return
+
+        source_name = self.get_sourcename()
+        self.add_line(f".. py:currentmodule:: {self.modname}", source_name)
+        self.add_line("", source_name)
+        start, stop = self.field_slice
+        fields = self.schema_info.fields[start:stop]
+        if use_compact_fields(self):
+            key = f"{'.'.join(self.location)}.{start}-{stop}"
+            add_compact_fields(self, fields, key, ".".join(self.objpath))
+            return
+        if use_field_nodes(self):
+            key = f"{'.'.join(self.location)}.{start}-{stop}"
+            add_field_nodes(self, fields, key, ".".join(self.objpath))
+            return
+        for field in fields:
+            self.add_field(field, source_name)
 
 
 #########
@@ -222,7 +752,9 @@ class PanderaSchemaDocumenter(DataDocumenter):
 #########
 
 
-class PanderaModelDocumenter(ClassDocumenter):
+class PanderaModelDocumenter(
+    ProfiledDocumenterMixin, StaticDocumenterMixin, ClassDocumenter
+):
     objtype = "pandera_model"
 
     directivetype = "pandera_model"
@@ -230,21 +762,33 @@ class PanderaModelDocumenter(ClassDocumenter):
     priority = 10 + ClassDocumenter.priority
 
     option_spec = dict(ClassDocumenter.option_spec)
+    option_spec["fields-table"] = bool_option
+    option_spec["lazy-fields"] = bool_option
+    option_spec["reference-inherited"] = bool_option
 
     def import_object(self, raiseerror: bool = False) -> bool:
         ret = super().import_object(raiseerror)
-        # HACK: don't remove this call, it caches the imports
-        # so that the field documenter can work properly downstream
-        # there is some type handling that intercepts things
-        # in a weird way
+        # HACK: don't remove this call, it caches the model description
+        # so that the member documenters can work properly downstream
+        # without converting the model again
         if self.object:
-            self.object.to_schema()
+            self.record_fingerprint()
         return ret
 
+    def record_fingerprint(self) -> None:
+        """Record the model fingerprint to detect changes on later builds."""
+        value = get_schema_cache(self.env).fingerprint(self.object)
+        record_fingerprint(
+            self.env, self.object, self.modname, ".".join(self.objpath), value
+        )
+
     @classmethod
     def can_document_member(
         cls, member: Any, membername: str, isattr: bool, parent: Any
     ) -> bool:
+        pa = get_pandera()
+        if pa is None:
+            return False
         try:
             is_val = super().can_document_member(
                 member, membername, isattr, parent
@@ -262,19 +806,216 @@ class PanderaModelDocumenter(ClassDocumenter):
 
         super().document_members(*args, **kwargs)
 
+    def filter_members(
+        self, members: List[ObjectMember], want_all: bool
+    ) -> List[Tuple[str, Any, bool]]:
+        """Leave fields out when they are rendered as a table or on pages of
+        their own, and inherited members when they are referenced.
+
+        """
+        filtered = super().filter_members(members, want_all)
+        if use_inherited_references(self):
+            inherited = self.get_inherited_members()
+            filtered = [
+                member for member in filtered if member[0] not in inherited
+            ]
+        if not self.summarizes_fields():
+            return filtered
+        kinds = get_schema_cache(self.env).member_kinds(self.object)
+        return [
+            member
+            for member in filtered
+            if kinds.get(member[0]) not in {FIELD, INDEX}
+        ]
+
+    def add_content(
+        self,
+        more_content: Optional[StringList],
+        **kwargs,
+    ) -> None:
+        """Add the table of fields after the docstring, if enabled."""
+        super().add_content(more_content, **kwargs)
+        self.record_schema()
+        self.add_fields_summary()
+        self.add_inherited_references()
+
+    def record_schema(self) -> None:
+        """Record the fields of the model in the data dictionary."""
+        info = get_schema_cache(self.env).info(self.object)
+        record_schema(self.env, self.fullname, info)
+
+    def get_field_slices(self) -> List[FieldSlice]:
+        """Get the slices of fields documented on pages of their own, if the
+        model is split.
+
+        """
+        fields = get_schema_cache(self.env).info(self.object).fields
+        return get_page_slices(self.env, self.fullname, len(fields))
+
+    def summarizes_fields(self) -> bool:
+        """Tell whether fields are rendered all at once or on pages of their
+        own, rather than as members.
+
+        """
+        return use_compact_fields(self) or bool(self.get_field_slices())
+
+    def add_fields_summary(self) -> None:
+        """Add the fields rendered all at once, or the table of contents of
+        the pages of fields if the model is split.
+
+        """
+        slices = self.get_field_slices()
+        if slices:
+            add_field_pages(self, self.fullname, len(slices))
+        elif use_compact_fields(self):
+            fields = get_schema_cache(self.env).info(self.object).fields
+            if use_inherited_references(self):
+                inherited = self.get_inherited_members()
+                fields = tuple(
+                    field
+                    for field in fields
+                    if str(field.name) not in inherited
+                )
+            add_compact_fields(self, fields, self.fullname)
+
+    def get_inherited_members(self) -> Dict[str, str]:
+        """Get the full name of the base model defining each member the
+        model inherits, by name.
+
+        """
+        return get_schema_cache(self.env).inherited_members(self.object)
+
+    def add_inherited_references(self) -> None:
+        """Add references to the members the model inherits, grouped by the
+        base model documenting them, if enabled.
+
+        """
+        if not use_inherited_references(self):
+            return
+        kinds = get_schema_cache(self.env).member_kinds(self.object)
+        bases: Dict[str, List[str]] = {}
+        for name, base in self.get_inherited_members().items():
+            bases.setdefault(base, []).append(name)
+
+        source_name = self.get_sourcename()
+        for base, names in bases.items():
+            title = base.rsplit(".", 1)[-1]
+            self.add_line(
+                f":Inherited: from :pandera:model:`{title} <{base}>`",
+                source_name,
+            )
+            self.add_line("", source_name)
+            for name in names:
+                role = INHERITED_ROLES.get(kinds.get(name, ""), "obj")
+                self.add_line(
+                    f"   - :pandera:{role}:`{name} <{base}.{name}>`",
+                    source_name,
+                )
+            self.add_line("", source_name)
+
     def format_signature(self, **kwargs) -> str:
         """
         hide class arguments
         """
         return ""
 
+    def add_static_content(self, more_content: Optional[StringList]) -> None:
+        """Add the docstring and the members of the model read from source,
+        in source order.
+
+        """
+        add_docstring(self, self.object.doc)
+        if more_content:
+            for line, src in zip(more_content.data, more_content.items):
+                self.add_line(line, src[0], src[1])
+
+        summarized = self.summarizes_fields()
+        self.record_schema()
+        self.add_fields_summary()
+
+        for member in self.object.members:
+            if member.kind == CONFIG:
+                self.add_static_config(member)
+            elif member.kind in {FIELD, INDEX}:
+                if not summarized:
+                    self.add_static_field(member)
+            else:
+                self.add_static_check(member)
+
+    def add_static_config(self, member: StaticMember) -> None:
+        """Add the model config and its documented options."""
+        documenter = self.get_member_documenter(
+            "pandera_model_config", member.name
+        )
+        source_name = documenter.get_sourcename()
+        documenter.add_line("", source_name)
+        Documenter.add_directive_header(documenter, "")
+        documenter.add_line("", source_name)
+        documenter.indent += documenter.content_indent
+        add_docstring(documenter, member.doc)
+
+        for name, value in member.values:
+            option = StaticDocumenterMixin.get_member_documenter(
+                documenter, "attribute", name  # type: ignore[arg-type]
+            )
+            option.add_line("", source_name)
+            Documenter.add_directive_header(option, "")
+            option.add_line(
+                f"   :value: {object_description(value)}", source_name
+            )
+            option.add_line("", source_name)
+            option.indent += option.content_indent
+            add_attribute_docs(option)
+
+    def add_static_field(self, member: StaticMember) -> None:
+        """Add a field with the type annotated in source."""
+        documenter = self.get_member_documenter("pandera_field", member.name)
+        source_name = documenter.get_sourcename()
+        documenter.add_line("", source_name)
+        Documenter.add_directive_header(documenter, "")
+        documenter.add_line(f"   :type: {member.annotation}", source_name)
+        documenter.add_title()
+        documenter.add_line("", source_name)
+        documenter.indent += documenter.content_indent
+        add_attribute_docs(documenter)
+        documenter.add_description()
+        documenter.add_constraints()
+        documenter.add_checks()
+
+    def add_static_check(self, member: StaticMember) -> None:
+        """Add a check with the signature read from source."""
+        documenter = self.get_member_documenter("pandera_check", member.name)
+        source_name = documenter.get_sourcename()
+
+        args, retann = member.signature, member.annotation
+        result = self.env.events.emit_firstresult(
+            "autodoc-process-signature",
+            documenter.objtype,
+            documenter.fullname,
+            documenter.object,
+            documenter.options,
+            args,
+            retann,
+        )
+        if result:
+            args, retann = result
+        sig = f"{args} -> {retann}" if retann else args
+
+        documenter.add_line("", source_name)
+        Documenter.add_directive_header(documenter, sig or "")
+        documenter.add_line("   :classmethod:", source_name)
+        documenter.add_line("", source_name)
+        documenter.indent += documenter.content_indent
+        add_docstring(documenter, member.doc)
+        documenter.add_columns_list()
+
 
 #########
 # Model Config #
 #########
 
 
-class PanderaModelConfigDocumenter(ClassDocumenter):
+class PanderaModelConfigDocumenter(ProfiledDocumenterMixin, ClassDocumenter):
     objtype = "pandera_model_config"
 
     directivetype = "pandera_model_config"
@@ -291,15 +1032,14 @@ class PanderaModelConfigDocumenter(ClassDocumenter):
             is_val = super().can_document_member(
                 member, membername, isattr, parent
             )
-            is_model_config = ("Config" in parent.object.__dict__) and (
-                getattr(member, "__name__", "") == "Config"
-            )
-
-            return is_val and is_model_config
-
         except TypeError:
             return False
 
+        member_kinds = get_schema_cache(parent.env).member_kinds(parent.object)
+        is_model_config = member_kinds.get(membername) == CONFIG
+
+        return is_val and is_model_config
+
     def get_object_members(
         self, want_all: bool
     ) -> tuple[bool, List[ObjectMember]]:
@@ -337,7 +1077,7 @@ class PanderaModelConfigDocumenter(ClassDocumenter):
 
 
 # pylint: disable=abstract-method
-class PanderaFieldDocumenter(AttributeDocumenter):
+class PanderaFieldDocumenter(ProfiledDocumenterMixin, AttributeDocumenter):
     """Represents specialized Documenter subclass for pandera fields."""
 
     # pylint: disable=too-many-ancestors
@@ -351,12 +1091,6 @@ class PanderaFieldDocumenter(AttributeDocumenter):
 
     pyautodoc_pass_to_directive = ("field-signature-prefix",)
 
-    def __init__(
-        self, directive: DocumenterBridge, name: str, indent: str = ""
-    ) -> None:
-        super().__init__(directive, name, indent)
-        self._pandera_schema = None
-
     @classmethod
     def can_document_member(
         cls, member: Any, membername: str, isattr: bool, parent: Any
@@ -366,26 +1100,36 @@ class PanderaFieldDocumenter(AttributeDocumenter):
         is_valid = super().can_document_member(
             member, membername, isattr, parent
         )
-        try:
-            # pandera messes up the class hierarchy so we can't use issubclass
-            if "DataFrameModel" not in str(inspect.getmro(parent.object)[1]):
-                return False
-        except AttributeError:
-            return False
-        # pylint: disable-next=protected-access
-        is_field = membername in parent.object._get_model_attrs()
+        member_kinds = get_schema_cache(parent.env).member_kinds(parent.object)
+        is_field = member_kinds.get(membername) in {FIELD, INDEX}
 
         return is_valid and is_field
 
     @property
-    def pandera_schema(self) -> pa.DataFrameSchema:
-        """Provide the pandera field name which refers to the member name of
-        the parent pandera model.
+    def pandera_schema(self) -> "DataFrameSchema":
+        """Provide the pandera schema of the parent pandera model, shared
+        with the other documenters through the build-wide cache.
+
+        """
+        return get_schema_cache(self.env).schema(self.parent)
+
+    @property
+    def field_info(self) -> FieldInfo:
+        """Provide the record of the field from the records of the parent
+        pandera model.
+
+        """
+        return get_schema_cache(self.env).fields(self.parent)[self.object]
+
+    def update_annotations(self, parent: Any) -> None:
+        """Leave the annotations of models untouched.
+
+        Autodoc copies the annotations of the bases of the parent to the
+        parent, as strings: pandera evaluates them in the module of the
+        parent when converting its subclasses, and fails on annotations of
+        `DataFrameModel` such as `Config`.
 
         """
-        if self._pandera_schema is None:
-            self._pandera_schema = self.parent.to_schema()
-        return self._pandera_schema  # type: ignore
 
     @property
     def pandera_field_name(self) -> str:
@@ -402,23 +1146,28 @@ class PanderaFieldDocumenter(AttributeDocumenter):
         super().add_directive_header(sig)
 
         self.add_title()
+        if use_field_nodes(self):
+            self.add_record()
+
+    def add_record(self):
+        """Add the record the field directive builds the content from."""
+        records = self.env.temp_data.setdefault(FIELD_NODES, {})
+        records[self.fullname] = self.field_info
+        self.add_line(f"   :record: {self.fullname}", self.get_sourcename())
 
     @property
-    def pandera_field(self) -> pa.Field:  # type: ignore
+    def pandera_field(self) -> "Field":  # type: ignore
         """
-        Get pandera field
+        Get pandera field, a column or an index level of the schema of the
+        parent pandera model
         """
-        try:
-            return self.pandera_schema.columns[self.object]
-        except KeyError as exc:
-            idx = self.pandera_schema.index
-            if isinstance(idx, pa.Index) and (idx.name == self.object):
-                return idx
-            if isinstance(idx, pa.MultiIndex):
-                return self.pandera_schema.index.named_indexes[self.object]
+        components = get_schema_cache(self.env).components(self.parent)
+        field = components.get(self.object)
+        if field is None:
             raise NotImplementedError(
                 f"Unsupported field type for field {self.object}"
-            ) from exc
+            )
+        return field
 
     def add_content(
         self,
@@ -428,23 +1177,23 @@ class PanderaFieldDocumenter(AttributeDocumenter):
         """Delegate additional content creation."""
 
         super().add_content(more_content, **kwargs)
+        if use_field_nodes(self):
+            return
         self.add_description()
         self.add_constraints()
         self.add_checks()
 
     def add_title(self):
         """Add title option for field directive"""
-        if not self.pandera_field.title:
+        title = self.field_info.title
+        if not title:
             return
         sourcename = self.get_sourcename()
-        self.add_line(
-            f"   :title: {self.pandera_field.title}",
-            sourcename,
-        )
+        self.add_line(f"   :title: {title}", sourcename)
 
     def add_description(self):
         """Adds description from schema if present."""
-        description = self.pandera_field.description
+        description = self.field_info.description
 
         if not description:
             return
@@ -460,36 +1209,17 @@ class PanderaFieldDocumenter(AttributeDocumenter):
         """
         Adds section showing all defined constraints.
         """
-        constraints = {
-            "nullable": self.pandera_field.nullable,
-            "unique": self.pandera_field.unique,
-            "coerce": self.pandera_field.coerce,
-        }
-
-        try:
-            constraints["required"] = self.pandera_field.required
-        except AttributeError:  # Field is an Index or MultiIndex
-            constraints["required"] = "True (Index)"
-
         source_name = self.get_sourcename()
         self.add_line(":Constraints:", source_name)
-        for key, value in constraints.items():
+        for key, value in self.field_info.constraints:
             line = f"   - **{key}** = {value}"
             self.add_line(line, source_name)
 
-    def get_check_func_ref(self, check):
-        # 1. find func obj from name
-        # 2. build ref
-        obj = getattr(self.parent, check.name)
-        module = inspect.getmodule(obj)
-
-        return f"{module.__name__}.{self.parent}.{check.name}"
-
     def add_checks(self):
         """
         Adds section showing all checks
         """
-        checks = self.pandera_field.checks
+        checks = self.field_info.checks
 
         if not checks:
             return
@@ -497,19 +1227,13 @@ class PanderaFieldDocumenter(AttributeDocumenter):
         source_name = self.get_sourcename()
         self.add_line(":Validated by:", source_name)
         for check in checks:
-            # HACK: standard checks implement nice error message
-            if check.error:
-                line = f"   - **{check.error}**"
-            else:
-                ref = self.get_check_func_ref(check)
-                line = f"   - :py:obj:`{check.name} <{ref}>`"
-            self.add_line(line, source_name)
+            self.add_line(f"   - {format_check(check)}", source_name)
 
 
 #########
 # Check #
 #########
-class PanderaCheckDocumenter(MethodDocumenter):
+class PanderaCheckDocumenter(ProfiledDocumenterMixin, MethodDocumenter):
     """
     Documents Pandera checks on columns/dataframe
     """
@@ -531,35 +1255,29 @@ class PanderaCheckDocumenter(MethodDocumenter):
         is_valid = super().can_document_member(
             member, membername, isattr, parent
         )
-        try:
-            if not issubclass(parent.object, pa.DataFrameModel):
-                return False
-        except TypeError:
-            return False
-        # pylint: disable-next=protected-access
-        model_attrs = parent.object._get_model_attrs()
-
-        is_check = membername in model_attrs and isinstance(
-            model_attrs[membername], classmethod
-        )
+        member_kinds = get_schema_cache(parent.env).member_kinds(parent.object)
+        is_check = member_kinds.get(membername) in {CHECK, DATAFRAME_CHECK}
 
         return is_valid and is_check
 
     def get_checked_columns(self):
-        schema: pa.DataFrameSchema = self.parent.to_schema()
-        columns = []
-        for _, column in schema.columns.items():
-            for check in column.checks:
-                # HACK: fragile to multiple classes having the same method
-                if check.name == self.name.rsplit(".", 1)[-1]:
-                    columns.append(column)
+        """
+        Get the columns and index levels validated by the check
+        """
+        check_index = get_schema_cache(self.env).check_index(self.parent)
+        check_name = self.name.rsplit(".", 1)[-1]
+        if check_name not in check_index:
+            return []
 
-        return columns
+        return check_index[check_name].fields
 
     def get_column_func_ref(self, column):
-        module = inspect.getmodule(self.parent)
+        if isinstance(self.parent, StaticObject):
+            modname = self.parent.modname
+        else:
+            modname = inspect.getmodule(self.parent).__name__
 
-        return f"{module.__name__}.{self.parent}.{column.name}"
+        return f"{modname}.{self.parent}.{column}"
 
     def add_content(
         self, more_content: Optional[StringList], **kwargs
@@ -586,7 +1304,71 @@ class PanderaCheckDocumenter(MethodDocumenter):
 
         for column in checked_columns:
             ref = self.get_column_func_ref(column)
-            line = f"   - :py:obj:`{column.name} <{ref}>`"
+            line = f"   - :pandera:field:`{column} <{ref}>`"
             self.add_line(line, source_name)
 
         self.add_line("", source_name)
+
+
+##########
+# Module #
+##########
+
+
+class PanderaModuleDocumenter(ModuleDocumenter):
+    """
+    Documents all the pandera models and schemas of a module or a package
+    """
+
+    objtype = "pandera_module"
+
+    option_spec = dict(ModuleDocumenter.option_spec)
+    option_spec["fields-table"] = bool_option
+    option_spec["lazy-fields"] = bool_option
+    option_spec["reference-inherited"] = bool_option
+
+    @classmethod
+    def can_document_member(
+        cls, member: Any, membername: str, isattr: bool, parent: Any
+    ) -> bool:
+        return False
+
+    def generate(  # pylint: disable=unused-argument
+        self,
+        more_content: Optional[StringList] = None,
+        real_modname: Optional[str] = None,
+        check_module: bool = False,
+        all_members: bool = False,
+    ) -> None:
+        """Document every model and schema found, each module being
+        imported once, with the documenter of each object.
+
+        """
+        if not self.parse_name():
+            return
+
+        found = None
+        if self.config.sphinx_pandera_static:
+            found = discover_static(self.modname)
+        if found is None:
+            if not self.import_object():
+                return
+            found = discover(self.modname)
+        if not found:
+            logger.warning(
+                "[sphinx-pandera] no pandera model or schema found in %s",
+                self.modname,
+                type="autodoc",
+            )
+            return
+
+        options = self.directive.genopt
+        for modname, name, objtype in found:
+            # HACK: member documenters alter the options they share, such as
+            # the field documenter hiding values, each object gets its own
+            self.directive.genopt = Options(options)
+            documenter = self.documenters[objtype](
+                self.directive, f"{modname}::{name}"
+            )
+            documenter.generate(all_members=True)
+        self.directive.genopt = options
@@ -0,0 +1,133 @@
+"""Domain indexing pandera models, schemas, fields and checks by full name.
+
+Objects are still described by the pandera directives of the Python domain,
+which also record them here. References made with the roles of this domain
+are resolved by an exact lookup of their target, without the fuzzy search of
+the Python domain.
+
+"""
+
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from docutils.nodes import Element
+from sphinx.addnodes import pending_xref
+from sphinx.builders import Builder
+from sphinx.domains import Domain, ObjType
+from sphinx.environment import BuildEnvironment
+from sphinx.roles import XRefRole
+from sphinx.util.nodes import make_refnode
+
+
+class ObjectEntry(NamedTuple):
+    """Where a pandera object is documented."""
+
+    docname: str
+    node_id: str
+    objtype: str
+
+
+class PanderaDomain(Domain):
+    """Pandera models, schemas and their members, indexed by full name."""
+
+    name = "pandera"
+    label = "Pandera"
+    object_types = {
+        "model": ObjType("model", "model", "obj"),
+        "schema": ObjType("schema", "schema", "obj"),
+        "model_config": ObjType("model config", "obj"),
+        "field": ObjType("field", "field", "obj"),
+        "check": ObjType("check", "check", "obj"),
+    }
+    roles = {
+        "model": XRefRole(),
+        "schema": XRefRole(),
+        "field": XRefRole(),
+        "check": XRefRole(),
+        "obj": XRefRole(),
+    }
+    initial_data: Dict[str, Any] = {"objects": {}}
+
+    @property
+    def objects(self) -> Dict[str, ObjectEntry]:
+        """Documented objects, by full name."""
+        return self.data.setdefault("objects", {})
+
+    def note_object(self, name: str, objtype: str, node_id: str) -> None:
+        """Record an object documented in the current document, duplicates
+        being reported by the Python domain describing it.
+
+        """
+        self.objects[name] = ObjectEntry(self.env.docname, node_id, objtype)
+
+    def clear_doc(self, docname: str) -> None:
+        for name, entry in list(self.objects.items()):
+            if entry.docname == docname:
+                del self.objects[name]
+
+    def merge_domaindata(
+        self, docnames: Set[str], otherdata: Dict[str, Any]
+    ) -> None:
+        for name, entry in otherdata["objects"].items():
+            if entry.docname in docnames:
+                self.objects[name] = entry
+
+    def resolve_xref(  # pylint: disable=too-many-arguments
+        self,
+        env: BuildEnvironment,
+        fromdocname: str,
+        builder: Builder,
+        typ: str,
+        target: str,
+        node: pending_xref,
+        contnode: Element,
+    ) -> Optional[Element]:
+        entry = self.objects.get(target)
+        if entry is None or typ not in ("obj", entry.objtype):
+            return None
+        return make_refnode(
+            builder,
+            fromdocname,
+            entry.docname,
+            entry.node_id,
+            contnode,
+            target,
+        )
+
+    def resolve_any_xref(  # pylint: disable=too-many-arguments
+        self,
+        env: BuildEnvironment,
+        fromdocname: str,
+        builder: Builder,
+        target: str,
+        node: pending_xref,
+        contnode: Element,
+    ) -> List[Tuple[str, Element]]:
+        entry = self.objects.get(target)
+        if entry is None:
+            return []
+        refnode = make_refnode(
+            builder,
+            fromdocname,
+            entry.docname,
+            entry.node_id,
+            contnode,
+            target,
+        )
+        return [
+            (f"{self.name}:{self.role_for_objtype(entry.objtype)}", refnode)
+        ]
+
+    def get_objects(self) -> Iterator[Tuple[str, str, str, str, str, int]]:
+        for name, entry in self.objects.items():
+            yield name, name, entry.objtype, entry.docname, entry.node_id, 1
+
+    def get_full_qualified_name(self, node: Element) -> Optional[str]:
+        return node.get("reftarget")
+
+
+def note_pandera_object(
+    env: BuildEnvironment, name: str, objtype: str, node_id: str
+) -> None:
+    """Record an object described by a directive of the Python domain."""
+    domain = env.get_domain(PanderaDomain.name)
+    domain.note_object(name, objtype, node_id)  # type: ignore[attr-defined]
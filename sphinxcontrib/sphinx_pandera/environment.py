@@ -0,0 +1,195 @@
+"""Pandera metadata stored on the Sphinx build environment."""
+
+import os
+import re
+import sys
+from typing import Any, Dict, List, NamedTuple, Set
+
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx.ext.autodoc.importer import import_object
+from sphinx.util import logging
+
+from sphinxcontrib.sphinx_pandera.cache import ObjectPath, get_schema_cache
+from sphinxcontrib.sphinx_pandera.static import StaticObject, get_static_object
+from sphinxcontrib.sphinx_pandera.store import get_source_modules
+
+logger = logging.getLogger(__name__)
+
+FINGERPRINTS = "sphinx_pandera_fingerprints"
+
+
+class Fingerprint(NamedTuple):
+    """The fingerprint of a documented pandera object, with the modification
+    time of each source file it was described from.
+
+    """
+
+    value: str
+    sources: Dict[str, int]
+
+
+# Slice of the fields of an object, documented on a page of its own
+SLICE_RE = re.compile(r"^(.+)\[(\d+):(\d+)\]$")
+
+
+def get_fingerprints(
+    env: BuildEnvironment,
+) -> Dict[str, Dict[ObjectPath, Fingerprint]]:
+    """Get the fingerprints of the pandera objects documented in each
+    document.
+
+    """
+    if not hasattr(env, FINGERPRINTS):
+        setattr(env, FINGERPRINTS, {})
+    return getattr(env, FINGERPRINTS)
+
+
+def record_fingerprint(
+    env: BuildEnvironment, obj: Any, modname: str, objpath: str, value: str
+) -> None:
+    """Record the fingerprint of a pandera object documented in the current
+    document, with the modification time of its sources.
+
+    """
+    fingerprints = get_fingerprints(env).setdefault(env.docname, {})
+    fingerprints[modname, objpath] = Fingerprint(
+        value, get_source_stamps(obj, modname)
+    )
+
+
+def get_source_stamps(obj: Any, modname: str) -> Dict[str, int]:
+    """Get the modification time of each source file a pandera object is
+    described from: its module, the modules of its bases and the project
+    modules they import, or the file it is read from.
+
+    Returns no source when a file cannot be found, in which case the object
+    is fingerprinted again by every incremental build.
+
+    """
+    if isinstance(obj, StaticObject):
+        filenames = [str(obj.source)]
+    else:
+        filenames = [
+            getattr(sys.modules.get(name), "__file__", None)
+            for name in get_source_modules(obj, modname)
+        ]
+
+    stamps = {}
+    for filename in filenames:
+        if filename is None:
+            return {}
+        try:
+            stamps[filename] = os.stat(filename).st_mtime_ns
+        except OSError:
+            return {}
+    return stamps
+
+
+def sources_changed(fingerprint: Fingerprint) -> bool:
+    """Tell whether a source of a fingerprinted object was modified since
+    the object was fingerprinted.
+
+    """
+    if not fingerprint.sources:
+        return True
+    for filename, mtime in fingerprint.sources.items():
+        try:
+            if os.stat(filename).st_mtime_ns != mtime:
+                return True
+        except OSError:
+            return True
+    return False
+
+
+def load_object(env: BuildEnvironment, modname: str, objpath: str) -> Any:
+    """Import a documented pandera object.
+
+    The object is read from source instead when static extraction is enabled
+    and succeeds.
+
+    """
+    obj = None
+    if env.config.sphinx_pandera_static:
+        obj = get_static_object(modname, objpath)
+    if obj is None:
+        obj = import_object(modname, objpath.split("."))[-1]
+    return obj
+
+
+def compute_fingerprint(env: BuildEnvironment, modname: str, objpath: str):
+    """Import a documented pandera object and compute its fingerprint.
+
+    Objects whose fields are split across pages are fingerprinted by slice
+    of fields, named like `Model[0:500]`.
+
+    """
+    match = SLICE_RE.match(objpath)
+    if match is None:
+        obj = load_object(env, modname, objpath)
+        return get_schema_cache(env).fingerprint(obj, (modname, objpath))
+    objpath, start, stop = match.group(1), *map(int, match.group(2, 3))
+    obj = load_object(env, modname, objpath)
+    return get_schema_cache(env).fingerprint_fields(
+        obj, start, stop, (modname, objpath)
+    )
+
+
+def get_outdated_docs(  # pylint: disable=unused-argument
+    app: Sphinx,
+    env: BuildEnvironment,
+    added: Set[str],
+    changed: Set[str],
+    removed: Set[str],
+) -> List[str]:
+    """Find the documents describing pandera objects which changed since
+    they were read, whatever the module the change comes from.
+
+    Only the objects whose sources were modified are imported and
+    fingerprinted again, changes to installed packages are not detected.
+
+    """
+    outdated = []
+    for docname, fingerprints in get_fingerprints(env).items():
+        if docname in changed or docname in removed:
+            continue
+
+        for (modname, objpath), fingerprint in fingerprints.items():
+            if not sources_changed(fingerprint):
+                continue
+            try:
+                current = compute_fingerprint(env, modname, objpath)
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.debug(
+                    "[sphinx-pandera] cannot fingerprint %s.%s: %s",
+                    modname,
+                    objpath,
+                    exc,
+                )
+                current = None
+            if current != fingerprint.value:
+                outdated.append(docname)
+                break
+
+    return outdated
+
+
+def purge_fingerprints(  # pylint: disable=unused-argument
+    app: Sphinx, env: BuildEnvironment, docname: str
+) -> None:
+    """Forget the fingerprints recorded for a document about to be read."""
+    get_fingerprints(env).pop(docname, None)
+
+
+def merge_fingerprints(  # pylint: disable=unused-argument
+    app: Sphinx,
+    env: BuildEnvironment,
+    docnames: Set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Merge the fingerprints recorded by a parallel reader."""
+    fingerprints = get_fingerprints(env)
+    other_fingerprints = get_fingerprints(other)
+    for docname in docnames:
+        if docname in other_fingerprints:
+            fingerprints[docname] = other_fingerprints[docname]
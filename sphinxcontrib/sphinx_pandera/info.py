@@ -0,0 +1,137 @@
+"""Compact records of what the documenters render of a schema.
+
+Descriptions are the format stored and exchanged between processes. The
+records are built from a description once per documented object and
+shared by all the documenters rendering it: the facts each field renders,
+such as its constraints or the targets of its custom checks, are computed
+once instead of once per documenter.
+
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+# Constraints rendered for every field, in order
+CONSTRAINTS = ("nullable", "unique", "coerce")
+
+# Requirement rendered for index levels, which are always required
+INDEX_REQUIRED = "True (Index)"
+
+
+@dataclass(frozen=True, slots=True)
+class CheckInfo:
+    """A check of a field or of a whole dataframe."""
+
+    name: str
+    # message of builtin checks, which custom checks lack
+    error: Optional[str]
+    description: Optional[str]
+    # target of references to custom checks
+    ref: Optional[str]
+
+    @property
+    def is_custom(self) -> bool:
+        """Tell whether the check is a custom check, documented on its own."""
+        # HACK: standard checks implement nice error message
+        return not self.error
+
+
+def format_check(check: CheckInfo) -> str:
+    """Format a check of a field: builtin checks by their message, custom
+    checks as a reference to their documentation.
+
+    """
+    if not check.is_custom:
+        return f"**{check.error}**"
+    return f":pandera:check:`{check.name} <{check.ref}>`"
+
+
+@dataclass(frozen=True, slots=True)
+class FieldInfo:
+    """A column or an index level."""
+
+    name: Any
+    dtype: str
+    is_index: bool
+    title: Optional[str]
+    description: Optional[str]
+    constraints: Tuple[Tuple[str, Any], ...]
+    checks: Tuple[CheckInfo, ...]
+
+    @property
+    def type(self) -> str:
+        """The type of the field, as rendered for schemas."""
+        return f"Index[{self.dtype}]" if self.is_index else self.dtype
+
+
+@dataclass(frozen=True, slots=True)
+class SchemaInfo:
+    """A model or a schema: its configuration, fields and checks."""
+
+    name: Optional[str]
+    title: Optional[str]
+    description: Optional[str]
+    config: Tuple[Tuple[str, Any], ...]
+    fields: Tuple[FieldInfo, ...]
+    checks: Tuple[CheckInfo, ...]
+
+
+def build_check_info(
+    check: Dict[str, Any], refs: Optional[Dict[str, str]], modname: str
+) -> CheckInfo:
+    """Build the record of a described check.
+
+    Custom checks of models are referenced where the model defines them,
+    the ones of schemas in the module of the schema, if any.
+
+    """
+    name = check["name"]
+    ref = None
+    if not check["error"]:
+        if refs is not None:
+            ref = refs.get(name)
+        else:
+            ref = f"{modname}.{name}" if modname else name
+    return CheckInfo(name, check["error"], check["description"], ref)
+
+
+def build_field_info(
+    field: Dict[str, Any], refs: Optional[Dict[str, str]], modname: str
+) -> FieldInfo:
+    """Build the record of a described field."""
+    constraints = [(key, field[key]) for key in CONSTRAINTS]
+    required = INDEX_REQUIRED if field["is_index"] else field["required"]
+    constraints.append(("required", required))
+    return FieldInfo(
+        field["name"],
+        field["dtype"],
+        field["is_index"],
+        field["title"],
+        field["description"],
+        tuple(constraints),
+        tuple(
+            build_check_info(check, refs, modname) for check in field["checks"]
+        ),
+    )
+
+
+def build_schema_info(description: Dict[str, Any], modname: str) -> SchemaInfo:
+    """Build the records of a described model or schema, defined in module
+    `modname`.
+
+    """
+    refs = description.get("check_refs")
+    return SchemaInfo(
+        description["name"],
+        description["title"],
+        description["description"],
+        tuple(description["config"].items()),
+        tuple(
+            build_field_info(field, refs, modname)
+            for field in description["fields"]
+        ),
+        tuple(
+            build_check_info(check, refs, modname)
+            for check in description["checks"]
+        ),
+    )
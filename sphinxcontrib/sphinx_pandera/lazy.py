@@ -0,0 +1,338 @@
+"""Fields whose details are loaded by the browser when they are expanded.
+
+Documents only hold the name, type and title of each field when they are
+read, and the records of the fields. HTML pages render these summaries: the
+details of the fields of each model or schema are written to a JSON file of
+the static directory once the build is finished, and fetched by a script
+when a field is expanded. As doctrees are shared by all builders, fields are
+described in full from their records when writing for other builders only.
+
+"""
+
+import json
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set
+
+from docutils import nodes
+from docutils.parsers.rst import Parser
+from sphinx import addnodes
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx.transforms.post_transforms import SphinxPostTransform
+from sphinx.util import logging
+from sphinx.util.docstrings import prepare_docstring
+from sphinx.util.docutils import new_document, sphinx_domains
+from sphinx.writers.html5 import HTML5Translator
+
+from sphinxcontrib.sphinx_pandera.info import (
+    CheckInfo,
+    FieldInfo,
+    format_check,
+)
+
+logger = logging.getLogger(__name__)
+
+ENV_ATTRIBUTE = "sphinx_pandera_lazy_fields"
+
+# Directory of the data files and of the script, in the static directory
+STATIC_DIR = "pandera"
+SCRIPT = "pandera_fields.js"
+
+
+class lazy_fields(nodes.container):  # pylint: disable=invalid-name
+    """Fields whose details are loaded when they are expanded, by HTML
+    builders, named after their data file.
+
+    The node holds the summaries of the fields: it is replaced by a plain
+    container before writing, holding the summaries or, for builders other
+    than HTML ones, the full descriptions of the fields.
+
+    """
+
+
+class lazy_field(nodes.container):  # pylint: disable=invalid-name
+    """The summary of a field whose details are loaded when it is expanded,
+    the target of references to the field.
+
+    """
+
+
+def visit_lazy_field(translator: HTML5Translator, node: lazy_field) -> None:
+    """Open an expandable field, naming its data file and its position."""
+    attributes = {
+        "data-fields": node["data"],
+        "data-field": str(node["index"]),
+    }
+    translator.body.append(
+        translator.starttag(
+            node, "details", CLASS="pandera-field", **attributes
+        )
+    )
+    translator.body.append("<summary>")
+
+
+def depart_lazy_field(translator: HTML5Translator, node: lazy_field) -> None:
+    """Close an expandable field, its details being added by the script."""
+    translator.body.append("</summary></details>\n")
+
+
+def get_data_name(key: str) -> str:
+    """Name the data file of fields, without characters unsafe in URLs."""
+    return re.sub(r"[^\w.-]", "_", key)
+
+
+def get_lazy_fields(
+    env: BuildEnvironment,
+) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    """Get the fields rendered lazily in each document, by data file."""
+    if not hasattr(env, ENV_ATTRIBUTE):
+        setattr(env, ENV_ATTRIBUTE, {})
+    return getattr(env, ENV_ATTRIBUTE)
+
+
+def record_lazy_fields(
+    env: BuildEnvironment, key: str, fields: Sequence[FieldInfo]
+) -> str:
+    """Record the details of fields rendered lazily in the current document,
+    and return the name of their data file.
+
+    """
+    name = get_data_name(key)
+    get_lazy_fields(env).setdefault(env.docname, {})[name] = [
+        {
+            "name": str(field.name),
+            "type": field.type,
+            "title": field.title,
+            "description": field.description,
+            "constraints": dict(field.constraints),
+            "checks": [
+                {"name": check.name, "error": check.error, "ref": check.ref}
+                for check in field.checks
+            ],
+        }
+        for field in fields
+    ]
+    return name
+
+
+def find_lazy_fields(env: BuildEnvironment, name: str) -> List[Dict[str, Any]]:
+    """Get the fields recorded for a data file, whatever the document."""
+    for data in get_lazy_fields(env).values():
+        if name in data:
+            return data[name]
+    return []
+
+
+def find_document_fields(
+    env: BuildEnvironment, name: str
+) -> List[Dict[str, Any]]:
+    """Get the fields recorded for a data file in the current document."""
+    return get_lazy_fields(env).get(env.docname, {}).get(name, [])
+
+
+def summarize_field(
+    name: str, index: int, field: Dict[str, Any]
+) -> lazy_field:
+    """Build the summary of a field: its name, type and title."""
+    summary = lazy_field(data=name, index=index)
+    summary += nodes.strong(text=field["name"])
+    summary += nodes.Text(f" : {field['type']}")
+    if field["title"]:
+        summary += nodes.emphasis(text=f", {field['title']}")
+    return summary
+
+
+def make_list_field(name: str, items: List[List[nodes.Node]]) -> nodes.field:
+    """Make a field holding a bullet list of paragraphs."""
+    bullet_list = nodes.bullet_list(bullet="-")
+    for children in items:
+        bullet_list += nodes.list_item("", nodes.paragraph("", "", *children))
+    return nodes.field(
+        "",
+        nodes.field_name(text=name),
+        nodes.field_body("", bullet_list),
+    )
+
+
+class LazyFieldsTransform(SphinxPostTransform):
+    """Keep the summaries of fields in HTML outputs, and describe the fields
+    in full, from their records, in other outputs.
+
+    """
+
+    # before references in the built descriptions are resolved
+    default_priority = 5
+
+    def run(self, **kwargs: Any) -> None:
+        is_html = self.app.builder.format == "html"
+        for node in list(self.document.findall(lazy_fields)):
+            container = nodes.container(classes=node["classes"])
+            if is_html:
+                container += node.children
+            else:
+                fields = find_lazy_fields(self.env, node["data"])
+                container += [
+                    self.describe_field(summary, field)
+                    for summary, field in zip(node.children, fields)
+                ]
+            node.replace_self(container)
+
+    def describe_field(
+        self, summary: nodes.Element, field: Dict[str, Any]
+    ) -> addnodes.desc:
+        """Describe a field in full, as the field directive does."""
+        prefix = self.config.sphinx_pandera_field_signature_prefix
+        signature = addnodes.desc_signature(
+            "", "", ids=summary["ids"], classes=["sig", "sig-object", "py"]
+        )
+        signature += addnodes.desc_annotation(
+            "",
+            "",
+            nodes.Text(prefix or "attribute"),
+            addnodes.desc_sig_space(),
+        )
+        signature += addnodes.desc_name(text=field["name"])
+        signature += addnodes.desc_annotation(
+            "",
+            "",
+            addnodes.desc_sig_punctuation("", ":"),
+            addnodes.desc_sig_space(),
+            nodes.Text(field["type"]),
+        )
+        if field["title"] is not None:
+            signature += addnodes.desc_annotation("", f", {field['title']}")
+
+        content = addnodes.desc_content()
+        if field["description"] is not None:
+            content += self.parse(
+                "\n".join(prepare_docstring(field["description"]))
+            )
+        field_list = nodes.field_list()
+        field_list += make_list_field(
+            "Constraints",
+            [
+                [nodes.strong(text=key), nodes.Text(f" = {value}")]
+                for key, value in field["constraints"].items()
+            ],
+        )
+        if field["checks"]:
+            field_list += make_list_field(
+                "Validated by",
+                [
+                    self.parse(
+                        format_check(CheckInfo(description=None, **check))
+                    )[0].children
+                    for check in field["checks"]
+                ],
+            )
+        content += field_list
+
+        return addnodes.desc(
+            "",
+            signature,
+            content,
+            domain="py",
+            objtype="pandera_field",
+            desctype="pandera_field",
+            classes=["py", "pandera_field"],
+        )
+
+    def parse(self, text: str) -> List[nodes.Node]:
+        """Parse rST written in the current document."""
+        document = new_document(
+            self.document["source"], self.document.settings
+        )
+        with sphinx_domains(self.env):
+            Parser().parse(text, document)
+        return document.children
+
+
+def purge_lazy_fields(  # pylint: disable=unused-argument
+    app: Sphinx, env: BuildEnvironment, docname: str
+) -> None:
+    """Forget the fields recorded for a document about to be read."""
+    get_lazy_fields(env).pop(docname, None)
+
+
+def merge_lazy_fields(  # pylint: disable=unused-argument
+    app: Sphinx,
+    env: BuildEnvironment,
+    docnames: Set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Merge the fields recorded by a parallel reader."""
+    lazy_fields = get_lazy_fields(env)
+    other_lazy_fields = get_lazy_fields(other)
+    for docname in docnames:
+        if docname in other_lazy_fields:
+            lazy_fields[docname] = other_lazy_fields[docname]
+
+
+def add_script(  # pylint: disable=unused-argument,too-many-arguments
+    app: Sphinx,
+    pagename: str,
+    templatename: str,
+    context: Dict[str, Any],
+    doctree: Optional[nodes.document],
+) -> None:
+    """Add the script loading the details of fields to the pages rendering
+    fields lazily.
+
+    """
+    if get_lazy_fields(app.env).get(pagename):
+        app.add_js_file(f"{STATIC_DIR}/{SCRIPT}", defer="defer")
+
+
+def resolve_url(app: Sphinx, ref: Optional[str]) -> Optional[str]:
+    """Resolve the reference to a custom check to its URL, relative to the
+    root of the output directory.
+
+    """
+    domain = app.env.get_domain("pandera")
+    entry = domain.objects.get(ref) if ref else None  # type: ignore
+    if entry is None:
+        return None
+    uri = app.builder.get_target_uri(entry.docname)
+    return f"{uri}#{entry.node_id}"
+
+
+def write_lazy_fields(app: Sphinx, exception: Optional[Exception]) -> None:
+    """Write the data files of the fields rendered lazily, and the script
+    loading them, once an HTML build is finished.
+
+    """
+    lazy_fields = get_lazy_fields(app.env)
+    if exception is not None or app.builder.format != "html":
+        return
+    if not any(lazy_fields.values()):
+        return
+
+    static_dir = Path(app.outdir, "_static", STATIC_DIR)
+    static_dir.mkdir(parents=True, exist_ok=True)
+    count = 0
+    shutil.copyfile(
+        Path(__file__).parent / "static" / SCRIPT, static_dir / SCRIPT
+    )
+    for data in lazy_fields.values():
+        for name, fields in data.items():
+            details = [
+                {
+                    **field,
+                    "checks": [
+                        {**check, "url": resolve_url(app, check["ref"])}
+                        for check in field["checks"]
+                    ],
+                }
+                for field in fields
+            ]
+            path = static_dir / f"{name}.json"
+            path.write_text(json.dumps(details), encoding="utf-8")
+            count += 1
+
+    logger.info(
+        "[sphinx-pandera] fields details written to %d files in %s",
+        count,
+        static_dir,
+    )
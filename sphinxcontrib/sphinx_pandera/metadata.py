@@ -0,0 +1,264 @@
+"""Plain descriptions of pandera models and schemas.
+
+Descriptions hold everything the documenters render and only JSON
+serializable values, so that they can be compared, hashed and stored
+independently of pandera objects.
+
+"""
+
+import hashlib
+import inspect
+import json
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional
+
+from sphinxcontrib.sphinx_pandera.backend import get_pandera
+
+# Kinds of the members of a pandera model
+FIELD = "field"
+INDEX = "index"
+CHECK = "check"
+DATAFRAME_CHECK = "dataframe_check"
+CONFIG = "config"
+OTHER = "other"
+
+
+class CheckedFields(NamedTuple):
+    """A custom check and the names of the fields it validates."""
+
+    doc: str
+    fields: List[str]
+
+
+def iter_index_levels(schema: Any) -> Iterator[Any]:
+    """Iterate over the named index levels of a schema."""
+    index = schema.index
+    if index is None:
+        return
+    for level in getattr(index, "indexes", [index]):
+        if level.name is not None:
+            yield level
+
+
+def index_components(schema: Any) -> Dict[Any, Any]:
+    """Index the columns and the named index levels of a schema by name,
+    columns taking precedence over index levels of the same name.
+
+    """
+    components = {level.name: level for level in iter_index_levels(schema)}
+    components.update(schema.columns)
+    return components
+
+
+def describe_check(check: Any) -> Dict[str, Optional[str]]:
+    """Describe a check, either a pandera `Check` or a plain function used as
+    a dataframe wide check.
+
+    """
+    check_fn = getattr(check, "_check_fn", check)
+    if check_fn is check:
+        description = (check.__doc__ or "").strip()
+    else:
+        description = check.description
+    # builtin checks are documented by their error message, not by the
+    # docstring of the pandera function implementing them
+    is_builtin = getattr(check_fn, "__module__", "").startswith("pandera.")
+    return {
+        "name": getattr(check, "name", None) or check_fn.__name__,
+        "error": getattr(check, "error", None),
+        "description": description,
+        "doc": None if is_builtin else check_fn.__doc__,
+    }
+
+
+def describe_field(component: Any, is_index: bool = False) -> Dict[str, Any]:
+    """Describe a column or an index level of a schema."""
+    return {
+        "name": component.name,
+        "dtype": str(component.dtype),
+        "is_index": is_index,
+        "title": component.title,
+        "description": component.description,
+        "nullable": component.nullable,
+        "unique": component.unique,
+        "coerce": component.coerce,
+        "required": None if is_index else component.required,
+        "checks": [describe_check(check) for check in component.checks],
+    }
+
+
+def describe_schema(schema: Any) -> Dict[str, Any]:
+    """Describe a schema: its configuration, fields and checks."""
+    fields: List[Dict[str, Any]] = [
+        describe_field(column) for column in schema.columns.values()
+    ]
+    fields.extend(
+        describe_field(level, is_index=True)
+        for level in iter_index_levels(schema)
+    )
+    return {
+        "name": schema.name,
+        "title": schema.title,
+        "description": schema.description,
+        "config": {
+            "coerce": schema.coerce,
+            "ordered": schema.ordered,
+            "strict": schema.strict,
+        },
+        "fields": fields,
+        "checks": [describe_check(check) for check in schema.checks],
+    }
+
+
+def describe_model(model: type, schema: Any) -> Dict[str, Any]:
+    """Describe a model: its schema, the kind of its members and where its
+    custom checks are defined.
+
+    """
+    description = describe_schema(schema)
+    description["members"] = classify_members(model)
+    description["inherited"] = find_inherited_members(
+        model, description["members"]
+    )
+
+    check_refs = {}
+    for check_name in index_checks(description):
+        check_fn = getattr(model, check_name, None)
+        module = inspect.getmodule(check_fn) if check_fn else None
+        modname = module.__name__ if module else model.__module__
+        # inherited checks are referenced on the model defining them
+        owner = get_defining_model(model, check_name)
+        check_refs[check_name] = f"{modname}.{owner.__qualname__}.{check_name}"
+    description["check_refs"] = check_refs
+
+    return description
+
+
+def get_defining_model(model: type, name: str) -> type:
+    """Get the pandera model defining the member `name` of a model, among the
+    model and its bases.
+
+    """
+    pa = get_pandera()
+    for cls in model.__mro__:
+        if not issubclass(cls, pa.DataFrameModel) or cls is pa.DataFrameModel:
+            break
+        if name in vars(cls) or name in vars(cls).get("__annotations__", {}):
+            return cls
+    return model
+
+
+def get_config_model(model: type) -> Optional[type]:
+    """Get the pandera model defining the config of a model, among the model
+    and its bases, if any defines one.
+
+    """
+    pa = get_pandera()
+    for cls in model.__mro__:
+        if not issubclass(cls, pa.DataFrameModel) or cls is pa.DataFrameModel:
+            break
+        # HACK: pandera generates a config for models defining none, which
+        # is not nested in the model
+        config = vars(cls).get("Config")
+        if config is not None and config.__qualname__ == (
+            f"{cls.__qualname__}.Config"
+        ):
+            return cls
+    return None
+
+
+def find_inherited_members(
+    model: type, kinds: Dict[str, str]
+) -> Dict[str, str]:
+    """Map the fields, checks and config a model inherits to the full name of
+    the base model defining them.
+
+    """
+    inherited = {}
+    for name, kind in kinds.items():
+        if kind == OTHER:
+            continue
+        if kind == CONFIG:
+            owner = get_config_model(model)
+        else:
+            owner = get_defining_model(model, name)
+        if owner is not None and owner is not model:
+            inherited[name] = f"{owner.__module__}.{owner.__qualname__}"
+    return inherited
+
+
+def is_pandera_class(cls: type) -> bool:
+    """Tell whether a class is defined by pandera itself."""
+    return cls.__module__.split(".", 1)[0] == "pandera"
+
+
+def classify_members(model: type) -> Dict[str, str]:
+    """Classify the members of a pandera model as fields, index fields,
+    checks, dataframe checks, model config or other members.
+
+    Only the members defined by the model and its user defined bases are
+    classified, not the special attributes and methods pandera defines.
+
+    """
+    pa = get_pandera()
+    if pa is None or not issubclass(model, pa.DataFrameModel):
+        return {}
+
+    # pylint: disable=import-outside-toplevel
+    from pandera.api.dataframe.model_components import (
+        CHECK_KEY,
+        DATAFRAME_CHECK_KEY,
+    )
+    from pandera.typing.common import IndexBase
+
+    attrs: Dict[str, Any] = {}
+    for cls in reversed(model.__mro__):
+        if issubclass(cls, pa.DataFrameModel) and not is_pandera_class(cls):
+            attrs.update(vars(cls))
+
+    fields = model.__fields__  # cached by pandera when building the schema
+    kinds = {}
+    for name, attr in attrs.items():
+        if name.startswith("__") and name.endswith("__"):
+            continue
+        if name in fields:
+            origin = fields[name][0].origin
+            is_index = isinstance(origin, type) and issubclass(
+                origin, IndexBase
+            )
+            kinds[name] = INDEX if is_index else FIELD
+        elif hasattr(attr, CHECK_KEY):
+            kinds[name] = CHECK
+        elif hasattr(attr, DATAFRAME_CHECK_KEY):
+            kinds[name] = DATAFRAME_CHECK
+        else:
+            kinds[name] = OTHER
+
+    if "Config" in model.__dict__:
+        kinds["Config"] = CONFIG
+
+    return kinds
+
+
+def index_checks(description: Dict[str, Any]) -> Dict[str, CheckedFields]:
+    """Map the name of every custom check of a described schema to the
+    fields it validates, in the order they are defined.
+
+    """
+    index: Dict[str, CheckedFields] = {}
+    for field in description["fields"]:
+        for check in field["checks"]:
+            # HACK: standard checks implement nice error message
+            if check["error"]:
+                continue
+            entry = index.get(check["name"])
+            if entry is None:
+                doc = (check["doc"] or "").strip()
+                entry = index[check["name"]] = CheckedFields(doc, [])
+            entry.fields.append(field["name"])
+    return index
+
+
+def fingerprint(description: Dict[str, Any]) -> str:
+    """Compute a stable fingerprint of a description."""
+    payload = json.dumps(description, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
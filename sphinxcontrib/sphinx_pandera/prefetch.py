@@ -0,0 +1,177 @@
+"""Introspection of pandera models and schemas before reading documents,
+in worker processes or in the build process itself.
+
+"""
+
+import gc
+import importlib
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sphinx.application import Sphinx
+from sphinx.util import logging
+
+from sphinxcontrib.sphinx_pandera.cache import (
+    ObjectPath,
+    SchemaCache,
+    get_object_path,
+    get_schema_cache,
+    is_model,
+)
+from sphinxcontrib.sphinx_pandera.discovery import (
+    SCHEMA,
+    find_pandera_objects,
+    iter_module_names,
+)
+from sphinxcontrib.sphinx_pandera.store import DiskCache
+
+logger = logging.getLogger(__name__)
+
+# Descriptions of the objects of a module, by object path
+Descriptions = List[Tuple[ObjectPath, Dict[str, Any]]]
+
+# Schema cache of a worker process
+_worker_cache: Optional[SchemaCache] = None
+
+# Whether the objects of the build process were frozen out of garbage
+# collection by prewarming
+_frozen = False
+
+
+def iter_prefetched_modules(app: Sphinx) -> Iterator[str]:
+    """Iterate over the configured modules, and the modules of the packages
+    among them, once each.
+
+    """
+    names: List[str] = []
+    for modname in app.config.sphinx_pandera_prefetch_modules:
+        try:
+            names.extend(iter_module_names(modname))
+        except ImportError as exc:
+            logger.warning("[sphinx-pandera] cannot find %s: %s", modname, exc)
+    yield from dict.fromkeys(names)
+
+
+def init_worker(path: List[str], cache_dir: Optional[str]) -> None:
+    """Set up a worker process like the build process: same import path and
+    same disk cache.
+
+    """
+    global _worker_cache  # pylint: disable=global-statement
+    sys.path[:] = path
+    _worker_cache = SchemaCache(
+        DiskCache(Path(cache_dir)) if cache_dir else None
+    )
+
+
+def describe_module(modname: str) -> Descriptions:
+    """Import a module and describe the models and schemas it defines."""
+    cache = _worker_cache or SchemaCache()
+    module = importlib.import_module(modname)
+
+    described = []
+    for _, name, objtype in find_pandera_objects(module):
+        obj = getattr(module, name)
+        location = (modname, name) if objtype == SCHEMA else None
+        location = get_object_path(obj, location)
+        described.append((location, cache.description(obj, location)))
+    return described
+
+
+def prefetch_descriptions(app: Sphinx) -> None:
+    """Describe the models and schemas of the configured modules in a pool of
+    processes, before any document is read.
+
+    Each module is imported and introspected by a worker, the build process
+    only receives descriptions which documenters render without converting
+    models to schemas. Modules failing in a worker are left to the
+    documenters, which describe their objects as usual.
+
+    """
+    if app.config.sphinx_pandera_prewarm:
+        return
+    names = list(iter_prefetched_modules(app))
+    if not names:
+        return
+
+    cache = get_schema_cache(app.env)
+    with ProcessPoolExecutor(
+        max_workers=app.config.sphinx_pandera_prefetch_workers,
+        initializer=init_worker,
+        initargs=(list(sys.path), app.config.sphinx_pandera_cache_dir),
+    ) as executor:
+        futures = {
+            name: executor.submit(describe_module, name) for name in names
+        }
+        for name, future in futures.items():
+            try:
+                cache.prefetched.update(future.result())
+            except Exception as exc:  # pylint: disable=broad-exception-caught
+                logger.warning(
+                    "[sphinx-pandera] cannot describe module %s: %s",
+                    name,
+                    exc,
+                )
+
+    logger.info(
+        "[sphinx-pandera] described %d objects from %d modules",
+        len(cache.prefetched),
+        len(futures),
+    )
+
+
+def prewarm_modules(app: Sphinx) -> None:
+    """Import the configured modules and describe their models and schemas
+    in the build process, before any document is read, instead of in a pool
+    of processes.
+
+    Readers forked by parallel builds inherit the imported modules, the
+    converted schemas and the schema cache, copy-on-write, instead of each
+    importing and converting them again. Objects are collected then frozen
+    out of garbage collection, so that collections in readers do not copy
+    the pages they are shared in, until the build is finished.
+
+    """
+    global _frozen  # pylint: disable=global-statement
+    if not app.config.sphinx_pandera_prewarm:
+        return
+
+    cache = get_schema_cache(app.env)
+    count = 0
+    for name in iter_prefetched_modules(app):
+        try:
+            module = importlib.import_module(name)
+            for _, objname, objtype in find_pandera_objects(module):
+                obj = getattr(module, objname)
+                # located as the documenters locate them
+                location = (name, objname) if objtype == SCHEMA else None
+                if is_model(obj):
+                    cache.schema(obj)
+                cache.info(obj, location)
+                cache.fingerprint(obj, location)
+                count += 1
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                "[sphinx-pandera] cannot prewarm module %s: %s", name, exc
+            )
+
+    if app.parallel > 1:
+        gc.collect()
+        gc.freeze()
+        _frozen = True
+    logger.info("[sphinx-pandera] prewarmed %d objects", count)
+
+
+def unfreeze_objects(  # pylint: disable=unused-argument
+    app: Sphinx, exception: Optional[Exception]
+) -> None:
+    """Let garbage collection reclaim the objects frozen by prewarming once
+    the build is finished.
+
+    """
+    global _frozen  # pylint: disable=global-statement
+    if _frozen:
+        gc.unfreeze()
+        _frozen = False
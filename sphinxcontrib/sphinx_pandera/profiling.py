@@ -0,0 +1,251 @@
+"""Timing of the phases of documenting pandera objects.
+
+Profiling is enabled by the `sphinx_pandera_profile` option, naming the
+report written in the output directory once the build is finished.
+
+"""
+
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Dict, Iterator, List, Optional, Set
+
+from sphinx.application import Sphinx
+from sphinx.environment import BuildEnvironment
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
+
+ENV_ATTRIBUTE = "sphinx_pandera_profiler"
+
+# Phases of documenting an object
+IMPORT = "import"
+TO_SCHEMA = "to_schema"
+DESCRIBE = "describe"
+FILTER = "filter"
+RENDER = "render"
+PHASES = (IMPORT, TO_SCHEMA, DESCRIBE, FILTER, RENDER)
+
+# Number of objects named in the console summary
+SUMMARY_SIZE = 10
+
+
+class Profiler:
+    """Accumulates the time spent in each phase of documenting each object,
+    by document.
+
+    Phases nest, such as a model converted to a schema while it is imported,
+    or members documented while the model is rendered: the time of a phase
+    excludes the time of the phases nested in it, so that times add up to
+    the time spent documenting.
+
+    """
+
+    def __init__(self) -> None:
+        # Timings of each object, by document then object name
+        self.timings: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        # Time spent in nested phases, document and start of running phases
+        self._stack: List[List[Any]] = []
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"timings": self.timings, "_stack": []}
+
+    def start(self, docname: Optional[str] = None) -> None:
+        """Start timing a phase in a document, by default the document of the
+        enclosing phase.
+
+        """
+        if docname is None and self._stack:
+            docname = self._stack[-1][1]
+        self._stack.append([0.0, docname, perf_counter()])
+
+    def stop(self, name: str, objtype: str, phase: str) -> None:
+        """Stop timing the current phase, of documenting object `name`."""
+        nested, docname, start = self._stack.pop()
+        elapsed = perf_counter() - start
+        if self._stack:
+            self._stack[-1][0] += elapsed
+        if docname is not None:
+            self.add(docname, name, objtype, phase, elapsed - nested)
+
+    @contextmanager
+    def phase(
+        self,
+        name: str,
+        objtype: str,
+        phase: str,
+        docname: Optional[str] = None,
+    ) -> Iterator[None]:
+        """Time a phase of documenting an object."""
+        self.start(docname)
+        try:
+            yield
+        finally:
+            self.stop(name, objtype, phase)
+
+    def add(
+        self, docname: str, name: str, objtype: str, phase: str, value: float
+    ) -> None:
+        """Add time spent in a phase of documenting an object."""
+        timing = self.timings.setdefault(docname, {}).setdefault(
+            name, {"documenter": objtype, **dict.fromkeys(PHASES, 0.0)}
+        )
+        timing[phase] += value
+
+    def report(self) -> Dict[str, Any]:
+        """Summarize timings by object, slowest first, and by documenter.
+
+        Models and schemas include the time spent documenting their members.
+
+        """
+        objects: Dict[str, Dict[str, Any]] = {}
+        for timings in self.timings.values():
+            for name, timing in timings.items():
+                entry = objects.setdefault(
+                    name,
+                    {
+                        "name": name,
+                        "documenter": timing["documenter"],
+                        **dict.fromkeys(PHASES, 0.0),
+                    },
+                )
+                for phase in PHASES:
+                    entry[phase] += timing[phase]
+
+        documenters: Dict[str, Dict[str, Any]] = {}
+        for entry in objects.values():
+            totals = documenters.setdefault(
+                entry["documenter"],
+                {"objects": 0, **dict.fromkeys(PHASES, 0.0)},
+            )
+            totals["objects"] += 1
+            for phase in PHASES:
+                totals[phase] += entry[phase]
+
+        # members are named after the model or schema they belong to
+        for entry in objects.values():
+            entry["members"] = dict.fromkeys(PHASES, 0.0)
+        for name, entry in objects.items():
+            parent = objects.get(name.rsplit(".", 1)[0])
+            if parent is not None and parent is not entry:
+                for phase in PHASES:
+                    parent["members"][phase] += entry[phase]
+
+        for entry in [*objects.values(), *documenters.values()]:
+            members = entry.get("members", {})
+            phases = {
+                phase: entry[phase] + members.get(phase, 0.0)
+                for phase in PHASES
+            }
+            entry["total"] = sum(phases.values())
+            entry["dominant"] = max(PHASES, key=phases.__getitem__)
+
+        return {
+            "total": sum(entry["total"] for entry in documenters.values()),
+            "objects": sorted(
+                objects.values(), key=lambda entry: -entry["total"]
+            ),
+            "documenters": documenters,
+        }
+
+
+def get_profiler(env: BuildEnvironment) -> Optional[Profiler]:
+    """Get the profiler of the current build, if profiling is enabled."""
+    return getattr(env, ENV_ATTRIBUTE, None)
+
+
+@contextmanager
+def profile_phase(documenter: Any, phase: str) -> Iterator[None]:
+    """Time a phase of a documenter, if profiling is enabled."""
+    profiler = get_profiler(documenter.env)
+    if profiler is None:
+        yield
+        return
+    profiler.start(documenter.env.docname)
+    try:
+        yield
+    finally:
+        # the documented object is only named once the documenter resolved it
+        profiler.stop(
+            documenter.fullname or documenter.name, documenter.objtype, phase
+        )
+
+
+def init_profiler(app: Sphinx) -> None:
+    """Start profiling the build, if enabled."""
+    profiler = Profiler() if app.config.sphinx_pandera_profile else None
+    setattr(app.env, ENV_ATTRIBUTE, profiler)
+
+
+def purge_timings(  # pylint: disable=unused-argument
+    app: Sphinx, env: BuildEnvironment, docname: str
+) -> None:
+    """Forget the timings recorded for a document about to be read."""
+    profiler = get_profiler(env)
+    if profiler is not None:
+        profiler.timings.pop(docname, None)
+
+
+def merge_timings(  # pylint: disable=unused-argument
+    app: Sphinx,
+    env: BuildEnvironment,
+    docnames: Set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Merge the timings recorded by a parallel reader."""
+    profiler = get_profiler(env)
+    other_profiler = get_profiler(other)
+    if profiler is None or other_profiler is None:
+        return
+    for docname in docnames:
+        if docname in other_profiler.timings:
+            profiler.timings[docname] = other_profiler.timings[docname]
+
+
+def write_profile(app: Sphinx, exception: Optional[Exception]) -> None:
+    """Write the profiling report, and summarize it on the console."""
+    profiler = get_profiler(app.env)
+    if profiler is None or exception is not None:
+        return
+
+    report = profiler.report()
+    path = Path(app.outdir, app.config.sphinx_pandera_profile)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(report, indent=2), encoding="utf-8")
+    except OSError as exc:
+        logger.warning(
+            "[sphinx-pandera] cannot write profile to %s: %s", path, exc
+        )
+        return
+
+    logger.info(
+        "[sphinx-pandera] documented %d objects in %.3fs, profile written "
+        "to %s",
+        len(report["objects"]),
+        report["total"],
+        path,
+    )
+    for objtype, totals in sorted(report["documenters"].items()):
+        logger.info(
+            "[sphinx-pandera]   %s: %d objects in %.3fs, mostly %s",
+            objtype,
+            totals["objects"],
+            totals["total"],
+            totals["dominant"],
+        )
+    slowest = [
+        entry
+        for entry in report["objects"]
+        if entry["documenter"] in {"pandera_model", "pandera_schema"}
+    ][:SUMMARY_SIZE]
+    if slowest:
+        logger.info("[sphinx-pandera] slowest models and schemas:")
+    for entry in slowest:
+        logger.info(
+            "[sphinx-pandera]   %s: %.3fs, mostly %s",
+            entry["name"],
+            entry["total"],
+            entry["dominant"],
+        )
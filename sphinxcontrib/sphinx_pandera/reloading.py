@@ -0,0 +1,143 @@
+"""Reloading of the modules whose source changed since the previous build run
+by the same process.
+
+Modules stay in `sys.modules` from one build to the next when the process
+builds the documentation several times: their models would be documented as
+they were first imported. The modules defining documented objects are
+tracked, with the project modules they import, and those whose source
+changed are reloaded when a build starts, together with every tracked
+module depending on them, directly or not.
+
+"""
+
+import hashlib
+import importlib
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sphinx.application import Sphinx
+from sphinx.pycode import ModuleAnalyzer
+from sphinx.util import logging
+
+from sphinxcontrib.sphinx_pandera.store import get_imported_modules
+
+logger = logging.getLogger(__name__)
+
+# Modification time and digest of the source of each tracked module
+_sources: Dict[str, Tuple[int, str]] = {}
+
+# Tracked modules each tracked module depends on
+_dependencies: Dict[str, Set[str]] = {}
+
+
+def read_source(modname: str) -> Optional[Tuple[int, str]]:
+    """Get the modification time and digest of the source of a module."""
+    filename = getattr(sys.modules.get(modname), "__file__", None)
+    if filename is None:
+        return None
+    path = Path(filename)
+    try:
+        mtime = path.stat().st_mtime_ns
+        tracked = _sources.get(modname)
+        if tracked is not None and tracked[0] == mtime:
+            return tracked
+        return mtime, hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+def track_modules(modnames: Iterable[str]) -> None:
+    """Track the modules defining a documented object: the module of the
+    object first, then the modules of its bases and the project modules they
+    import.
+
+    """
+    modnames = list(modnames)
+    for modname in modnames:
+        if modname not in _sources:
+            source = read_source(modname)
+            if source is not None:
+                _sources[modname] = source
+        _dependencies.setdefault(modname, set()).update(
+            get_imported_modules(modname)
+        )
+    if modnames:
+        _dependencies[modnames[0]].update(modnames[1:])
+
+
+def find_changed_modules() -> Set[str]:
+    """Find the tracked modules whose source changed, and the tracked
+    modules depending on them, directly or not.
+
+    Sources are only read again when their modification time changed.
+
+    """
+    changed = set()
+    for modname, tracked in list(_sources.items()):
+        source = read_source(modname)
+        if source is None:
+            continue
+        if source[1] != tracked[1]:
+            changed.add(modname)
+        _sources[modname] = source
+
+    expanded = True
+    while expanded:
+        expanded = False
+        for modname, dependencies in _dependencies.items():
+            if modname not in changed and dependencies & changed:
+                changed.add(modname)
+                expanded = True
+    return changed
+
+
+def sort_modules(modnames: Set[str]) -> List[str]:
+    """Order modules so that each one follows the modules it depends on,
+    otherwise in the order they were first imported.
+
+    """
+    ordered: List[str] = []
+    visited: Set[str] = set()
+
+    def visit(modname: str) -> None:
+        if modname in visited:
+            return
+        visited.add(modname)
+        for dependency in sorted(_dependencies.get(modname, set()) & modnames):
+            visit(dependency)
+        ordered.append(modname)
+
+    for modname in [name for name in list(sys.modules) if name in modnames]:
+        visit(modname)
+    return ordered
+
+
+def reload_modules(app: Sphinx) -> None:
+    """Reload the modules whose source changed since the previous build,
+    after the modules they depend on, when descriptions are kept in memory.
+
+    """
+    if not app.config.sphinx_pandera_memory_cache:
+        return
+
+    count = 0
+    for modname in sort_modules(find_changed_modules()):
+        # autodoc analyzes the source of modules once per process
+        ModuleAnalyzer.cache.pop(("module", modname), None)
+        try:
+            importlib.reload(sys.modules[modname])
+            count += 1
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            logger.warning(
+                "[sphinx-pandera] cannot reload module %s: %s", modname, exc
+            )
+
+    if count:
+        logger.info("[sphinx-pandera] reloaded %d changed modules", count)
+
+
+def clear_tracked_modules() -> None:
+    """Stop tracking all modules."""
+    _sources.clear()
+    _dependencies.clear()
@@ -0,0 +1,212 @@
+"""Schemas read from their pandera YAML or JSON serialization.
+
+Serialized schemas are described like imported ones, without importing
+pandas nor pandera: the documenters render them the same way.
+
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from sphinxcontrib.sphinx_pandera.discovery import SCHEMA
+from sphinxcontrib.sphinx_pandera.static import (
+    CHECK_ALIASES,
+    CHECK_OPTIONS,
+    CHECK_PARAMETERS,
+    StaticObject,
+    Unresolved,
+    builtin_check,
+)
+
+# Keys of serialized columns and index levels which are not checks
+COMPONENT_KEYS = {
+    "title",
+    "description",
+    "dtype",
+    "nullable",
+    "checks",
+    "name",
+    "unique",
+    "coerce",
+    "required",
+    "regex",
+    "default",
+    "report_duplicates",
+    "drop_invalid_rows",
+}
+
+
+def load_yaml(path: Path) -> Any:
+    """Load a YAML file, with the C loader of PyYAML when it is built.
+
+    PyYAML is an optional dependency, installed with the `yaml` extra.
+
+    """
+    try:
+        # pylint: disable-next=import-outside-toplevel
+        import yaml
+    except ImportError as exc:
+        raise ImportError(
+            "reading YAML schema files requires PyYAML, install it with "
+            "`pip install sphinx-pandera[yaml]`"
+        ) from exc
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    try:
+        with path.open("rb") as file:
+            return yaml.load(file, Loader=loader)  # nosec B506
+    except yaml.YAMLError as exc:
+        raise ValueError(f"Invalid YAML: {exc}") from exc
+
+
+def load_json(path: Path) -> Any:
+    """Load a JSON file."""
+    with path.open("rb") as file:
+        return json.load(file)
+
+
+def iter_checks(serialized: Any) -> Iterator[Tuple[str, Any]]:
+    """Iterate over serialized checks, as names and statistics, whether
+    they are listed with their options or mapped by name.
+
+    """
+    if serialized is None:
+        return
+    if isinstance(serialized, dict):
+        yield from serialized.items()
+        return
+    for entry in serialized:
+        options = entry.get("options") or {}
+        stats = {k: v for k, v in entry.items() if k != "options"}
+        if set(stats) == {"value"}:
+            stats = stats["value"]
+        yield options["check_name"], stats
+
+
+def describe_serialized_check(name: str, stats: Any) -> Dict[str, Any]:
+    """Describe a serialized check like `metadata.describe_check` does.
+
+    Checks which are not builtin are registered pandera extensions: only
+    their name is known without importing the code registering them.
+
+    """
+    if CHECK_ALIASES.get(name, name) not in CHECK_PARAMETERS:
+        return {"name": name, "error": None, "description": None, "doc": None}
+    if isinstance(stats, dict):
+        kwargs = {k: v for k, v in stats.items() if k not in CHECK_OPTIONS}
+        return builtin_check(name, [], kwargs)
+    return builtin_check(name, [stats], {})
+
+
+def describe_component(
+    serialized: Dict[str, Any], name: Any, is_index: bool = False
+) -> Dict[str, Any]:
+    """Describe a serialized column or index level."""
+    checks = serialized.get("checks")
+    if checks is None:
+        # recent versions of pandera flatten checks into the component
+        checks = {
+            key: value
+            for key, value in serialized.items()
+            if key not in COMPONENT_KEYS
+        }
+    dtype = serialized.get("dtype")
+    return {
+        "name": name,
+        "dtype": str(dtype) if dtype else "None",
+        "is_index": is_index,
+        "title": serialized.get("title"),
+        "description": serialized.get("description"),
+        "nullable": serialized.get("nullable", False),
+        "unique": serialized.get("unique", False),
+        "coerce": serialized.get("coerce", False),
+        "required": None if is_index else serialized.get("required", True),
+        "checks": [
+            describe_serialized_check(*check) for check in iter_checks(checks)
+        ],
+    }
+
+
+def describe_serialized(serialized: Any) -> Dict[str, Any]:
+    """Describe a serialized schema like `metadata.describe_schema` does."""
+    if not isinstance(serialized, dict):
+        raise ValueError("Schema representation must be a mapping")
+    if serialized.get("schema_type", "dataframe") != "dataframe":
+        raise ValueError(
+            f"Unsupported schema type {serialized['schema_type']}"
+        )
+
+    columns = serialized.get("columns") or {}
+    if isinstance(columns, dict):
+        named_columns = list(columns.items())
+    else:
+        # columns whose names are not strings are listed with their name
+        named_columns = [
+            (
+                (
+                    tuple(column["name"])
+                    if isinstance(column["name"], list)
+                    else column["name"]
+                ),
+                column,
+            )
+            for column in columns
+        ]
+    fields: List[Dict[str, Any]] = [
+        describe_component(column, name) for name, column in named_columns
+    ]
+    # index levels are only described if they are named, like in schemas
+    fields.extend(
+        describe_component(level, level["name"], is_index=True)
+        for level in serialized.get("index") or []
+        if level.get("name") is not None
+    )
+
+    return {
+        "name": serialized.get("name"),
+        "title": serialized.get("title"),
+        "description": serialized.get("description"),
+        "config": {
+            "coerce": serialized.get("coerce", False),
+            "ordered": serialized.get("ordered", False),
+            "strict": serialized.get("strict", False),
+        },
+        "fields": fields,
+        "checks": [
+            describe_serialized_check(*check)
+            for check in iter_checks(serialized.get("checks"))
+        ],
+    }
+
+
+# Files read, by path, with the time they were modified
+_files: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
+
+def read_schema_file(path: Path) -> Dict[str, Any]:
+    """Describe the schema serialized in a file, reading it again only once
+    modified.
+
+    """
+    mtime = path.stat().st_mtime_ns
+    entry = _files.get(path)
+    if entry is None or entry[0] != mtime:
+        load = load_json if path.suffix == ".json" else load_yaml
+        try:
+            description = describe_serialized(load(path))
+        except (KeyError, TypeError, AttributeError, Unresolved) as exc:
+            raise ValueError(f"Invalid schema representation: {exc}") from exc
+        entry = _files[path] = (mtime, description)
+    return entry[1]
+
+
+def get_schema_file_object(modname: Optional[str], path: Path) -> StaticObject:
+    """Read the schema serialized in a file, named after the schema or else
+    after the file.
+
+    """
+    description = read_schema_file(path)
+    name = re.sub(r"\W", "_", description["name"] or path.stem)
+    return StaticObject(modname or "", name, SCHEMA, path, description)
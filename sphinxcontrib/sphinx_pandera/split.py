@@ -0,0 +1,211 @@
+"""Pages of their own for the fields of very wide models and schemas.
+
+Models and schemas with more fields than `sphinx_pandera_split_threshold`
+are documented with a table of contents of their fields, which are
+documented by slices of `sphinx_pandera_split_size` on pages generated when
+the build starts. Pages are read in parallel and, as each one records the
+fingerprint of its own fields, only the pages whose fields changed are read
+again on incremental builds.
+
+"""
+
+import importlib.util
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from sphinx.application import Sphinx
+from sphinx.config import Config
+from sphinx.environment import BuildEnvironment
+from sphinx.util import logging
+from sphinx.util.rst import escape
+
+from sphinxcontrib.sphinx_pandera.cache import ObjectPath, get_schema_cache
+from sphinxcontrib.sphinx_pandera.discovery import discover
+from sphinxcontrib.sphinx_pandera.environment import load_object
+from sphinxcontrib.sphinx_pandera.static import discover_static
+
+logger = logging.getLogger(__name__)
+
+# Directives documenting models and schemas, and the object they document
+DIRECTIVE_RE = re.compile(
+    r"^\s*\.\. autopandera_(model|schema|module)::\s*(\S+)\s*$", re.MULTILINE
+)
+
+# Suffix of the generated pages
+SUFFIX = ".rst"
+
+# Full names of the objects whose pages were generated, on the environment
+SPLIT_OBJECTS = "sphinx_pandera_split_objects"
+
+# Slice of the fields of an object, as a start and a stop
+FieldSlice = Tuple[int, int]
+
+
+def get_slices(count: int, config: Config) -> List[FieldSlice]:
+    """Slice the fields of an object documented on pages of their own, if it
+    has too many fields.
+
+    """
+    threshold = config.sphinx_pandera_split_threshold
+    if not threshold or count <= threshold:
+        return []
+    size = max(config.sphinx_pandera_split_size, 1)
+    return [
+        (start, min(start + size, count)) for start in range(0, count, size)
+    ]
+
+
+def get_split_objects(env: BuildEnvironment) -> Set[str]:
+    """Get the full names of the objects whose pages were generated when the
+    build started.
+
+    """
+    return getattr(env, SPLIT_OBJECTS, set())
+
+
+def get_page_slices(
+    env: BuildEnvironment, fullname: str, count: int
+) -> List[FieldSlice]:
+    """Slice the fields of an object documented on pages of their own.
+
+    Only the objects whose pages were generated are split: objects the
+    sources do not name fully, such as names relative to the current module,
+    document their fields as usual.
+
+    """
+    if fullname not in get_split_objects(env):
+        return []
+    return get_slices(count, env.config)
+
+
+def get_page_name(config: Config, fullname: str, index: int) -> str:
+    """Name the document of the `index`-th slice of the fields of an object,
+    counting from 1.
+
+    """
+    return f"{config.sphinx_pandera_split_dir}/{fullname}.{index}"
+
+
+def split_name(name: str) -> Optional[ObjectPath]:
+    """Split the name given to a directive into the name of the module and
+    the path of the object within the module.
+
+    """
+    if "::" in name:
+        modname, objpath = name.split("::", 1)
+        return modname, objpath
+    parts = name.split(".")
+    for i in range(len(parts) - 1, 0, -1):
+        modname = ".".join(parts[:i])
+        try:
+            if importlib.util.find_spec(modname) is not None:
+                return modname, ".".join(parts[i:])
+        except (ImportError, ValueError):
+            continue
+    return None
+
+
+def iter_documented(app: Sphinx) -> Iterator[ObjectPath]:
+    """Find the models and schemas documented in the sources of the project.
+
+    Only fully qualified names are understood, as the current module of the
+    directives is not known before documents are read.
+
+    """
+    env = app.env
+    split_dir = Path(app.srcdir, app.config.sphinx_pandera_split_dir)
+    for docname in sorted(env.found_docs):
+        path = Path(env.doc2path(docname))
+        if split_dir in path.parents or not path.is_file():
+            continue
+        text = path.read_text(encoding=app.config.source_encoding)
+        for kind, name in DIRECTIVE_RE.findall(text):
+            if kind != "module":
+                location = split_name(name)
+                if location is not None:
+                    yield location
+                continue
+            found = None
+            if app.config.sphinx_pandera_static:
+                found = discover_static(name)
+            if found is None:
+                found = discover(name)
+            for obj in found:
+                yield obj.modname, obj.name
+
+
+def render_page(
+    modname: str, objpath: str, names: List[str], field_slice: FieldSlice
+) -> str:
+    """Render the source of the page of a slice of fields."""
+    start, stop = field_slice
+    title = escape(f"{objpath}: {names[start]} to {names[stop - 1]}")
+    return (
+        f"{title}\n{'=' * len(title)}\n\n"
+        f".. autopandera_fields:: {modname}::{objpath}\n"
+        f"   :start: {start}\n"
+        f"   :stop: {stop}\n"
+    )
+
+
+def generate_pages(app: Sphinx) -> None:
+    """Generate the pages of the fields of the documented models and
+    schemas which are split, before sources are discovered.
+
+    Pages are only written when their content changed, and the pages of
+    objects which are no longer split are removed.
+
+    """
+    config = app.config
+    split_objects: Set[str] = set()
+    setattr(app.env, SPLIT_OBJECTS, split_objects)
+    if not config.sphinx_pandera_split_threshold:
+        return
+
+    cache = get_schema_cache(app.env)
+    pages: Dict[Path, str] = {}
+    split_dir = Path(app.srcdir, config.sphinx_pandera_split_dir)
+    try:
+        documented = list(dict.fromkeys(iter_documented(app)))
+    except (OSError, ImportError) as exc:
+        logger.warning("[sphinx-pandera] cannot find split objects: %s", exc)
+        return
+
+    for modname, objpath in documented:
+        try:
+            obj = load_object(app.env, modname, objpath)
+            info = cache.info(obj, (modname, objpath))
+        except Exception as exc:  # pylint: disable=broad-exception-caught
+            # left to the documenters, which report the failure
+            logger.debug(
+                "[sphinx-pandera] cannot split %s.%s: %s",
+                modname,
+                objpath,
+                exc,
+            )
+            continue
+        names = [str(field.name) for field in info.fields]
+        fullname = f"{modname}.{objpath}"
+        for index, field_slice in enumerate(get_slices(len(names), config), 1):
+            docname = get_page_name(config, fullname, index)
+            path = Path(app.srcdir, docname + SUFFIX)
+            pages[path] = render_page(modname, objpath, names, field_slice)
+            split_objects.add(fullname)
+
+    for path, content in pages.items():
+        if path.is_file() and path.read_text(encoding="utf-8") == content:
+            continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    if split_dir.is_dir():
+        for path in split_dir.glob(f"*{SUFFIX}"):
+            if path not in pages:
+                path.unlink()
+
+    if pages:
+        logger.info(
+            "[sphinx-pandera] documented fields on %d pages in %s",
+            len(pages),
+            split_dir,
+        )
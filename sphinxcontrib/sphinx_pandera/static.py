@@ -0,0 +1,1093 @@
+"""Static extraction of pandera models and schemas from their source.
+
+Models and schemas are read from the syntax tree of the module defining them,
+without importing it, nor pandas and pandera. Only the constructs whose
+meaning is certain are understood: whenever a value cannot be resolved
+statically, the object is left to the documenters importing it.
+
+"""
+
+import ast
+import re
+import sys
+from pathlib import Path
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from sphinx.util import logging
+
+from sphinxcontrib.sphinx_pandera.discovery import MODEL, SCHEMA, PanderaObject
+from sphinxcontrib.sphinx_pandera.metadata import (
+    CHECK,
+    CONFIG,
+    DATAFRAME_CHECK,
+    FIELD,
+    INDEX,
+    OTHER,
+    index_checks,
+)
+
+logger = logging.getLogger(__name__)
+
+# Data types as pandera names them, by builtin type or alias: the tests
+# compare them, like the error messages of builtin checks, with pandera's
+BUILTIN_DTYPES = {
+    "int": "int64",
+    "float": "float64",
+    "str": "str",
+    "bool": "bool",
+}
+STRING_DTYPES = {
+    "int8": "int8",
+    "int16": "int16",
+    "int32": "int32",
+    "int64": "int64",
+    "float32": "float32",
+    "float64": "float64",
+    "str": "str",
+    "string": "string[python]",
+    "bool": "bool",
+    "boolean": "boolean",
+    "category": "category",
+    "object": "object",
+    "datetime64[ns]": "datetime64[ns]",
+    "Int8": "Int8",
+    "Int16": "Int16",
+    "Int32": "Int32",
+    "Int64": "Int64",
+}
+# Data types replaced by pandas nullable types when coercing nullable fields
+NULLABLE_COERCED_DTYPES = {"int64", "bool"}
+
+# Generic types of pandera, whatever the module they are imported from
+PANDERA_TYPES = {"Series", "Index", "DataFrame"}
+# Annotations as autodoc renders them, by qualified name
+ANNOTATIONS = {
+    "pandas.DataFrame": "~pandas.core.frame.DataFrame",
+    "pandas.Series": "~pandas.core.series.Series",
+    "builtins.int": "int",
+    "builtins.float": "float",
+    "builtins.str": "str",
+    "builtins.bool": "bool",
+}
+
+# Builtin checks, by alias, and the parameters they are called with
+CHECK_ALIASES = {
+    "eq": "equal_to",
+    "ne": "not_equal_to",
+    "gt": "greater_than",
+    "ge": "greater_than_or_equal_to",
+    "lt": "less_than",
+    "le": "less_than_or_equal_to",
+    "between": "in_range",
+}
+CHECK_PARAMETERS = {
+    "equal_to": ("value",),
+    "not_equal_to": ("value",),
+    "greater_than": ("min_value",),
+    "greater_than_or_equal_to": ("min_value",),
+    "less_than": ("max_value",),
+    "less_than_or_equal_to": ("max_value",),
+    "in_range": ("min_value", "max_value", "include_min", "include_max"),
+    "isin": ("allowed_values",),
+    "notin": ("forbidden_values",),
+    "unique_values_eq": ("values",),
+    "str_matches": ("pattern",),
+    "str_contains": ("pattern",),
+    "str_startswith": ("string",),
+    "str_endswith": ("string",),
+    "str_length": ("min_value", "max_value", "exact_value"),
+}
+# Field arguments creating builtin checks, in the order pandera creates them
+FIELD_CHECKS = (
+    "eq",
+    "ne",
+    "gt",
+    "ge",
+    "lt",
+    "le",
+    "in_range",
+    "between",
+    "isin",
+    "notin",
+    "str_contains",
+    "str_endswith",
+    "str_matches",
+    "str_length",
+    "str_startswith",
+    "unique_values_eq",
+)
+
+# Arguments which do not change the description of an object
+CHECK_OPTIONS = {"ignore_na", "raise_warning", "n_failure_cases"}
+CUSTOM_CHECK_OPTIONS = CHECK_OPTIONS | {
+    "name",
+    "error",
+    "description",
+    "element_wise",
+}
+FIELD_OPTIONS = CHECK_OPTIONS | {
+    "title",
+    "description",
+    "nullable",
+    "unique",
+    "coerce",
+    "check_name",
+    "default",
+    "metadata",
+}
+COMPONENT_OPTIONS = {
+    "checks",
+    "nullable",
+    "unique",
+    "coerce",
+    "name",
+    "title",
+    "description",
+    "default",
+    "metadata",
+    "report_duplicates",
+}
+COLUMN_OPTIONS = COMPONENT_OPTIONS | {"required", "drop_invalid_rows"}
+SCHEMA_OPTIONS = {
+    "columns",
+    "checks",
+    "index",
+    "coerce",
+    "strict",
+    "name",
+    "ordered",
+    "unique",
+    "report_duplicates",
+    "unique_column_names",
+    "add_missing_columns",
+    "title",
+    "description",
+    "metadata",
+    "drop_invalid_rows",
+}
+CONFIG_OPTIONS = {
+    "coerce",
+    "strict",
+    "ordered",
+    "name",
+    "title",
+    "description",
+    "unique",
+    "unique_column_names",
+    "add_missing_columns",
+    "drop_invalid_rows",
+    "metadata",
+}
+# Config options documented as model config attributes
+DOCUMENTED_CONFIG_OPTIONS = ("strict", "coerce", "ordered")
+
+
+class Unresolved(Exception):
+    """A value which cannot be resolved without importing its module."""
+
+
+class StaticMember(NamedTuple):
+    """A member of a model, as rendered by the documenters."""
+
+    name: str
+    kind: str
+    # type of fields, return annotation of checks
+    annotation: Optional[str] = None
+    # arguments of checks
+    signature: Optional[str] = None
+    doc: Optional[str] = None
+    # options of the model config
+    values: Tuple[Tuple[str, Any], ...] = ()
+
+
+class StaticObject:
+    """A model or a schema read from source, standing in for the object.
+
+    It carries the same description as the one extracted from the imported
+    object, and for models, what the member documenters need to render their
+    members.
+
+    """
+
+    def __init__(
+        self,
+        modname: str,
+        qualname: str,
+        objtype: str,
+        source: Path,
+        description: Dict[str, Any],
+        doc: Optional[str] = None,
+        members: Tuple[StaticMember, ...] = (),
+    ) -> None:
+        self.modname = modname
+        self.qualname = qualname
+        self.objtype = objtype
+        self.source = source
+        self.description = description
+        self.doc = doc
+        self.members = members
+
+    def __str__(self) -> str:
+        return self.qualname
+
+    def __repr__(self) -> str:
+        return f"<StaticObject {self.modname}.{self.qualname}>"
+
+
+def find_source(modname: str) -> Optional[Path]:
+    """Find the source file of a module on the import path, without
+    importing it or its packages.
+
+    """
+    parts = modname.split(".")
+    for entry in sys.path:
+        base = Path(entry or ".").joinpath(*parts)
+        for path in (base.with_name(f"{parts[-1]}.py"), base / "__init__.py"):
+            if path.is_file():
+                return path
+    return None
+
+
+def get_docstring(node: ast.AST) -> Optional[str]:
+    """Get the docstring of a class or a function as Python stores it."""
+    return ast.get_docstring(node, clean=False)  # type: ignore[arg-type]
+
+
+def single_arg(
+    args: List[Any], kwargs: Dict[str, Any], name: str, check: str
+) -> Any:
+    """Get the value of the only parameter of a builtin check."""
+    if len(args) + len(kwargs) != 1 or set(kwargs) - {name}:
+        raise Unresolved(f"Unsupported arguments of {check}")
+    return args[0] if args else kwargs[name]
+
+
+def builtin_check_error(
+    check: str, args: List[Any], kwargs: Dict[str, Any]
+) -> str:
+    """Format the error message of a builtin check like pandera does."""
+    params = CHECK_PARAMETERS[check]
+    if check in {"isin", "notin", "unique_values_eq"}:
+        if kwargs or len(args) != 1:
+            values = single_arg(
+                [tuple(args)] if args else [], kwargs, params[0], check
+            )
+        else:
+            values = args[0]
+        return f"{check}({values})"
+
+    if check == "str_length":
+        if len(args) > 2:
+            raise Unresolved(f"Unsupported arguments of {check}")
+        bound = dict(zip(("exact_value",) if len(args) == 1 else params, args))
+        bound.update(kwargs)
+        if set(bound) - set(params):
+            raise Unresolved(f"Unsupported arguments of {check}")
+        if bound.get("exact_value") is not None:
+            return f"str_length({bound['exact_value']})"
+        return (
+            f"str_length({bound.get('min_value')}, {bound.get('max_value')})"
+        )
+
+    if check == "in_range":
+        bound = dict(zip(params, args))
+        bound.update(kwargs)
+        if set(bound) - set(params) or len(args) > len(params):
+            raise Unresolved(f"Unsupported arguments of {check}")
+        if "min_value" not in bound or "max_value" not in bound:
+            raise Unresolved(f"Unsupported arguments of {check}")
+        return f"in_range({bound['min_value']}, {bound['max_value']})"
+
+    value = single_arg(args, kwargs, params[0], check)
+    if check.startswith("str_"):
+        return f"{check}('{value}')"
+    return f"{check}({value})"
+
+
+def builtin_check(
+    name: str, args: List[Any], kwargs: Dict[str, Any]
+) -> Dict[str, Optional[str]]:
+    """Describe a builtin check like `metadata.describe_check` does."""
+    check = CHECK_ALIASES.get(name, name)
+    if check not in CHECK_PARAMETERS:
+        raise Unresolved(f"Unknown builtin check {name}")
+    kwargs = {k: v for k, v in kwargs.items() if k not in CHECK_OPTIONS}
+    if check == "in_range":
+        kwargs = {
+            k: v
+            for k, v in kwargs.items()
+            if k not in {"include_min", "include_max"}
+        }
+    return {
+        "name": check,
+        "error": builtin_check_error(check, args, kwargs),
+        "description": None,
+        "doc": None,
+    }
+
+
+class StaticModule:
+    """The top level definitions of a module, read from its source."""
+
+    def __init__(self, modname: str, path: Path) -> None:
+        self.modname = modname
+        self.path = path
+        tree = ast.parse(path.read_bytes(), filename=str(path))
+
+        if path.name == "__init__.py":
+            self.package = modname
+        else:
+            self.package = modname.rpartition(".")[0]
+
+        # names bound by imports, to their qualified name
+        self.imports: Dict[str, str] = {}
+        self.classes: Dict[str, ast.ClassDef] = {}
+        self.functions: Dict[str, ast.FunctionDef] = {}
+        self.values: Dict[str, ast.expr] = {}
+        # names bound more than once or conditionally
+        self.ambiguous: Set[str] = set()
+        # names of the top level definitions, in source order
+        self.order: List[str] = []
+        self._objects: Dict[str, Union[StaticObject, Unresolved]] = {}
+
+        for stmt in tree.body:
+            self._bind_statement(stmt)
+
+    def _bind(self, name: str) -> None:
+        if name in self.order:
+            self.ambiguous.add(name)
+        else:
+            self.order.append(name)
+
+    def _bind_statement(self, stmt: ast.stmt) -> None:
+        if isinstance(stmt, ast.Import):
+            for alias in stmt.names:
+                if alias.asname:
+                    self.imports[alias.asname] = alias.name
+                    self._bind(alias.asname)
+                else:
+                    top = alias.name.split(".", 1)[0]
+                    self.imports[top] = top
+                    self._bind(top)
+        elif isinstance(stmt, ast.ImportFrom):
+            base = stmt.module or ""
+            if stmt.level:
+                parts = self.package.split(".")
+                parts = parts[: len(parts) - stmt.level + 1]
+                base = ".".join(filter(None, [*parts, base]))
+            for alias in stmt.names:
+                name = alias.asname or alias.name
+                self.imports[name] = f"{base}.{alias.name}"
+                self._bind(name)
+        elif isinstance(stmt, ast.ClassDef):
+            self.classes[stmt.name] = stmt
+            self._bind(stmt.name)
+        elif isinstance(stmt, ast.FunctionDef):
+            self.functions[stmt.name] = stmt
+            self._bind(stmt.name)
+        elif (
+            isinstance(stmt, (ast.Assign, ast.AnnAssign))
+            and stmt.value is not None
+        ):
+            targets = (
+                stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+            )
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    self.values[target.id] = stmt.value
+                    self._bind(target.id)
+                else:
+                    self._bind_stored(target)
+        else:
+            self._bind_stored(stmt)
+
+    def _bind_stored(self, node: ast.AST) -> None:
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name) and isinstance(
+                child.ctx, ast.Store
+            ):
+                self._bind(child.id)
+                self.ambiguous.add(child.id)
+            elif isinstance(child, (ast.FunctionDef, ast.ClassDef)):
+                self._bind(child.name)
+                self.ambiguous.add(child.name)
+
+    ##############
+    # Resolution #
+    ##############
+
+    def qualify(self, node: ast.expr) -> str:
+        """Get the qualified name a name or an attribute refers to."""
+        if isinstance(node, ast.Attribute):
+            return f"{self.qualify(node.value)}.{node.attr}"
+        if not isinstance(node, ast.Name):
+            raise Unresolved(f"Unsupported expression {ast.dump(node)}")
+        name = node.id
+        if name in self.ambiguous:
+            raise Unresolved(f"{name} is bound more than once")
+        if name in self.imports:
+            return self.imports[name]
+        if name in self.order:
+            return f"{self.modname}.{name}"
+        if name in BUILTIN_DTYPES:
+            return f"builtins.{name}"
+        raise Unresolved(f"Unknown name {name}")
+
+    def is_pandera(self, node: ast.expr, *names: str) -> bool:
+        """Tell whether a node refers to one of the given pandera names."""
+        parts = self.qualify(node).split(".")
+        return parts[0] == "pandera" and parts[-1] in names
+
+    def literal(self, node: Optional[ast.expr], default: Any = None) -> Any:
+        """Evaluate a literal, possibly bound to a module level name."""
+        if node is None:
+            return default
+        if isinstance(node, ast.Name) and node.id not in self.ambiguous:
+            if node.id in self.values:
+                return self.literal(self.values[node.id])
+        try:
+            return ast.literal_eval(node)
+        except (ValueError, TypeError, SyntaxError) as exc:
+            raise Unresolved(f"Not a literal: {ast.dump(node)}") from exc
+
+    def stringify(self, node: Optional[ast.expr]) -> str:
+        """Render an annotation like autodoc does."""
+        if isinstance(node, ast.Constant) and node.value is None:
+            return "None"
+        if isinstance(node, ast.Subscript):
+            elements = (
+                node.slice.elts
+                if isinstance(node.slice, ast.Tuple)
+                else [node.slice]
+            )
+            args = ", ".join(self.stringify(arg) for arg in elements)
+            return f"{self.stringify(node.value)}[{args}]"
+        if node is None:
+            raise Unresolved("Missing annotation")
+        qualname = self.qualify(node)
+        parts = qualname.split(".")
+        if (
+            parts[0] == "pandera"
+            and "typing" in parts
+            and parts[-1] in PANDERA_TYPES
+        ):
+            return f"~pandera.typing.pandas.{parts[-1]}"
+        if qualname not in ANNOTATIONS:
+            raise Unresolved(f"Unsupported annotation {qualname}")
+        return ANNOTATIONS[qualname]
+
+    def dtype(self, node: Optional[ast.expr]) -> str:
+        """Name a data type like pandera does."""
+        if node is None or (
+            isinstance(node, ast.Constant) and node.value is None
+        ):
+            return "None"
+        if isinstance(node, ast.Constant) and node.value in STRING_DTYPES:
+            return STRING_DTYPES[node.value]
+        qualname = self.qualify(node)
+        if qualname.startswith("builtins."):
+            return BUILTIN_DTYPES[qualname[len("builtins.") :]]
+        raise Unresolved(f"Unsupported data type {qualname}")
+
+    @staticmethod
+    def arguments(call: ast.Call) -> Dict[str, ast.expr]:
+        """Get the keyword arguments of a call."""
+        kwargs = {}
+        for keyword in call.keywords:
+            if keyword.arg is None:
+                raise Unresolved("Unsupported unpacked arguments")
+            kwargs[keyword.arg] = keyword.value
+        return kwargs
+
+    @staticmethod
+    def check_options(kwargs: Dict[str, Any], allowed: Set[str]) -> None:
+        """Make sure only known arguments are given."""
+        unknown = set(kwargs) - allowed
+        if unknown:
+            raise Unresolved(f"Unsupported arguments {sorted(unknown)}")
+
+    ###########
+    # Objects #
+    ###########
+
+    def pandera_objects(self) -> List[PanderaObject]:
+        """Find the models and schemas defined in the module, in source
+        order, whether they can be described statically or not.
+
+        """
+        found = []
+        for name in self.order:
+            if name.startswith("_") or name in self.ambiguous:
+                continue
+            try:
+                if name in self.classes and any(
+                    self.is_pandera(base, "DataFrameModel")
+                    for base in self.classes[name].bases
+                ):
+                    found.append(PanderaObject(self.modname, name, MODEL))
+                elif name in self.values and self.is_schema(self.values[name]):
+                    found.append(PanderaObject(self.modname, name, SCHEMA))
+            except Unresolved:
+                continue
+        return found
+
+    def is_schema(self, node: ast.expr) -> bool:
+        """Tell whether a node creates a schema."""
+        return isinstance(node, ast.Call) and self.is_pandera(
+            node.func, "DataFrameSchema"
+        )
+
+    def get(self, name: str) -> StaticObject:
+        """Get the model or schema defined as `name`."""
+        if name not in self._objects:
+            try:
+                self._objects[name] = self._extract(name)
+            except Unresolved as exc:
+                self._objects[name] = exc
+        obj = self._objects[name]
+        if isinstance(obj, Unresolved):
+            raise obj
+        return obj
+
+    def _extract(self, name: str) -> StaticObject:
+        if name in self.ambiguous:
+            raise Unresolved(f"{name} is bound more than once")
+        if name in self.classes:
+            return self.model(self.classes[name])
+        if name in self.values and self.is_schema(self.values[name]):
+            return self.schema(name, self.values[name])  # type: ignore
+        raise Unresolved(f"{name} is neither a model nor a schema")
+
+    ##########
+    # Schema #
+    ##########
+
+    def schema(self, name: str, call: ast.Call) -> StaticObject:
+        """Read a schema created with `DataFrameSchema(...)`."""
+        kwargs = self.arguments(call)
+        self.check_options(kwargs, SCHEMA_OPTIONS)
+        if len(call.args) > 1:
+            raise Unresolved("Unsupported positional arguments")
+        columns = call.args[0] if call.args else kwargs.get("columns")
+
+        fields = []
+        if columns is not None:
+            if not isinstance(columns, ast.Dict):
+                raise Unresolved("Columns must be a dictionary")
+            for key, value in zip(columns.keys, columns.values):
+                fields.append(
+                    self.component(value, "Column", self.literal(key))
+                )
+        fields.extend(self.index_levels(kwargs.get("index")))
+
+        description = {
+            "name": self.literal(kwargs.get("name")),
+            "title": self.literal(kwargs.get("title")),
+            "description": self.literal(kwargs.get("description")),
+            "config": {
+                "coerce": self.literal(kwargs.get("coerce"), False),
+                "ordered": self.literal(kwargs.get("ordered"), False),
+                "strict": self.literal(kwargs.get("strict"), False),
+            },
+            "fields": fields,
+            "checks": self.checks(kwargs.get("checks")),
+        }
+        return StaticObject(self.modname, name, SCHEMA, self.path, description)
+
+    def index_levels(self, node: Optional[ast.expr]) -> List[Dict[str, Any]]:
+        """Describe the named levels of the index of a schema."""
+        if node is None:
+            return []
+        if not isinstance(node, ast.Call):
+            raise Unresolved("Unsupported index")
+        if self.is_pandera(node.func, "Index"):
+            levels = [self.component(node, "Index")]
+        elif self.is_pandera(node.func, "MultiIndex"):
+            self.check_options(self.arguments(node), {"name"})
+            if len(node.args) != 1 or not isinstance(
+                node.args[0], (ast.List, ast.Tuple)
+            ):
+                raise Unresolved("Unsupported multi index")
+            levels = [self.component(n, "Index") for n in node.args[0].elts]
+        else:
+            raise Unresolved("Unsupported index")
+        return [level for level in levels if level["name"] is not None]
+
+    def component(
+        self, node: ast.expr, kind: str, name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Describe a column or an index level of a schema."""
+        if not isinstance(node, ast.Call) or not self.is_pandera(
+            node.func, kind
+        ):
+            raise Unresolved(f"Unsupported {kind.lower()}")
+        is_index = kind == "Index"
+        kwargs = self.arguments(node)
+        self.check_options(
+            kwargs, COMPONENT_OPTIONS if is_index else COLUMN_OPTIONS
+        )
+        if len(node.args) > 2:
+            raise Unresolved("Unsupported positional arguments")
+        if len(node.args) > 1:
+            kwargs["checks"] = node.args[1]
+        dtype = node.args[0] if node.args else kwargs.get("dtype")
+
+        return {
+            "name": (
+                name if name is not None else self.literal(kwargs.get("name"))
+            ),
+            "dtype": self.dtype(dtype),
+            "is_index": is_index,
+            "title": self.literal(kwargs.get("title")),
+            "description": self.literal(kwargs.get("description")),
+            "nullable": self.literal(kwargs.get("nullable"), False),
+            "unique": self.literal(kwargs.get("unique"), False),
+            "coerce": self.literal(kwargs.get("coerce"), False),
+            "required": (
+                None
+                if is_index
+                else self.literal(kwargs.get("required"), True)
+            ),
+            "checks": self.checks(kwargs.get("checks")),
+        }
+
+    def checks(self, node: Optional[ast.expr]) -> List[Dict[str, Any]]:
+        """Describe the checks given to a schema or a component."""
+        if node is None:
+            return []
+        if isinstance(node, (ast.List, ast.Tuple)):
+            return [self.check(element) for element in node.elts]
+        return [self.check(node)]
+
+    def check(self, node: ast.expr) -> Dict[str, Any]:
+        """Describe a builtin check, or a check of a module level function."""
+        if not isinstance(node, ast.Call):
+            raise Unresolved("Unsupported check")
+        kwargs = self.arguments(node)
+        parts = self.qualify(node.func).split(".")
+        if parts[0] != "pandera":
+            raise Unresolved("Unsupported check")
+
+        if len(parts) > 1 and parts[-2] == "Check":
+            return builtin_check(
+                parts[-1],
+                [self.literal(arg) for arg in node.args],
+                {key: self.literal(value) for key, value in kwargs.items()},
+            )
+        if parts[-1] != "Check":
+            raise Unresolved("Unsupported check")
+
+        self.check_options(kwargs, CUSTOM_CHECK_OPTIONS)
+        if (
+            len(node.args) != 1
+            or not isinstance(node.args[0], ast.Name)
+            or node.args[0].id not in self.functions
+            or node.args[0].id in self.ambiguous
+        ):
+            raise Unresolved("Checks must call module level functions")
+        function = self.functions[node.args[0].id]
+        return {
+            "name": self.literal(kwargs.get("name")) or function.name,
+            "error": self.literal(kwargs.get("error")),
+            "description": self.literal(kwargs.get("description")),
+            "doc": get_docstring(function),
+        }
+
+    #########
+    # Model #
+    #########
+
+    def model(self, node: ast.ClassDef) -> StaticObject:
+        """Read a model inheriting directly from `DataFrameModel`."""
+        if (
+            len(node.bases) != 1
+            or node.keywords
+            or node.decorator_list
+            or not self.is_pandera(node.bases[0], "DataFrameModel")
+        ):
+            raise Unresolved("Models must only inherit from DataFrameModel")
+
+        reader = ModelReader(self, node)
+        for stmt in node.body:
+            reader.read(stmt)
+        return reader.build()
+
+
+class ModelReader:
+    """Reads the body of a model class."""
+
+    def __init__(self, module: StaticModule, node: ast.ClassDef) -> None:
+        self.module = module
+        self.node = node
+        self.doc = get_docstring(node)
+        self.config: Dict[str, Any] = {}
+        self.members: List[StaticMember] = []
+        # private attributes, never rendered
+        self.others: List[str] = []
+        self.fields: List[Dict[str, Any]] = []
+        self.check_names: Dict[str, str] = {}
+        # checks of fields, as field name patterns and regex flag
+        self.field_checks: List[Tuple[Dict[str, Any], List[str], bool]] = []
+        self.dataframe_checks: List[Dict[str, Any]] = []
+
+    def read(self, stmt: ast.stmt) -> None:
+        """Read a statement of the model body."""
+        if isinstance(stmt, ast.Pass) or (
+            isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Constant)
+        ):
+            return
+        if isinstance(stmt, ast.ClassDef) and stmt.name == "Config":
+            self.read_config(stmt)
+        elif isinstance(stmt, ast.AnnAssign) and isinstance(
+            stmt.target, ast.Name
+        ):
+            if not stmt.target.id.startswith("_"):
+                self.read_field(stmt.target.id, stmt.annotation, stmt.value)
+            elif stmt.value is not None:
+                self.others.append(stmt.target.id)
+        elif isinstance(stmt, ast.FunctionDef):
+            self.read_method(stmt)
+        elif isinstance(stmt, ast.Assign) and all(
+            isinstance(target, ast.Name) and target.id.startswith("_")
+            for target in stmt.targets
+        ):
+            self.others.extend(target.id for target in stmt.targets)
+        else:
+            raise Unresolved("Unsupported model member")
+
+    def read_config(self, node: ast.ClassDef) -> None:
+        """Read the options of the model config."""
+        if node.keywords or node.decorator_list:
+            raise Unresolved("Unsupported model config")
+        for base in node.bases:
+            if not self.module.is_pandera(base, "BaseConfig", "Config"):
+                raise Unresolved("Unsupported model config")
+
+        values = []
+        for stmt in node.body:
+            if isinstance(stmt, ast.Pass) or (
+                isinstance(stmt, ast.Expr)
+                and isinstance(stmt.value, ast.Constant)
+            ):
+                continue
+            if isinstance(stmt, ast.Assign) and len(stmt.targets) == 1:
+                target, value = stmt.targets[0], stmt.value
+            elif isinstance(stmt, ast.AnnAssign) and stmt.value is not None:
+                target, value = stmt.target, stmt.value
+            else:
+                raise Unresolved("Unsupported model config")
+            if (
+                not isinstance(target, ast.Name)
+                or target.id not in CONFIG_OPTIONS
+            ):
+                raise Unresolved("Unsupported model config option")
+            self.config[target.id] = self.module.literal(value)
+            if target.id in DOCUMENTED_CONFIG_OPTIONS:
+                values.append((target.id, self.config[target.id]))
+
+        self.members.append(
+            StaticMember(
+                "Config", CONFIG, doc=get_docstring(node), values=tuple(values)
+            )
+        )
+
+    def read_field(
+        self, name: str, annotation: ast.expr, value: Optional[ast.expr]
+    ) -> None:
+        """Read a field from its annotation and `Field(...)` arguments."""
+        module = self.module
+        kind, dtype = FIELD, annotation
+        if isinstance(annotation, ast.Subscript):
+            if module.is_pandera(annotation.value, "Index"):
+                kind = INDEX
+            elif not module.is_pandera(annotation.value, "Series"):
+                raise Unresolved("Unsupported field annotation")
+            dtype = annotation.slice
+        if not isinstance(dtype, (ast.Name, ast.Attribute)):
+            raise Unresolved("Unsupported field data type")
+
+        kwargs: Dict[str, ast.expr] = {}
+        if value is not None:
+            if not isinstance(value, ast.Call) or not module.is_pandera(
+                value.func, "Field"
+            ):
+                raise Unresolved("Fields must be assigned a Field")
+            if value.args:
+                raise Unresolved("Unsupported positional arguments")
+            kwargs = module.arguments(value)
+            module.check_options(kwargs, FIELD_OPTIONS | set(FIELD_CHECKS))
+
+        checks = []
+        options = {
+            key: module.literal(kwargs[key])
+            for key in CHECK_OPTIONS
+            if key in kwargs
+        }
+        for key in FIELD_CHECKS:
+            if key not in kwargs:
+                continue
+            arg = module.literal(kwargs[key])
+            if arg is None:
+                continue
+            if isinstance(arg, dict):
+                checks.append(builtin_check(key, [], {**arg, **options}))
+            elif isinstance(arg, tuple):
+                checks.append(builtin_check(key, list(arg), options))
+            else:
+                checks.append(builtin_check(key, [arg], options))
+
+        field = {
+            "name": name,
+            "dtype": module.dtype(dtype),
+            "is_index": kind == INDEX,
+            "title": module.literal(kwargs.get("title")),
+            "description": module.literal(kwargs.get("description")),
+            "nullable": module.literal(kwargs.get("nullable"), False),
+            "unique": module.literal(kwargs.get("unique"), False),
+            "coerce": module.literal(kwargs.get("coerce"), False),
+            "required": None if kind == INDEX else True,
+            "checks": checks,
+            "check_name": module.literal(kwargs.get("check_name")),
+        }
+        self.fields.append(field)
+        self.members.append(
+            StaticMember(name, kind, annotation=module.stringify(annotation))
+        )
+
+    def read_method(self, node: ast.FunctionDef) -> None:
+        """Read a check method, other methods are not supported."""
+        module = self.module
+        decorators = [
+            decorator
+            for decorator in node.decorator_list
+            if not (
+                isinstance(decorator, ast.Name)
+                and decorator.id == "classmethod"
+            )
+        ]
+        if len(decorators) != 1:
+            raise Unresolved("Unsupported model method")
+        decorator = decorators[0]
+        call = decorator if isinstance(decorator, ast.Call) else None
+        func = call.func if call else decorator
+
+        if module.is_pandera(func, "check") and call is not None:
+            kind = CHECK
+        elif module.is_pandera(func, "dataframe_check"):
+            kind = DATAFRAME_CHECK
+        else:
+            raise Unresolved("Unsupported model method")
+
+        kwargs = module.arguments(call) if call else {}
+        module.check_options(kwargs, CUSTOM_CHECK_OPTIONS | {"regex"})
+        doc = get_docstring(node)
+        check = {
+            "name": module.literal(kwargs.get("name")) or node.name,
+            "error": module.literal(kwargs.get("error")),
+            "description": module.literal(kwargs.get("description"), doc),
+            "doc": None,
+        }
+        if kind == CHECK:
+            patterns = [module.literal(arg) for arg in call.args]  # type: ignore
+            regex = module.literal(kwargs.get("regex"), False)
+            self.field_checks.append((check, patterns, regex))
+        else:
+            self.dataframe_checks.append(check)
+
+        signature, annotation = self.signature(node)
+        self.members.append(
+            StaticMember(
+                node.name,
+                kind,
+                annotation=annotation,
+                signature=signature,
+                doc=doc,
+            )
+        )
+
+    def signature(self, node: ast.FunctionDef) -> Tuple[str, Optional[str]]:
+        """Render the arguments and the return annotation of a check."""
+        args = node.args
+        if (
+            args.posonlyargs
+            or args.vararg
+            or args.kwonlyargs
+            or args.kwarg
+            or args.defaults
+            or not args.args
+        ):
+            raise Unresolved("Unsupported check signature")
+
+        rendered = []
+        for arg in args.args[1:]:  # skip cls
+            if arg.annotation is None:
+                rendered.append(arg.arg)
+            else:
+                annotation = self.module.stringify(arg.annotation)
+                rendered.append(f"{arg.arg}: {annotation}")
+        returns = self.module.stringify(node.returns) if node.returns else None
+        return f"({', '.join(rendered)})", returns
+
+    def build(self) -> StaticObject:
+        """Describe the model like `metadata.describe_model` does."""
+        if not any(member.kind == CONFIG for member in self.members):
+            # pandera generates the config of models defining none, it is
+            # documented from pandera itself
+            raise Unresolved("Models must define their config")
+
+        names = [field["name"] for field in self.fields]
+        index_count = sum(field["is_index"] for field in self.fields)
+        coerce = bool(self.config.get("coerce", False))
+
+        for field in self.fields:
+            check_name = field.pop("check_name")
+            if (
+                field["is_index"]
+                and index_count == 1
+                and check_name is not True
+            ):
+                raise Unresolved("Unnamed index fields are not supported")
+            if check_name is False:
+                raise Unresolved("Unnamed index fields are not supported")
+            if (
+                field["nullable"]
+                and (field["coerce"] or coerce)
+                and field["dtype"] in NULLABLE_COERCED_DTYPES
+            ):
+                raise Unresolved("Nullable data types are not supported")
+
+        for check, patterns, regex in self.field_checks:
+            if regex:
+                matched = {
+                    name
+                    for pattern in patterns
+                    for name in names
+                    if re.match(pattern, name)
+                }
+            else:
+                matched = set(patterns)
+            if matched - set(names):
+                raise Unresolved("Check of an unknown field")
+            for field in self.fields:
+                if field["name"] in matched:
+                    field["checks"].append(dict(check))
+
+        # columns come before index levels, like in schemas
+        fields = [f for f in self.fields if not f["is_index"]]
+        fields.extend(f for f in self.fields if f["is_index"])
+
+        name = self.node.name
+        description: Dict[str, Any] = {
+            "name": self.config.get("name", name),
+            "title": self.config.get("title"),
+            "description": self.config.get("description") or self.doc,
+            "config": {
+                "coerce": self.config.get("coerce", False),
+                "ordered": self.config.get("ordered", False),
+                "strict": self.config.get("strict", False),
+            },
+            "fields": fields,
+            "checks": self.dataframe_checks,
+        }
+        description["members"] = {
+            **dict.fromkeys(self.others, OTHER),
+            **{member.name: member.kind for member in self.members},
+        }
+        # only models inheriting directly from DataFrameModel are read
+        description["inherited"] = {}
+        description["check_refs"] = {
+            check_name: f"{self.module.modname}.{name}.{check_name}"
+            for check_name in index_checks(description)
+        }
+        return StaticObject(
+            self.module.modname,
+            name,
+            MODEL,
+            self.module.path,
+            description,
+            doc=self.doc,
+            members=tuple(self.members),
+        )
+
+
+# Modules read from source, by path, with the time they were modified
+_modules: Dict[Path, Tuple[int, StaticModule]] = {}
+
+
+def read_module(modname: str, path: Path) -> StaticModule:
+    """Read a module, reading it again only once modified."""
+    mtime = path.stat().st_mtime_ns
+    entry = _modules.get(path)
+    if entry is None or entry[0] != mtime or entry[1].modname != modname:
+        entry = _modules[path] = (mtime, StaticModule(modname, path))
+    return entry[1]
+
+
+def get_static_object(modname: str, objpath: str) -> Optional[StaticObject]:
+    """Read a model or a schema from the source of its module.
+
+    Returns None when the object cannot be described statically, in which
+    case it has to be imported.
+
+    """
+    path = find_source(modname)
+    if path is None or "." in objpath:
+        return None
+    try:
+        return read_module(modname, path).get(objpath)
+    except (Unresolved, SyntaxError, OSError, ValueError) as exc:
+        logger.debug(
+            "[sphinx-pandera] importing %s.%s: %s", modname, objpath, exc
+        )
+        return None
+
+
+def iter_static_modules(
+    modname: str, path: Path
+) -> Iterator[Tuple[str, Path]]:
+    """Iterate over a module, and each module of the package it is, with
+    their source file.
+
+    """
+    yield modname, path
+    if path.name != "__init__.py":
+        return
+    for entry in sorted(path.parent.iterdir()):
+        if entry.suffix == ".py" and entry.stem != "__init__":
+            if entry.stem.isidentifier():
+                yield f"{modname}.{entry.stem}", entry
+        elif (entry / "__init__.py").is_file() and entry.name.isidentifier():
+            yield from iter_static_modules(
+                f"{modname}.{entry.name}", entry / "__init__.py"
+            )
+
+
+def discover_static(modname: str) -> Optional[List[PanderaObject]]:
+    """Find the models and schemas of a module, or of all the modules of a
+    package, from their source.
+
+    Returns None when a source cannot be read, in which case modules have to
+    be imported.
+
+    """
+    path = find_source(modname)
+    if path is None:
+        return None
+    found = []
+    try:
+        for name, source in iter_static_modules(modname, path):
+            found.extend(read_module(name, source).pandera_objects())
+    except (SyntaxError, OSError, ValueError) as exc:
+        logger.debug("[sphinx-pandera] importing %s: %s", modname, exc)
+        return None
+    return found
@@ -0,0 +1,99 @@
+/* Load the details of pandera fields when they are expanded. */
+"use strict";
+
+(() => {
+  const root = document.documentElement.dataset.content_root || "";
+  // data files being fetched or fetched, by name
+  const files = new Map();
+
+  const load = (name) => {
+    if (!files.has(name)) {
+      const url = `${root}_static/pandera/${name}.json`;
+      files.set(
+        name,
+        fetch(url).then((response) => {
+          if (!response.ok) {
+            throw new Error(`${url}: ${response.status}`);
+          }
+          return response.json();
+        }),
+      );
+    }
+    return files.get(name);
+  };
+
+  const element = (tag, text) => {
+    const node = document.createElement(tag);
+    if (text !== undefined) {
+      node.textContent = text;
+    }
+    return node;
+  };
+
+  const section = (title, items) => {
+    const fragment = document.createDocumentFragment();
+    fragment.append(element("p", title));
+    const list = element("ul");
+    list.append(...items);
+    fragment.append(list);
+    return fragment;
+  };
+
+  const check = ({ name, error, url }) => {
+    const item = element("li");
+    if (error) {
+      item.append(element("strong", error));
+    } else if (url) {
+      const link = element("a");
+      link.href = `${root}${url}`;
+      link.append(element("code", name));
+      item.append(link);
+    } else {
+      item.append(element("code", name));
+    }
+    return item;
+  };
+
+  const render = (details, field) => {
+    const content = element("div");
+    content.className = "pandera-field-details";
+    if (field.description) {
+      content.append(element("p", field.description));
+    }
+    const constraints = Object.entries(field.constraints).map(
+      ([key, value]) => {
+        const item = element("li");
+        item.append(element("strong", key), ` = ${value}`);
+        return item;
+      },
+    );
+    content.append(section("Constraints:", constraints));
+    if (field.checks.length) {
+      content.append(section("Validated by:", field.checks.map(check)));
+    }
+    details.append(content);
+  };
+
+  document.addEventListener(
+    "toggle",
+    (event) => {
+      const details = event.target;
+      if (
+        !details.open ||
+        !details.classList.contains("pandera-field") ||
+        details.dataset.loaded
+      ) {
+        return;
+      }
+      details.dataset.loaded = "true";
+      load(details.dataset.fields)
+        .then((fields) => render(details, fields[details.dataset.field]))
+        .catch((error) => {
+          delete details.dataset.loaded;
+          details.append(element("p", `Cannot load details: ${error}`));
+        });
+    },
+    // toggle events do not bubble
+    true,
+  );
+})();
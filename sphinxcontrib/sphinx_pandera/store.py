@@ -0,0 +1,391 @@
+"""Storage of pandera descriptions outside of the build process."""
+
+import ast
+import hashlib
+import importlib.util
+import json
+import os
+import sqlite3
+import sys
+import sysconfig
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from sphinx.util import logging
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the layout of descriptions changes
+CACHE_VERSION = "2"
+
+# Directories of the standard library and of installed packages, whose
+# modules are not part of the documented project
+LIBRARY_PATHS = tuple(
+    {
+        Path(path).resolve()
+        for name, path in sysconfig.get_paths().items()
+        if name in {"stdlib", "platstdlib", "purelib", "platlib"}
+    }
+)
+
+# Project modules imported by each module, with the modification time of
+# the source they were read from
+_imports: Dict[str, Tuple[int, List[str]]] = {}
+
+# Seconds a process waits for another one writing to the shared store, or
+# describing an object it claimed
+STORE_TIMEOUT = 30
+
+# Seconds between two reads of an object claimed by another process
+CLAIM_POLL = 0.05
+
+# Connection of the process to each shared store, with the process it was
+# opened by: connections inherited by forked readers are not reused
+_connections: Dict[Path, Tuple[int, sqlite3.Connection]] = {}
+
+
+def source_key(modnames: Iterable[str]) -> Optional[str]:
+    """Compute a key identifying the source of the given modules, together
+    with the pandera version which extracted descriptions from them.
+
+    Returns None when the source of a module cannot be read, in which case
+    descriptions extracted from it must not be stored.
+
+    """
+    digest = hashlib.sha256(CACHE_VERSION.encode())
+    digest.update(
+        getattr(sys.modules.get("pandera"), "__version__", "").encode()
+    )
+
+    for modname in sorted(set(modnames)):
+        filename = getattr(sys.modules.get(modname), "__file__", None)
+        if filename is None:
+            return None
+        try:
+            digest.update(modname.encode())
+            digest.update(Path(filename).read_bytes())
+        except OSError:
+            return None
+
+    return digest.hexdigest()
+
+
+def get_source_modules(obj: Any, modname: str) -> List[str]:
+    """Get the modules whose source defines a documented object: the module
+    of a schema, or the modules of a model and of its user defined bases,
+    then the project modules they import, directly or not.
+
+    Constants, checks and types imported from other modules of the project
+    change the description of an object as much as its own module does.
+
+    """
+    if not isinstance(obj, type):
+        return get_project_imports([modname])
+    return get_project_imports(
+        [
+            cls.__module__
+            for cls in obj.__mro__
+            if cls.__module__.split(".", 1)[0]
+            not in {"builtins", "typing", "pandera"}
+        ]
+    )
+
+
+def get_project_imports(modnames: Iterable[str]) -> List[str]:
+    """Get the given modules, in order, followed by the project modules they
+    import, directly or not.
+
+    """
+    found = list(dict.fromkeys(modnames))
+    for modname in found:
+        for imported in get_imported_modules(modname):
+            if imported not in found:
+                found.append(imported)
+    return found
+
+
+def is_project_module(modname: str) -> bool:
+    """Tell whether a module is imported from a source file of the project,
+    rather than from the standard library or an installed package.
+
+    """
+    filename = getattr(sys.modules.get(modname), "__file__", None)
+    if filename is None:
+        return False
+    path = Path(filename).resolve()
+    return not any(path.is_relative_to(library) for library in LIBRARY_PATHS)
+
+
+def get_imported_modules(modname: str) -> List[str]:
+    """Get the project modules imported by the source of a module, once per
+    version of the source.
+
+    """
+    module = sys.modules.get(modname)
+    filename = getattr(module, "__file__", None)
+    if filename is None or not is_project_module(modname):
+        return []
+    try:
+        mtime = os.stat(filename).st_mtime_ns
+        cached = _imports.get(modname)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        tree = ast.parse(Path(filename).read_bytes(), filename)
+    except (OSError, SyntaxError, ValueError):
+        return []
+
+    names = []
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.extend(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            try:
+                base = importlib.util.resolve_name(
+                    "." * node.level + (node.module or ""),
+                    getattr(module, "__package__", None),
+                )
+            except (ImportError, ValueError):
+                continue
+            names.append(base)
+            # imported names may be submodules
+            names.extend(f"{base}.{alias.name}" for alias in node.names)
+
+    imported = [
+        name
+        for name in dict.fromkeys(names)
+        if name != modname and is_project_module(name)
+    ]
+    _imports[modname] = (mtime, imported)
+    return imported
+
+
+class DiskCache:
+    """Stores descriptions as JSON files in a directory, one per object.
+
+    Each file also holds the key it was stored with: a description is only
+    served when the key computed for the current sources matches.
+
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def path(self, name: str) -> Path:
+        """Path of the file storing the description of object `name`."""
+        return self.directory / f"{name}.json"
+
+    def get(self, name: str, key: str) -> Optional[Dict[str, Any]]:
+        """Get the description of object `name` stored with `key`."""
+        try:
+            with self.path(name).open(encoding="utf-8") as file:
+                stored = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if stored.get("key") != key:
+            return None
+        return stored["description"]
+
+    def put(self, name: str, key: str, description: Dict[str, Any]) -> None:
+        """Store the description of object `name` with `key`."""
+        try:
+            payload = json.dumps({"key": key, "description": description})
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # write then rename, so that concurrent builds never read
+            # partially written files
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=self.directory,
+                suffix=".tmp",
+                delete=False,
+            ) as file:
+                file.write(payload)
+            os.replace(file.name, self.path(name))
+        except (OSError, TypeError, ValueError) as exc:
+            logger.warning(
+                "[sphinx-pandera] cannot cache description of %s: %s",
+                name,
+                exc,
+            )
+
+
+class SharedStore:
+    """Stores descriptions in an SQLite database shared by the processes
+    reading documents in parallel, one row per object.
+
+    The first process asking for an object claims it, describes it and
+    publishes its description: the other ones wait for the description
+    instead of describing the object again. The database only lives for one
+    build, it is reset when the next one starts. Like files of the disk
+    cache, rows hold the key they were stored with. Each process opens its
+    own connection once, as connections must not be inherited by the readers
+    forked after the build process opened them.
+
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def reset(self) -> None:
+        """Delete the database and its journal, if any."""
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            Path(f"{self.path}{suffix}").unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Close the connection of the process to the database, if any."""
+        opened = _connections.pop(self.path, None)
+        if opened is not None and opened[0] == os.getpid():
+            opened[1].close()
+
+    def connect(self) -> sqlite3.Connection:
+        """Get the connection of the process to the database, creating the
+        database if needed.
+
+        """
+        opened = _connections.get(self.path)
+        if opened is not None and opened[0] == os.getpid():
+            return opened[1]
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(
+            self.path, timeout=STORE_TIMEOUT, isolation_level=None
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS descriptions "
+            "(name TEXT PRIMARY KEY, key TEXT, description TEXT)"
+        )
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS claims "
+            "(name TEXT, key TEXT, pid INTEGER, PRIMARY KEY (name, key))"
+        )
+        _connections[self.path] = (os.getpid(), connection)
+        return connection
+
+    def get(self, name: str, key: str) -> Optional[Dict[str, Any]]:
+        """Get the description of object `name` stored with `key`.
+
+        Returns None when the process claimed the object, and must describe
+        it, or when the process which claimed it did not publish its
+        description in time.
+
+        """
+        deadline = time.monotonic() + STORE_TIMEOUT
+        try:
+            connection = self.connect()
+            while True:
+                row = connection.execute(
+                    "SELECT description FROM descriptions "
+                    "WHERE name = ? AND key = ?",
+                    (name, key),
+                ).fetchone()
+                if row:
+                    return json.loads(row[0])
+                if self.claim(connection, name, key):
+                    return None
+                if time.monotonic() > deadline:
+                    logger.warning(
+                        "[sphinx-pandera] description of %s not shared in "
+                        "time, describing it again",
+                        name,
+                    )
+                    return None
+                time.sleep(CLAIM_POLL)
+        except (OSError, sqlite3.Error):
+            return None
+
+    @staticmethod
+    def claim(connection: sqlite3.Connection, name: str, key: str) -> bool:
+        """Claim an object for the process, unless a live process did."""
+        pid = os.getpid()
+        cursor = connection.execute(
+            "INSERT OR IGNORE INTO claims VALUES (?, ?, ?)", (name, key, pid)
+        )
+        if cursor.rowcount:
+            return True
+        row = connection.execute(
+            "SELECT pid FROM claims WHERE name = ? AND key = ?", (name, key)
+        ).fetchone()
+        if row is None or row[0] == pid:
+            return row is not None
+        try:
+            os.kill(row[0], 0)
+        except ProcessLookupError:
+            # the owner died without publishing the description
+            connection.execute(
+                "DELETE FROM claims WHERE name = ? AND key = ? AND pid = ?",
+                (name, key, row[0]),
+            )
+        except OSError:
+            pass
+        return False
+
+    def release(self, name: str, key: str) -> None:
+        """Give up the claim of the process on an object it failed to
+        describe, so that another process describes it.
+
+        """
+        try:
+            self.connect().execute(
+                "DELETE FROM claims WHERE name = ? AND key = ? AND pid = ?",
+                (name, key, os.getpid()),
+            )
+        except (OSError, sqlite3.Error):
+            pass
+
+    def put(self, name: str, key: str, description: Dict[str, Any]) -> None:
+        """Store the description of object `name` with `key`."""
+        try:
+            payload = json.dumps(description)
+            self.connect().execute(
+                "INSERT OR REPLACE INTO descriptions VALUES (?, ?, ?)",
+                (name, key, payload),
+            )
+        except (OSError, sqlite3.Error, TypeError, ValueError) as exc:
+            logger.warning(
+                "[sphinx-pandera] cannot share description of %s: %s",
+                name,
+                exc,
+            )
+
+
+class MemoryStore:
+    """Stores descriptions in memory, for all the builds run by the process.
+
+    Entries outlive the build environment, so that processes rebuilding the
+    documentation, like watchers building in process, only describe the
+    objects whose sources changed. Like files of the disk cache, entries hold
+    the key they were stored with.
+
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, name: str, key: str) -> Optional[Dict[str, Any]]:
+        """Get the description of object `name` stored with `key`."""
+        stored = self._entries.get(name)
+        if stored is None or stored[0] != key:
+            return None
+        return stored[1]
+
+    def put(self, name: str, key: str, description: Dict[str, Any]) -> None:
+        """Store the description of object `name` with `key`."""
+        self._entries[name] = (key, description)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+# Descriptions kept by the process across builds
+MEMORY_STORE = MemoryStore()
+
+# Storage read and written by the schema cache
+Store = Union[DiskCache, SharedStore, MemoryStore]
@@ -0,0 +1 @@
+"""Scalability benchmarks of the pandera documenters."""
@@ -0,0 +1,94 @@
+"""Fixtures measuring the documentation of synthetic objects."""
+
+# pylint: disable=redefined-outer-name
+
+import json
+import shutil
+import sys
+import tracemalloc
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, Dict, List
+
+import pytest
+
+from tests.benchmarks.synthetic import Case
+
+# Results of the benchmarks run in the session
+RESULTS: List[Dict[str, Any]] = []
+
+
+@pytest.fixture(scope="function")
+def case_app(make_app, sphinx_test_tempdir):
+    """Create callable which returns a sphinx application documenting a
+    synthetic case, whose module is imported anew by each benchmark.
+
+    """
+    modnames = []
+
+    def create(case: Case):
+        srcdir = sphinx_test_tempdir / "benchmarks" / case.modname
+        shutil.rmtree(srcdir, ignore_errors=True)
+        case.write(srcdir)
+        sys.modules.pop(case.modname, None)
+        modnames.append(case.modname)
+        return make_app("html", srcdir=srcdir)
+
+    yield create
+
+    for modname in modnames:
+        sys.modules.pop(modname, None)
+
+
+@pytest.fixture(scope="function")
+def pandera_benchmark():
+    """Create callable which runs a benchmark and records its wall time,
+    its peak of memory allocated by Python and the size of its output.
+
+    Memory is traced while timing, so times include the tracing overhead.
+
+    """
+
+    def run(case: Case, target: str, func: Callable[[], int]) -> int:
+        tracemalloc.start()
+        start = perf_counter()
+        try:
+            size = func()
+            elapsed = perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        RESULTS.append(
+            {
+                "case": case.modname,
+                "target": target,
+                "fields": case.fields,
+                "seconds": elapsed,
+                "peak_memory": peak,
+                "output_size": size,
+            }
+        )
+        return size
+
+    return run
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not RESULTS:
+        return
+    path = Path(config.getoption("--pandera-benchmark-report"))
+    path.write_text(json.dumps(RESULTS, indent=2), encoding="utf-8")
+
+    terminalreporter.section("benchmarks")
+    terminalreporter.write_line(
+        f"{'case':<28} {'target':<8} {'fields':>7} {'seconds':>9} "
+        f"{'peak MiB':>9} {'output KiB':>11}"
+    )
+    for result in RESULTS:
+        terminalreporter.write_line(
+            f"{result['case']:<28} {result['target']:<8} "
+            f"{result['fields']:>7} {result['seconds']:>9.3f} "
+            f"{result['peak_memory'] / 2**20:>9.1f} "
+            f"{result['output_size'] / 2**10:>11.1f}"
+        )
+    terminalreporter.write_line(f"results written to {path}")
@@ -0,0 +1,173 @@
+"""Sources of synthetic pandera models and schemas, of increasing size."""
+
+from pathlib import Path
+from typing import List, NamedTuple, Tuple
+
+HEADER = '''"""Synthetic pandera objects generated for benchmarks."""
+
+import pandera.pandas as pa
+from pandera.typing import Index, Series
+'''
+
+CONF = """import os
+import sys
+
+sys.path.insert(0, os.path.abspath("."))
+
+extensions = [
+    "sphinx.ext.autodoc",
+    "sphinxcontrib.sphinx_pandera",
+]
+"""
+
+
+class Case(NamedTuple):
+    """A generated module, the objects it defines by documenter, the number
+    of fields they have and the options they are documented with.
+
+    """
+
+    modname: str
+    source: str
+    objects: List[Tuple[str, str]]
+    fields: int
+    options: Tuple[Tuple[str, str], ...] = ()
+
+    def write(self, srcdir: Path) -> None:
+        """Write the module in a Sphinx project documenting its objects."""
+        srcdir.mkdir(parents=True, exist_ok=True)
+        (srcdir / "conf.py").write_text(CONF, encoding="utf-8")
+        (srcdir / f"{self.modname}.py").write_text(
+            self.source, encoding="utf-8"
+        )
+        options = "".join(
+            f"   :{option}: {value}\n" for option, value in self.options
+        )
+        directives = "\n".join(
+            f".. auto{documenter}:: {self.modname}.{name}\n{options}"
+            for documenter, name in self.objects
+        )
+        (srcdir / "index.rst").write_text(
+            f"Benchmark\n=========\n\n{directives}", encoding="utf-8"
+        )
+
+
+def field(name: str, i: int, annotation: str = "Series") -> str:
+    """Source of a model field with builtin checks."""
+    return (
+        f"    {name}: {annotation}[int] = pa.Field(\n"
+        f'        ge=0, le={i + 1000}, title="{name}",\n'
+        f'        description="Synthetic field number {i}",\n'
+        "    )\n"
+    )
+
+
+def wide_model(columns: int) -> Case:
+    """A model with many columns."""
+    modname = f"wide_model_{columns}"
+    fields = "".join(field(f"col_{i}", i) for i in range(columns))
+    source = (
+        f"{HEADER}\n\nclass WideModel(pa.DataFrameModel):\n"
+        f'    """Model with {columns} columns."""\n\n'
+        f"{fields}\n"
+        "    class Config:\n"
+        "        strict = True\n"
+        "        coerce = True\n"
+    )
+    return Case(modname, source, [("pandera_model", "WideModel")], columns)
+
+
+def wide_schema(columns: int) -> Case:
+    """A schema with many columns, indexed by a named index."""
+    modname = f"wide_schema_{columns}"
+    fields = "".join(
+        f'        "col_{i}": pa.Column(\n'
+        f"            int, [pa.Check.ge(0), pa.Check.le({i + 1000})],\n"
+        f'            title="col_{i}",\n'
+        f'            description="Synthetic column number {i}",\n'
+        "        ),\n"
+        for i in range(columns)
+    )
+    source = (
+        f"{HEADER}\n\nwide_schema = pa.DataFrameSchema(\n"
+        f"    {{\n{fields}    }},\n"
+        '    index=pa.Index(int, name="id"),\n'
+        "    strict=True,\n"
+        f'    description="Schema with {columns} columns",\n'
+        ")\n"
+    )
+    return Case(
+        modname, source, [("pandera_schema", "wide_schema")], columns + 1
+    )
+
+
+def multi_index_model(levels: int) -> Case:
+    """A model indexed by many levels."""
+    modname = f"multi_index_model_{levels}"
+    fields = "".join(
+        field(f"level_{i}", i, annotation="Index") for i in range(levels)
+    )
+    fields += "".join(field(f"col_{i}", i) for i in range(10))
+    source = (
+        f"{HEADER}\n\nclass MultiIndexModel(pa.DataFrameModel):\n"
+        f'    """Model indexed by {levels} levels."""\n\n'
+        f"{fields}"
+    )
+    return Case(
+        modname, source, [("pandera_model", "MultiIndexModel")], levels + 10
+    )
+
+
+def checked_model(checks: int) -> Case:
+    """A model whose columns are each validated by a custom check, with
+    dataframe wide checks.
+
+    """
+    modname = f"checked_model_{checks}"
+    fields = "".join(field(f"col_{i}", i) for i in range(checks))
+    methods = "".join(
+        f'\n    @pa.check("col_{i}")\n'
+        f"    @classmethod\n"
+        f"    def check_{i}(cls, series: Series[int]) -> Series[bool]:\n"
+        f'        """Custom check number {i}."""\n'
+        f"        return series < {i + 1000}\n"
+        for i in range(checks)
+    )
+    methods += "".join(
+        "\n    @pa.dataframe_check\n"
+        "    @classmethod\n"
+        f"    def dataframe_check_{i}(cls, df):\n"
+        f'        """Dataframe check number {i}."""\n'
+        "        return df.notna()\n"
+        for i in range(max(checks // 10, 1))
+    )
+    source = (
+        f"{HEADER}\n\nclass CheckedModel(pa.DataFrameModel):\n"
+        f'    """Model with {checks} custom checks."""\n\n'
+        f"{fields}{methods}"
+    )
+    return Case(modname, source, [("pandera_model", "CheckedModel")], checks)
+
+
+def deep_model(depth: int) -> Case:
+    """A model at the end of a chain of models, each adding a column,
+    documented with its inherited columns.
+
+    """
+    modname = f"deep_model_{depth}"
+    classes = []
+    for i in range(depth):
+        base = f"Level{i - 1}" if i else "pa.DataFrameModel"
+        classes.append(
+            f"\n\nclass Level{i}({base}):\n"
+            f'    """Model number {i} of the chain."""\n\n'
+            f"{field(f'col_{i}', i)}"
+        )
+    source = f"{HEADER}{''.join(classes)}"
+    return Case(
+        modname,
+        source,
+        [("pandera_model", f"Level{depth - 1}")],
+        depth,
+        (("inherited-members", "DataFrameModel"),),
+    )
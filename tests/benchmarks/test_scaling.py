@@ -0,0 +1,70 @@
+import pytest
+
+from tests.benchmarks.synthetic import (
+    checked_model,
+    deep_model,
+    multi_index_model,
+    wide_model,
+    wide_schema,
+)
+from tests.conftest import do_autodoc
+
+pytestmark = pytest.mark.pandera_benchmark
+
+# Sizes run by default, then sizes only run on request, which take minutes
+COLUMNS = [10, 100, 300]
+LEVELS = [2, 5, 10]
+CHECKS = [10, 100]
+DEPTHS = [5, 25]
+LARGE_COLUMNS = [1_000, 10_000]
+LARGE_CHECKS = [1_000]
+LARGE_DEPTHS = [100]
+
+large = pytest.mark.pandera_benchmark_large
+
+CASES = [
+    *(wide_model(columns) for columns in COLUMNS),
+    *(wide_schema(columns) for columns in COLUMNS),
+    *(multi_index_model(levels) for levels in LEVELS),
+    *(checked_model(checks) for checks in CHECKS),
+    *(deep_model(depth) for depth in DEPTHS),
+    *(
+        pytest.param(case, marks=large)
+        for case in [
+            *(wide_model(columns) for columns in LARGE_COLUMNS),
+            *(wide_schema(columns) for columns in LARGE_COLUMNS),
+            *(checked_model(checks) for checks in LARGE_CHECKS),
+            *(deep_model(depth) for depth in LARGE_DEPTHS),
+        ]
+    ),
+]
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda case: case.modname)
+def test_autodoc(case_app, pandera_benchmark, case):
+    app = case_app(case)
+    lines = []
+
+    def run():
+        for documenter, name in case.objects:
+            object_path = f"{case.modname}.{name}"
+            options = dict(case.options)
+            lines.extend(do_autodoc(app, documenter, object_path, options))
+        return sum(len(line) + 1 for line in lines)
+
+    pandera_benchmark(case, "autodoc", run)
+
+    fields = [line for line in lines if ".. py:pandera_field::" in line]
+    assert len(fields) == case.fields
+
+
+@pytest.mark.parametrize("case", CASES, ids=lambda case: case.modname)
+def test_html_build(case_app, pandera_benchmark, case):
+    app = case_app(case)
+
+    def run():
+        app.build()
+        return (app.outdir / "index.html").stat().st_size
+
+    assert pandera_benchmark(case, "html", run) > 0
+    assert not app._warning.getvalue()  # pylint: disable=protected-access
@@ -3,6 +3,7 @@
 # pylint: disable=redefined-outer-name
 
 import shutil
+import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 from unittest.mock import Mock
@@ -22,6 +23,56 @@ pytest_plugins = "sphinx.testing.fixtures"  # pylint: disable=invalid-name
 # Inspired from https://github.com/mansenfranzen/autodoc_pydantic/blob/1d14f120373e481023de889711210f4d2a2b853c/tests/conftest.py
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--pandera-benchmark",
+        action="store_true",
+        help="run the scalability benchmarks",
+    )
+    parser.addoption(
+        "--pandera-benchmark-large",
+        action="store_true",
+        help="also run the scalability benchmarks of the largest sizes",
+    )
+    parser.addoption(
+        "--pandera-benchmark-report",
+        default="benchmark.json",
+        help="file the benchmark results are written to",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "pandera_benchmark: scalability benchmark, run with "
+        "--pandera-benchmark",
+    )
+    config.addinivalue_line(
+        "markers",
+        "pandera_benchmark_large: scalability benchmark of the largest "
+        "sizes, run with --pandera-benchmark-large",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    large = config.getoption("--pandera-benchmark-large")
+    if large:
+        return
+    if config.getoption("--pandera-benchmark"):
+        skip = pytest.mark.skip(
+            reason="largest benchmarks run with --pandera-benchmark-large"
+        )
+        keyword = "pandera_benchmark_large"
+    else:
+        skip = pytest.mark.skip(
+            reason="benchmarks run with --pandera-benchmark"
+        )
+        keyword = "pandera_benchmark"
+    for item in items:
+        if keyword in item.keywords:
+            item.add_marker(skip)
+
+
 @pytest.fixture(scope="session")
 def rootdir() -> Path:
     return Path(__file__).parent.resolve() / "test-docs"
@@ -151,3 +202,27 @@ def autodocument(test_app):
         )
 
     return _auto
+
+
+def unload_modules(package: str) -> None:
+    """Forget the modules of a package, to import them again as a new process
+    would.
+
+    """
+    for modname in [
+        name
+        for name in sys.modules
+        if name == package or name.startswith(f"{package}.")
+    ]:
+        del sys.modules[modname]
+
+
+@pytest.fixture(scope="function")
+def fresh_imports():
+    """Import the modules of the `imports` test application afresh, as the
+    tests edit their sources.
+
+    """
+    unload_modules("scores")
+    yield
+    unload_modules("scores")
@@ -0,0 +1,30 @@
+import pandera.pandas as pa
+from pandera.typing import Series
+
+
+class AuditModel(pa.DataFrameModel):
+    """
+    Base data model with audit columns
+    """
+
+    # pylint: disable=too-few-public-methods,no-self-argument
+    class Config:
+        strict = True
+
+    created_at: Series[str] = pa.Field(title="Creation date")
+    updated_at: Series[str] = pa.Field(title="Update date")
+
+    @pa.check("created_at", name="check_created_at")
+    def check_created_at(cls, created_at: Series[str]) -> Series[bool]:
+        """
+        Creation dates are set
+        """
+        return created_at.notna()
+
+
+class OrderModel(AuditModel):
+    """
+    Data model inheriting audit columns
+    """
+
+    amount: Series[float] = pa.Field(title="Amount")
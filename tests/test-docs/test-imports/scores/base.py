@@ -0,0 +1,20 @@
+import pandera.pandas as pa
+from pandera.typing import Series
+from scores.consts import MAX_SCORE
+
+
+class ScoreModel(pa.DataFrameModel):
+    """
+    Scores of rated items
+    """
+
+    # pylint: disable=too-few-public-methods
+    class Config:
+        strict = True
+
+    score: Series[int] = pa.Field(
+        title="Score",
+        description="Score of the item",
+        ge=0,
+        le=MAX_SCORE,
+    )
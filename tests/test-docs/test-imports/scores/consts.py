@@ -0,0 +1 @@
+MAX_SCORE = 10
@@ -0,0 +1,19 @@
+import pandera.pandas as pa
+from pandera.typing import Series
+from scores.rating import RatingModel
+
+
+class DetailedRatingModel(RatingModel):
+    """
+    Ratings with the comment of the reviewer
+    """
+
+    # pylint: disable=too-few-public-methods
+    class Config:
+        strict = True
+
+    comment: Series[str] = pa.Field(
+        title="Comment",
+        description="Comment of the reviewer",
+        nullable=True,
+    )
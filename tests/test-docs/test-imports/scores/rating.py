@@ -0,0 +1,18 @@
+import pandera.pandas as pa
+from pandera.typing import Series
+from scores.base import ScoreModel
+
+
+class RatingModel(ScoreModel):
+    """
+    Ratings of items by reviewers
+    """
+
+    # pylint: disable=too-few-public-methods
+    class Config:
+        strict = True
+
+    reviewer: Series[str] = pa.Field(
+        title="Reviewer",
+        description="Name of the reviewer",
+    )
@@ -0,0 +1,13 @@
+import pandera.pandas as pa
+from scores import consts
+
+score_schema = pa.DataFrameSchema(
+    {
+        "score": pa.Column(
+            int,
+            checks=pa.Check.le(consts.MAX_SCORE),
+            title="Score",
+            description="Score of the item",
+        ),
+    }
+)
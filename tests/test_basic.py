@@ -110,7 +110,7 @@ import pytest
                 "         - **coerce** = False",
                 "         - **required** = True",
                 "      :Validated by:",
-                "         - :py:obj:`check_num_finess_format "
+                "         - :pandera:check:`check_num_finess_format "
                 "<target.check_model.TestModel.check_num_finess_format>`",
                 "",
                 "   .. py:pandera_field:: TestModel.num_finess_ej",
@@ -127,7 +127,7 @@ import pytest
                 "         - **coerce** = False",
                 "         - **required** = True",
                 "      :Validated by:",
-                "         - :py:obj:`check_num_finess_format "
+                "         - :pandera:check:`check_num_finess_format "
                 "<target.check_model.TestModel.check_num_finess_format>`",
                 "",
                 "   .. py:pandera_field:: TestModel.latitude",
@@ -174,9 +174,9 @@ import pytest
                 "      Finess identifiers are 9 characters wide (alphanumerical)",
                 "",
                 "      :Validates:",
-                "         - :py:obj:`num_finess_et "
+                "         - :pandera:field:`num_finess_et "
                 "<target.check_model.TestModel.num_finess_et>`",
-                "         - :py:obj:`num_finess_ej "
+                "         - :pandera:field:`num_finess_ej "
                 "<target.check_model.TestModel.num_finess_ej>`",
                 "",
                 "",
@@ -360,7 +360,7 @@ def test_model(documenter, object_path, expected_rst, autodocument):
                 "         - **required** = True",
                 "",
                 "      :Validated by:",
-                "         - :py:obj:`check_num_finess_format <target.check_schema.check_num_finess_format>`",
+                "         - :pandera:check:`check_num_finess_format <target.check_schema.check_num_finess_format>`",
                 "",
                 "   .. py:pandera_field:: Evaluations.eval_code",
                 "      :type: string[python]",
@@ -463,7 +463,8 @@ def test_model(documenter, object_path, expected_rst, autodocument):
                 "      Finess identifiers are 9 characters wide (alphanumerical)",
                 "",
                 "      :Validates:",
-                "         - :py:obj:`num_finess_et`",
+                "         - :pandera:field:`num_finess_et "
+                "<target.check_schema.Evaluations.num_finess_et>`",
                 "",
                 "   .. py:pandera_check:: check_dataframe_coherence",
                 "",
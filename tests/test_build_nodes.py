@@ -0,0 +1,74 @@
+import pytest
+
+from sphinxcontrib.sphinx_pandera.directives import FIELD_NODES
+from tests.conftest import do_autodoc
+
+CONF = {"sphinx_pandera_build_nodes": True}
+
+
+def test_schema_fields_built(test_app):
+    app = test_app("basic", conf=CONF)
+
+    actual = [
+        line.strip()
+        for line in do_autodoc(
+            app, "pandera_schema", "target.check_schema.Evaluations"
+        )
+    ]
+    assert ".. py:pandera_field_nodes:: Evaluations" in actual
+    assert ":data: target.check_schema.Evaluations" in actual
+    assert not any(line.startswith(".. py:pandera_field::") for line in actual)
+    fields = app.env.temp_data[FIELD_NODES]["target.check_schema.Evaluations"]
+    assert "num_finess_et" in [field.name for field in fields]
+
+
+def test_model_fields_built(test_app):
+    app = test_app("basic", conf=CONF)
+
+    actual = [
+        line.strip()
+        for line in do_autodoc(
+            app, "pandera_model", "target.check_model.TestModel"
+        )
+    ]
+    assert ":record: target.check_model.TestModel.latitude" in actual
+    assert ":Constraints:" not in actual
+    fields = app.env.temp_data[FIELD_NODES]
+    assert fields["target.check_model.TestModel.latitude"].title == "Latitude"
+
+
+def test_built_fields_rendered(test_app):
+    app = test_app("basic", conf=CONF)
+    app.build()
+
+    html = (app.outdir / "models.html").read_text(encoding="utf-8")
+    assert "Latitude of the location of the care center" in html
+    assert "less_than_or_equal_to(90)" in html
+    html = (app.outdir / "schemas.html").read_text(encoding="utf-8")
+    assert "Constraints" in html
+    assert 'href="#target.check_schema.check_num_finess_format"' in html
+
+
+@pytest.mark.parametrize(
+    "conf",
+    [
+        {},
+        {"sphinx_pandera_split_threshold": 3, "sphinx_pandera_split_size": 2},
+    ],
+)
+def test_built_fields_consistent(test_app, conf):
+    app = test_app("basic", conf=conf)
+    app.build()
+    expected = {
+        path.relative_to(app.outdir): path.read_text(encoding="utf-8")
+        for path in app.outdir.glob("**/*.html")
+    }
+
+    app = test_app("basic", conf={**conf, **CONF})
+    app.build()
+    actual = {
+        path.relative_to(app.outdir): path.read_text(encoding="utf-8")
+        for path in app.outdir.glob("**/*.html")
+    }
+
+    assert actual == expected
@@ -0,0 +1,214 @@
+import pickle
+
+import pytest
+
+from sphinxcontrib.sphinx_pandera import cache as cache_module
+from sphinxcontrib.sphinx_pandera.cache import SchemaCache, get_schema_cache
+from tests.conftest import do_autodoc, unload_modules
+
+
+def test_model_converted_once(test_app, mocker):
+    app = test_app("basic")
+    do_autodoc(app, "pandera_model", "target.check_model.TestModel")
+
+    cache = get_schema_cache(app.env)
+    from target.check_model import (  # pylint: disable=import-outside-toplevel
+        TestModel,
+    )
+
+    to_schema = mocker.spy(TestModel, "to_schema")
+    do_autodoc(app, "pandera_model", "target.check_model.TestModel")
+
+    assert to_schema.call_count == 0
+    assert cache.schema(TestModel) is TestModel.to_schema()
+
+
+def test_reloaded_module_drops_entries():
+    class Model:  # pylint: disable=too-few-public-methods
+        @classmethod
+        def to_schema(cls):
+            return object()
+
+    first = Model
+    cache = SchemaCache()
+    schema = cache.schema(first)
+    assert cache.schema(first) is schema
+
+    class Model:  # type: ignore[no-redef]  # pylint: disable=function-redefined,too-few-public-methods
+        @classmethod
+        def to_schema(cls):
+            return object()
+
+    assert cache.schema(Model) is not schema
+    assert len(cache) == 1
+
+
+def test_cache_is_not_pickled():
+    cache = SchemaCache()
+    cache.get(SchemaCache, "value", lambda _: 1)
+
+    assert pickle.loads(pickle.dumps(cache)) is None
+
+
+def test_cache_dropped_at_build_end(test_app):
+    app = test_app("basic")
+    do_autodoc(app, "pandera_model", "target.basic_model.TestModel")
+    assert len(get_schema_cache(app.env)) > 0
+
+    app.emit("build-finished", None)
+
+    assert len(get_schema_cache(app.env)) == 0
+
+
+def test_check_index_covers_columns_and_index_levels():
+    import pandera.pandas as pa  # pylint: disable=import-outside-toplevel
+
+    def is_positive(series):
+        """Values are positive"""
+        return series > 0
+
+    schema = pa.DataFrameSchema(
+        {
+            "a": pa.Column(
+                int, checks=[pa.Check(is_positive), pa.Check.ge(0)]
+            ),
+            "b": pa.Column(int, checks=pa.Check(is_positive)),
+        },
+        index=pa.MultiIndex(
+            [
+                pa.Index(int, name="key1", checks=pa.Check(is_positive)),
+                pa.Index(int, name="key2"),
+            ]
+        ),
+    )
+
+    check_index = SchemaCache().check_index(schema, ("module", "schema"))
+
+    assert list(check_index) == ["is_positive"]
+    assert check_index["is_positive"].doc == "Values are positive"
+    assert check_index["is_positive"].fields == ["a", "b", "key1"]
+
+
+def test_member_kinds(test_app):
+    app = test_app("basic")
+    # pylint: disable-next=import-outside-toplevel
+    from target import check_model, index_model
+
+    cache = get_schema_cache(app.env)
+    kinds = cache.member_kinds(check_model.TestModel)
+
+    assert kinds["Config"] == "config"
+    assert kinds["latitude"] == "field"
+    assert kinds["check_num_finess_format"] == "check"
+    assert kinds["check_coords_non_null"] == "dataframe_check"
+    # members defined by pandera are not classified
+    assert "to_schema" not in kinds
+    assert "__fields__" not in kinds
+    assert cache.member_kinds(index_model.TestMultiIndexModel)["key1"] == (
+        "index"
+    )
+    assert cache.member_kinds(SchemaCache) == {}
+    assert cache.member_kinds(check_model) == {}
+
+
+def test_descriptions_served_from_disk_cache(test_app, tmp_path, mocker):
+    conf = {"sphinx_pandera_cache_dir": str(tmp_path / "cache")}
+    app = test_app("basic", conf=conf)
+    expected = do_autodoc(app, "pandera_model", "target.check_model.TestModel")
+    assert (tmp_path / "cache" / "target.check_model.TestModel.json").exists()
+
+    describe_model = mocker.spy(cache_module, "describe_model")
+    app = test_app("basic", conf=conf)
+    actual = do_autodoc(app, "pandera_model", "target.check_model.TestModel")
+
+    assert actual == expected
+    assert describe_model.call_count == 0
+
+
+def test_disk_cache_invalidated_by_source_change(test_app, tmp_path, mocker):
+    conf = {"sphinx_pandera_cache_dir": str(tmp_path / "cache")}
+    app = test_app("basic", conf=conf)
+    do_autodoc(app, "pandera_schema", "target.basic_schema.basic_schema")
+
+    describe_schema = mocker.spy(cache_module, "describe_schema")
+    mocker.patch.object(cache_module, "source_key", return_value="changed")
+    app = test_app("basic", conf=conf)
+    do_autodoc(app, "pandera_schema", "target.basic_schema.basic_schema")
+
+    assert describe_schema.call_count == 1
+
+
+@pytest.mark.usefixtures("fresh_imports")
+def test_disk_cache_invalidated_by_imported_module(
+    test_app, make_app, tmp_path
+):
+    conf = {"sphinx_pandera_cache_dir": str(tmp_path / "cache")}
+    app = test_app("imports", conf=conf)
+    app.build()
+    assert "less_than_or_equal_to(10)" in (app.outdir / "base.html").read_text(
+        encoding="utf-8"
+    )
+
+    consts = app.srcdir / "scores" / "consts.py"
+    consts.write_text("MAX_SCORE = 99\n", encoding="utf-8")
+    unload_modules("scores")
+    app = make_app(
+        "html",
+        srcdir=app.srcdir,
+        builddir=app.srcdir / "_build_again",
+        confoverrides=conf,
+    )
+    app.build()
+
+    for name in ("base.html", "schema.html"):
+        html = (app.outdir / name).read_text(encoding="utf-8")
+        assert "less_than_or_equal_to(99)" in html
+
+
+def test_info_shared_by_fields():
+    import pandera.pandas as pa  # pylint: disable=import-outside-toplevel
+
+    def is_positive(series):
+        """Values are positive"""
+        return series > 0
+
+    schema = pa.DataFrameSchema(
+        {"a": pa.Column(int, checks=[pa.Check(is_positive), pa.Check.ge(0)])},
+        index=pa.Index(int, name="key"),
+    )
+
+    cache = SchemaCache()
+    info = cache.info(schema, ("module", "schema"))
+    column, index = info.fields
+
+    assert cache.fields(schema, ("module", "schema"))["a"] is column
+    assert [check.ref for check in column.checks] == [
+        "module.is_positive",
+        None,
+    ]
+    assert dict(column.constraints)["required"] is True
+    assert index.type == "Index[int64]"
+    assert dict(index.constraints)["required"] == "True (Index)"
+
+
+def test_components_cover_columns_and_index_levels(test_app, mocker):
+    app = test_app("basic")
+    # pylint: disable-next=import-outside-toplevel
+    from target import index_model
+
+    cache = get_schema_cache(app.env)
+    schema = index_model.TestMultiIndexModel.to_schema()
+    components = cache.components(index_model.TestMultiIndexModel)
+
+    assert components == {
+        **schema.index.named_indexes,
+        **schema.columns,
+    }
+    single = cache.components(index_model.TestSingleIndexModel)
+    assert (
+        single["key"] is cache.schema(index_model.TestSingleIndexModel).index
+    )
+
+    index_components = mocker.spy(cache_module, "index_components")
+    cache.components(index_model.TestMultiIndexModel)
+    assert index_components.call_count == 0
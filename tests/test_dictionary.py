@@ -0,0 +1,90 @@
+import csv
+import json
+
+import pytest
+
+from sphinxcontrib.sphinx_pandera.dictionary import get_data_dictionary
+
+CONF = {"sphinx_pandera_data_dictionary": "catalog/fields"}
+
+
+def read_records(app):
+    path = app.outdir / "catalog" / "fields.jsonl"
+    with path.open(encoding="utf-8") as file:
+        return [json.loads(line) for line in file]
+
+
+def test_data_dictionary_written(test_app):
+    app = test_app("basic", conf=CONF)
+    app.build()
+
+    records = read_records(app)
+    record = next(
+        r
+        for r in records
+        if r["schema"] == "target.check_model.TestModel"
+        and r["column"] == "latitude"
+    )
+    assert record == {
+        "schema": "target.check_model.TestModel",
+        "column": "latitude",
+        "index": False,
+        "dtype": "float64",
+        "nullable": True,
+        "unique": False,
+        "coerce": False,
+        "required": True,
+        "title": "Latitude",
+        "description": (
+            "Latitude of the location of the care center(WGS 84) "
+            "(ex: 48.84512493935407)"
+        ),
+        "checks": [
+            "greater_than_or_equal_to(-90)",
+            "less_than_or_equal_to(90)",
+        ],
+    }
+    assert {
+        r["column"]
+        for r in records
+        if r["schema"] == "target.check_schema.Evaluations"
+    } >= {"num_finess_et", "mission_code"}
+
+    with (app.outdir / "catalog" / "fields.csv").open(
+        encoding="utf-8", newline=""
+    ) as file:
+        rows = list(csv.DictReader(file))
+    assert len(rows) == len(records)
+    row = next(
+        r
+        for r in rows
+        if r["schema"] == "target.check_model.TestModel"
+        and r["column"] == "num_finess_et"
+    )
+    assert row["checks"] == "check_num_finess_format"
+
+
+@pytest.mark.parametrize(
+    "conf",
+    [
+        {"sphinx_pandera_static": True},
+        {"sphinx_pandera_split_threshold": 3, "sphinx_pandera_split_size": 2},
+    ],
+)
+def test_data_dictionary_consistent(test_app, conf):
+    app = test_app("basic", conf=CONF)
+    app.build()
+    expected = read_records(app)
+
+    app = test_app("basic", conf={**CONF, **conf})
+    app.build()
+
+    assert read_records(app) == expected
+
+
+def test_data_dictionary_disabled(test_app):
+    app = test_app("basic")
+    app.build()
+
+    assert not any(get_data_dictionary(app.env).values())
+    assert not (app.outdir / "catalog").exists()
@@ -0,0 +1,49 @@
+from sphinxcontrib.sphinx_pandera.domain import ObjectEntry
+
+
+def test_objects_recorded(test_app):
+    app = test_app("basic")
+    app.build()
+
+    objects = app.env.get_domain("pandera").objects
+    assert objects["target.check_model.TestModel"] == ObjectEntry(
+        "models", "target.check_model.TestModel", "model"
+    )
+    assert objects["target.check_model.TestModel.num_finess_et"].objtype == (
+        "field"
+    )
+    assert objects["target.check_schema.check_num_finess_format"].objtype == (
+        "check"
+    )
+    assert objects["target.basic_model.TestModel.Config"].objtype == (
+        "model_config"
+    )
+
+
+def test_references_resolved(test_app):
+    app = test_app("basic")
+    app.build()
+
+    html = (app.outdir / "schemas.html").read_text(encoding="utf-8")
+    assert 'href="#target.check_schema.Evaluations.num_finess_et"' in html
+    html = (app.outdir / "models.html").read_text(encoding="utf-8")
+    assert 'href="#target.check_model.TestModel.num_finess_ej"' in html
+
+
+def test_clear_and_merge(test_app):
+    app = test_app("basic")
+    app.build()
+
+    domain = app.env.get_domain("pandera")
+    models = {
+        name: entry
+        for name, entry in domain.objects.items()
+        if entry.docname == "models"
+    }
+    domain.clear_doc("models")
+    assert not any(
+        entry.docname == "models" for entry in domain.objects.values()
+    )
+
+    domain.merge_domaindata({"models"}, {"objects": models})
+    assert domain.objects["target.check_model.TestModel"].docname == "models"
@@ -0,0 +1,54 @@
+from tests.conftest import do_autodoc
+
+
+def test_schema_fields_table(test_app):
+    app = test_app("basic")
+    result = do_autodoc(
+        app,
+        "pandera_schema",
+        "target.index_schema.single_index_schema",
+        {"fields-table": None},
+    )
+
+    assert not any(".. py:pandera_field::" in line for line in result)
+    start = result.index("   .. py:pandera_field_table:: single_index_schema")
+    rows = [line for line in result[start:] if line.startswith("      * - ")]
+    assert rows == ["      * - Field", "      * - key"]
+    assert "        - Index\\[str\\]" in result
+    assert "        - True (Index)" in result
+
+
+def test_model_fields_table(test_app):
+    app = test_app("basic")
+    result = do_autodoc(
+        app,
+        "pandera_model",
+        "target.check_model.TestModel",
+        {"fields-table": None},
+    )
+
+    assert "   .. py:pandera_field_table::" in result
+    assert not any(".. py:pandera_field::" in line for line in result)
+    assert any(
+        line.startswith("   .. py:pandera_check:: TestModel.check_")
+        for line in result
+    )
+    assert (
+        "        - * :pandera:check:`check_num_finess_format "
+        "<target.check_model.TestModel.check_num_finess_format>`"
+    ) in result
+
+
+def test_fields_table_targets(test_app):
+    app = test_app("basic", conf={"sphinx_pandera_fields_table": True})
+    app.build()
+
+    objects = app.env.get_domain("py").objects
+    assert objects["target.check_model.TestModel.latitude"].objtype == (
+        "pandera_field"
+    )
+    assert "target.basic_schema.basic_schema.field1" in objects
+
+    html = (app.outdir / "models.html").read_text(encoding="utf-8")
+    assert 'id="target.check_model.TestModel.latitude"' in html
+    assert 'href="#target.check_model.TestModel.num_finess_et"' in html
@@ -0,0 +1,52 @@
+from sphinxcontrib.sphinx_pandera import environment
+from sphinxcontrib.sphinx_pandera.environment import (
+    get_fingerprints,
+    get_outdated_docs,
+)
+from tests.conftest import unload_modules
+
+
+def test_fingerprints_recorded_per_document(test_app):
+    app = test_app("basic")
+    app.build()
+
+    fingerprints = get_fingerprints(app.env)
+
+    assert set(fingerprints) == {"models", "schemas"}
+    assert ("target.check_model", "TestModel") in fingerprints["models"]
+    assert ("target.check_schema", "Evaluations") in fingerprints["schemas"]
+
+
+def test_only_changed_schemas_are_outdated(test_app, mocker):
+    app = test_app("basic")
+    app.build()
+
+    assert not get_outdated_docs(app, app.env, set(), set(), set())
+
+    source = app.srcdir / "target" / "check_schema.py"
+    source.write_text(
+        source.read_text(encoding="utf-8").replace(
+            "Geographic FINESS Identifier (ex: 920000650)",
+            "Edited FINESS identifier",
+        ),
+        encoding="utf-8",
+    )
+    # imported again, as by the process of the next build
+    unload_modules("target")
+    compute_fingerprint = mocker.spy(environment, "compute_fingerprint")
+
+    assert get_outdated_docs(app, app.env, set(), set(), set()) == ["schemas"]
+    # objects whose sources were not modified are not imported again
+    assert {call.args[1] for call in compute_fingerprint.call_args_list} == {
+        "target.check_schema"
+    }
+    unload_modules("target")
+
+
+def test_fingerprints_purged_with_document(test_app):
+    app = test_app("basic")
+    app.build()
+
+    app.emit("env-purge-doc", app.env, "models")
+
+    assert "models" not in get_fingerprints(app.env)
@@ -0,0 +1,136 @@
+from docutils import nodes
+from sphinx import addnodes
+
+from sphinxcontrib.sphinx_pandera.cache import get_schema_cache
+from tests.conftest import do_autodoc
+
+
+def test_inherited_members(test_app):
+    app = test_app("basic")
+    from target.inherit_model import (  # pylint: disable=import-outside-toplevel
+        AuditModel,
+        OrderModel,
+    )
+
+    cache = get_schema_cache(app.env)
+    assert not cache.inherited_members(AuditModel)
+    assert cache.inherited_members(OrderModel) == {
+        "Config": "target.inherit_model.AuditModel",
+        "created_at": "target.inherit_model.AuditModel",
+        "updated_at": "target.inherit_model.AuditModel",
+        "check_created_at": "target.inherit_model.AuditModel",
+    }
+    # inherited checks are referenced on the model defining them
+    check = cache.info(OrderModel).fields[0].checks[0]
+    assert check.ref == "target.inherit_model.AuditModel.check_created_at"
+
+
+def test_subclass_documented_after_base(test_app):
+    app = test_app("basic")
+
+    do_autodoc(app, "pandera_model", "target.inherit_model.AuditModel")
+    result = do_autodoc(
+        app, "pandera_model", "target.inherit_model.OrderModel"
+    )
+
+    assert "   .. py:pandera_field:: OrderModel.amount" in result
+
+
+def test_inherited_members_referenced(test_app):
+    app = test_app("basic")
+    result = do_autodoc(
+        app,
+        "pandera_model",
+        "target.inherit_model.OrderModel",
+        {"inherited-members": "DataFrameModel", "reference-inherited": None},
+    )
+
+    assert result[
+        result.index("   Data model inheriting audit columns") :
+    ] == [
+        "   Data model inheriting audit columns",
+        "",
+        "   :Inherited: from :pandera:model:`AuditModel "
+        "<target.inherit_model.AuditModel>`",
+        "",
+        "      - :pandera:obj:`Config <target.inherit_model.AuditModel.Config>`",
+        "      - :pandera:field:`created_at "
+        "<target.inherit_model.AuditModel.created_at>`",
+        "      - :pandera:field:`updated_at "
+        "<target.inherit_model.AuditModel.updated_at>`",
+        "      - :pandera:check:`check_created_at "
+        "<target.inherit_model.AuditModel.check_created_at>`",
+        "",
+        "",
+        "   .. py:pandera_field:: OrderModel.amount",
+        "      :module: target.inherit_model",
+        "      :type: ~pandera.typing.pandas.Series[float]",
+        "      :title: Amount",
+        "",
+        "      :Constraints:",
+        "         - **nullable** = False",
+        "         - **unique** = False",
+        "         - **coerce** = False",
+        "         - **required** = True",
+    ]
+
+
+def test_inherited_references_rendered(test_app, make_app):
+    srcdir = test_app("basic").srcdir
+    (srcdir / "inherited.rst").write_text(
+        "Inherited\n=========\n\n"
+        ".. autopandera_model:: target.inherit_model.OrderModel\n",
+        encoding="utf-8",
+    )
+    app = make_app(
+        "html",
+        srcdir=srcdir,
+        confoverrides={"sphinx_pandera_reference_inherited": True},
+    )
+    app.build()
+
+    doctree = app.env.get_doctree("inherited")
+    fields = list(doctree.findall(nodes.field))
+    inherited = [field for field in fields if field[0].astext() == "Inherited"]
+    assert len(inherited) == 1
+    body = inherited[0][1]
+    assert body[0].astext() == "from AuditModel"
+    assert [
+        xref["reftarget"] for xref in body.findall(addnodes.pending_xref)
+    ] == [
+        "target.inherit_model.AuditModel",
+        "target.inherit_model.AuditModel.Config",
+        "target.inherit_model.AuditModel.created_at",
+        "target.inherit_model.AuditModel.updated_at",
+        "target.inherit_model.AuditModel.check_created_at",
+    ]
+    # no field name is mistaken for a definition list term
+    assert not any(
+        "Inherited" in term.astext() for term in doctree.findall(nodes.term)
+    )
+
+
+def test_inherited_members_documented(test_app):
+    app = test_app("basic")
+    result = do_autodoc(
+        app,
+        "pandera_model",
+        "target.inherit_model.OrderModel",
+        {"inherited-members": "DataFrameModel"},
+    )
+
+    assert not any(":Inherited:" in line for line in result)
+    assert "   .. py:pandera_field:: OrderModel.created_at" in result
+
+
+def test_inherited_fields_left_out_of_table(test_app):
+    app = test_app("basic", conf={"sphinx_pandera_reference_inherited": True})
+    result = do_autodoc(
+        app,
+        "pandera_model",
+        "target.inherit_model.OrderModel",
+        {"fields-table": None},
+    )
+
+    rows = [line for line in result if line.startswith("      * - ")]
+    assert rows == ["      * - Field", "      * - amount"]
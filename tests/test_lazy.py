@@ -0,0 +1,114 @@
+import json
+
+from sphinx import addnodes
+from sphinx.environment import CONFIG_OK
+
+from sphinxcontrib.sphinx_pandera.lazy import lazy_field
+from tests.conftest import do_autodoc
+
+
+def test_lazy_fields_directive(test_app):
+    app = test_app("basic")
+    result = do_autodoc(
+        app,
+        "pandera_schema",
+        "target.basic_schema.basic_schema",
+        {"lazy-fields": None},
+    )
+
+    assert "   .. py:pandera_lazy_fields:: basic_schema" in result
+    assert "      :data: target.basic_schema.basic_schema" in result
+    # fields are described from their records, not from generated rST
+    assert not any(".. py:pandera_field::" in line for line in result)
+
+
+def test_lazy_fields_build(test_app):
+    app = test_app("basic", conf={"sphinx_pandera_lazy_fields": True})
+    app.build()
+
+    html = (app.outdir / "models.html").read_text(encoding="utf-8")
+    assert 'id="target.check_model.TestModel.num_finess_et"' in html
+    assert 'data-fields="target.check_model.TestModel"' in html
+    assert "Constraints" not in html
+    assert "_static/pandera/pandera_fields.js" in html
+    index = (app.outdir / "index.html").read_text(encoding="utf-8")
+    assert "pandera_fields.js" not in index
+
+    static_dir = app.outdir / "_static" / "pandera"
+    assert (static_dir / "pandera_fields.js").is_file()
+    fields = json.loads(
+        (static_dir / "target.check_model.TestModel.json").read_text(
+            encoding="utf-8"
+        )
+    )
+    field = next(f for f in fields if f["name"] == "num_finess_et")
+    assert field["constraints"]["required"] is True
+    assert field["checks"] == [
+        {
+            "name": "check_num_finess_format",
+            "error": None,
+            "ref": "target.check_model.TestModel.check_num_finess_format",
+            "url": (
+                "models.html"
+                "#target.check_model.TestModel.check_num_finess_format"
+            ),
+        }
+    ]
+
+
+def test_lazy_fields_html_only(test_app, make_app):
+    srcdir = test_app("basic").srcdir
+    app = make_app(
+        "text",
+        srcdir=srcdir,
+        confoverrides={"sphinx_pandera_lazy_fields": True},
+    )
+    app.build()
+
+    assert "Field 1 Title" in (app.outdir / "models.txt").read_text(
+        encoding="utf-8"
+    )
+    assert not (app.outdir / "_static").exists()
+
+
+def count_details(app):
+    text = (app.outdir / "models.txt").read_text(encoding="utf-8")
+    return sum(
+        line.strip() in {"Constraints:", "Validated by:"}
+        for line in text.splitlines()
+    )
+
+
+def test_lazy_fields_summarized_when_read(test_app):
+    app = test_app("basic", conf={"sphinx_pandera_lazy_fields": True})
+    app.build()
+
+    doctree = app.env.get_doctree("models")
+    assert not any(
+        desc["objtype"] == "pandera_field"
+        for desc in doctree.findall(addnodes.desc)
+    )
+    summaries = list(doctree.findall(lazy_field))
+    assert "target.check_model.TestModel.num_finess_et" in [
+        node_id for summary in summaries for node_id in summary["ids"]
+    ]
+    entry = app.env.get_domain("pandera").objects[
+        "target.check_model.TestModel.num_finess_et"
+    ]
+    assert (entry.docname, entry.objtype) == ("models", "field")
+
+
+def test_lazy_fields_doctrees_shared(test_app, make_app):
+    conf = {"sphinx_pandera_lazy_fields": True}
+    srcdir = test_app("basic").srcdir
+    expected = make_app("text", srcdir=srcdir, builddir=srcdir / "_fresh")
+    expected.build()
+
+    app = make_app("html", srcdir=srcdir, confoverrides=conf)
+    app.build()
+    # the text builder reuses the doctrees read by the HTML builder
+    app = make_app("text", srcdir=srcdir, confoverrides=conf)
+    assert app.env.config_status == CONFIG_OK
+    app.build()
+
+    assert count_details(app) == count_details(expected) > 0
@@ -0,0 +1,144 @@
+import sys
+
+import pytest
+
+from sphinxcontrib.sphinx_pandera import cache as cache_module
+from sphinxcontrib.sphinx_pandera.cache import get_schema_cache
+from sphinxcontrib.sphinx_pandera.reloading import (
+    clear_tracked_modules,
+    reload_modules,
+)
+from sphinxcontrib.sphinx_pandera.store import MEMORY_STORE, MemoryStore
+from tests.conftest import do_autodoc, unload_modules
+
+CONF = {"sphinx_pandera_memory_cache": True}
+
+
+@pytest.fixture(autouse=True)
+def clear_memory():
+    MEMORY_STORE.clear()
+    clear_tracked_modules()
+    yield
+    MEMORY_STORE.clear()
+    clear_tracked_modules()
+    # modules edited by the tests are imported again by the next ones
+    unload_modules("target")
+
+
+def test_descriptions_stored_with_key():
+    store = MemoryStore()
+
+    assert store.get("model", "key") is None
+    store.put("model", "key", {"fields": []})
+    assert store.get("model", "key") == {"fields": []}
+    assert store.get("model", "other") is None
+
+
+def test_descriptions_kept_across_builds(test_app, make_app, mocker):
+    app = test_app("basic", conf=CONF)
+    assert get_schema_cache(app.env).disk is MEMORY_STORE
+    app.build()
+    assert len(MEMORY_STORE) > 0
+
+    # every document is read again by a new build
+    describe_model = mocker.spy(cache_module, "describe_model")
+    app = make_app(
+        "html",
+        srcdir=app.srcdir,
+        builddir=app.srcdir / "_build_again",
+        confoverrides=CONF,
+    )
+    app.build()
+
+    assert describe_model.call_count == 0
+
+
+def test_changed_module_reloaded(test_app, make_app, mocker):
+    app = test_app("basic", conf=CONF)
+    app.build()
+    from target import (  # pylint: disable=import-outside-toplevel
+        basic_model,
+        check_model,
+    )
+
+    model = check_model.TestModel
+    basic = basic_model.TestModel
+    source = app.srcdir / "target" / "check_model.py"
+    source.write_text(
+        source.read_text(encoding="utf-8").replace(
+            "Latitude of the location", "Edited latitude of the location"
+        ),
+        encoding="utf-8",
+    )
+
+    describe_model = mocker.spy(cache_module, "describe_model")
+    app = make_app("html", srcdir=app.srcdir, confoverrides=CONF)
+    app.build()
+
+    assert check_model.TestModel is not model
+    assert basic_model.TestModel is basic
+    assert [call.args[0] for call in describe_model.call_args_list] == [
+        check_model.TestModel
+    ]
+    html = (app.outdir / "models.html").read_text(encoding="utf-8")
+    assert "Edited latitude of the location" in html
+
+
+def test_modules_not_reloaded_by_default(test_app, make_app):
+    app = test_app("basic")
+    app.build()
+    from target import check_model  # pylint: disable=import-outside-toplevel
+
+    model = check_model.TestModel
+    source = app.srcdir / "target" / "check_model.py"
+    source.write_text(
+        source.read_text(encoding="utf-8") + "\n", encoding="utf-8"
+    )
+
+    app = make_app("html", srcdir=app.srcdir)
+    assert get_schema_cache(app.env).disk is None
+    app.build()
+
+    assert check_model.TestModel is model
+
+
+@pytest.mark.usefixtures("fresh_imports")
+def test_imported_module_reloaded(test_app, make_app):
+    app = test_app("imports", conf=CONF)
+    app.build()
+
+    consts = app.srcdir / "scores" / "consts.py"
+    consts.write_text("MAX_SCORE = 99\n", encoding="utf-8")
+    app = make_app("html", srcdir=app.srcdir, confoverrides=CONF)
+    app.build()
+
+    assert sys.modules["scores.consts"].MAX_SCORE == 99
+    for name in ("base.html", "schema.html"):
+        html = (app.outdir / name).read_text(encoding="utf-8")
+        assert "less_than_or_equal_to(99)" in html
+    # models derived from derived models use the reloaded base model
+    detailed = sys.modules["scores.detailed"].DetailedRatingModel
+    assert sys.modules["scores.base"].ScoreModel in detailed.__mro__
+    checks = detailed.to_schema().columns["score"].checks
+    assert "less_than_or_equal_to(99)" in [check.error for check in checks]
+
+
+@pytest.mark.usefixtures("fresh_imports")
+def test_intermediate_modules_reloaded(test_app):
+    app = test_app("imports", conf=CONF)
+    # only the model derived from a derived model is documented
+    do_autodoc(app, "pandera_model", "scores.detailed.DetailedRatingModel")
+
+    base = app.srcdir / "scores" / "base.py"
+    base.write_text(
+        base.read_text(encoding="utf-8").replace(
+            "Score of the item", "Edited score of the item"
+        ),
+        encoding="utf-8",
+    )
+    reload_modules(app)
+
+    detailed = sys.modules["scores.detailed"].DetailedRatingModel
+    assert sys.modules["scores.base"].ScoreModel in detailed.__mro__
+    score = detailed.to_schema().columns["score"]
+    assert score.description == "Edited score of the item"
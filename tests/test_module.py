@@ -0,0 +1,39 @@
+from sphinxcontrib.sphinx_pandera.discovery import (
+    MODEL,
+    SCHEMA,
+    PanderaObject,
+    discover,
+)
+from tests.conftest import do_autodoc
+
+
+def test_discover_package(test_app):
+    test_app("basic")
+
+    assert discover("target") == [
+        PanderaObject("target.basic_model", "TestModel", MODEL),
+        PanderaObject("target.basic_schema", "basic_schema", SCHEMA),
+        PanderaObject("target.check_model", "TestModel", MODEL),
+        PanderaObject("target.check_schema", "Evaluations", SCHEMA),
+        PanderaObject("target.index_model", "TestSingleIndexModel", MODEL),
+        PanderaObject("target.index_model", "TestMultiIndexModel", MODEL),
+        PanderaObject("target.index_schema", "single_index_schema", SCHEMA),
+        PanderaObject("target.index_schema", "multi_index_schema", SCHEMA),
+        PanderaObject("target.inherit_model", "AuditModel", MODEL),
+        PanderaObject("target.inherit_model", "OrderModel", MODEL),
+    ]
+
+
+def test_module_documents_each_object(test_app):
+    app = test_app("basic")
+
+    expected = []
+    for obj in discover("target.index_model"):
+        expected.extend(
+            do_autodoc(app, obj.objtype, f"{obj.modname}.{obj.name}")
+        )
+
+    result = do_autodoc(app, "pandera_module", "target.index_model")
+
+    assert result
+    assert result == expected
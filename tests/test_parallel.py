@@ -0,0 +1,65 @@
+import os
+
+from sphinxcontrib.sphinx_pandera.environment import get_fingerprints
+from sphinxcontrib.sphinx_pandera.lazy import get_lazy_fields
+from sphinxcontrib.sphinx_pandera.profiling import get_profiler
+
+# split pages make enough documents for Sphinx to read them in parallel
+CONF = {
+    "sphinx_pandera_split_threshold": 3,
+    "sphinx_pandera_split_size": 2,
+    "sphinx_pandera_lazy_fields": True,
+    "sphinx_pandera_profile": "profile.json",
+}
+
+
+def get_metadata(app):
+    env = app.env
+    return {
+        "pandera": dict(env.get_domain("pandera").objects),
+        "py": dict(env.get_domain("py").objects),
+        "fingerprints": get_fingerprints(env),
+        "lazy_fields": get_lazy_fields(env),
+        "timings": sorted(get_profiler(env).timings),
+    }
+
+
+def test_parallel_build(test_app, make_app):
+    serial = test_app("basic", conf=CONF)
+    serial.build()
+
+    parallel = make_app(
+        "html",
+        srcdir=serial.srcdir,
+        builddir=serial.srcdir / "_build_parallel",
+        confoverrides=CONF,
+        parallel=4,
+    )
+    assert parallel.is_parallel_allowed("read")
+    assert len(parallel.env.found_docs) > 5
+    parallel.build()
+
+    assert get_metadata(parallel) == get_metadata(serial)
+    for name in ("models.html", "schemas.html"):
+        assert (parallel.outdir / name).read_text(encoding="utf-8") == (
+            serial.outdir / name
+        ).read_text(encoding="utf-8")
+
+
+def test_parallel_rebuild_purges_metadata(test_app, make_app):
+    app = test_app("basic", conf=CONF)
+    app.build()
+    # read every document again, in parallel
+    for path in app.srcdir.glob("**/*.rst"):
+        os.utime(path)
+    models = app.srcdir / "models.rst"
+    models.write_text("Models\n======\n", encoding="utf-8")
+
+    app = make_app("html", srcdir=app.srcdir, confoverrides=CONF, parallel=4)
+    app.build()
+
+    objects = app.env.get_domain("pandera").objects
+    assert "target.check_model.TestModel" not in objects
+    assert "target.check_schema.Evaluations" in objects
+    assert "models" not in get_fingerprints(app.env)
+    assert "models" not in get_lazy_fields(app.env)
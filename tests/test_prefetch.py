@@ -0,0 +1,60 @@
+from sphinxcontrib.sphinx_pandera import cache as cache_module
+from sphinxcontrib.sphinx_pandera.cache import get_schema_cache
+from tests.conftest import do_autodoc
+
+PREFETCH = {
+    "sphinx_pandera_prefetch_modules": ["target"],
+    "sphinx_pandera_prefetch_workers": 2,
+}
+
+
+def test_descriptions_prefetched_at_builder_inited(test_app):
+    app = test_app("basic", conf=PREFETCH)
+
+    prefetched = get_schema_cache(app.env).prefetched
+
+    assert ("target.check_model", "TestModel") in prefetched
+    assert ("target.check_schema", "Evaluations") in prefetched
+    assert len(prefetched) == 10
+
+
+def test_documenters_render_prefetched_descriptions(test_app, mocker):
+    expected = do_autodoc(
+        test_app("basic"), "pandera_model", "target.check_model.TestModel"
+    )
+
+    app = test_app("basic", conf=PREFETCH)
+    describe_model = mocker.spy(cache_module, "describe_model")
+    result = do_autodoc(app, "pandera_model", "target.check_model.TestModel")
+
+    assert describe_model.call_count == 0
+    assert result == expected
+
+
+def test_reexported_objects_prefetched(test_app, make_app, mocker):
+    srcdir = test_app("basic").srcdir
+    (srcdir / "target" / "exports.py").write_text(
+        "from target.check_model import TestModel\n"
+        "from target.check_schema import Evaluations\n",
+        encoding="utf-8",
+    )
+    # the objects are only described where they are defined
+    conf = {
+        **PREFETCH,
+        "sphinx_pandera_prefetch_modules": [
+            "target.check_model",
+            "target.check_schema",
+        ],
+    }
+    app = make_app("html", srcdir=srcdir, confoverrides=conf)
+    prefetched = get_schema_cache(app.env).prefetched
+    assert ("target.check_schema", "Evaluations") in prefetched
+    describe_model = mocker.spy(cache_module, "describe_model")
+    describe_schema = mocker.spy(cache_module, "describe_schema")
+
+    do_autodoc(app, "pandera_model", "target.exports.TestModel")
+    do_autodoc(app, "pandera_schema", "target.exports.Evaluations")
+
+    assert describe_model.call_count == 0
+    assert describe_schema.call_count == 0
+    assert not prefetched
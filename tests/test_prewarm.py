@@ -0,0 +1,58 @@
+import gc
+
+from sphinxcontrib.sphinx_pandera import cache as cache_module, prefetch
+from sphinxcontrib.sphinx_pandera.cache import get_schema_cache
+from tests.conftest import do_autodoc
+
+PREWARM = {
+    "sphinx_pandera_prefetch_modules": ["target"],
+    "sphinx_pandera_prewarm": True,
+}
+
+
+def test_objects_described_at_builder_inited(test_app, mocker):
+    freeze = mocker.patch.object(gc, "freeze")
+    pool = mocker.patch.object(prefetch, "ProcessPoolExecutor")
+    app = test_app("basic", conf=PREWARM)
+
+    from target.check_model import (  # pylint: disable=import-outside-toplevel
+        TestModel,
+    )
+
+    cache = get_schema_cache(app.env)
+    assert cache.get(TestModel, "schema", None) is TestModel.to_schema()
+    # prefetched modules are prewarmed instead of described in a pool
+    assert pool.call_count == 0
+    # only parallel builds fork readers sharing the prewarmed objects
+    assert freeze.call_count == 0
+
+
+def test_documenters_render_prewarmed_objects(test_app, mocker):
+    expected = do_autodoc(
+        test_app("basic"), "pandera_model", "target.check_model.TestModel"
+    )
+
+    app = test_app("basic", conf=PREWARM)
+    describe_model = mocker.spy(cache_module, "describe_model")
+    to_schema = mocker.spy(cache_module.SchemaCache, "_to_schema")
+    result = do_autodoc(app, "pandera_model", "target.check_model.TestModel")
+
+    assert describe_model.call_count == 0
+    assert to_schema.call_count == 0
+    assert result == expected
+
+
+def test_objects_frozen_during_parallel_builds(test_app, make_app, mocker):
+    calls = mocker.Mock()
+    mocker.patch.object(gc, "collect", calls.collect)
+    mocker.patch.object(gc, "freeze", calls.freeze)
+    mocker.patch.object(gc, "unfreeze", calls.unfreeze)
+    srcdir = test_app("basic").srcdir
+
+    app = make_app("html", srcdir=srcdir, confoverrides=PREWARM, parallel=4)
+    # garbage is collected before the remaining objects are frozen
+    assert [call[0] for call in calls.mock_calls] == ["collect", "freeze"]
+
+    app.build()
+    assert [call[0] for call in calls.mock_calls][-1] == "unfreeze"
+    assert calls.unfreeze.call_count == 1
@@ -0,0 +1,83 @@
+import json
+
+from sphinxcontrib.sphinx_pandera.profiling import PHASES, Profiler
+
+PROFILE = {"sphinx_pandera_profile": "profile.json"}
+
+
+def test_profile_written_at_build_finished(test_app):
+    app = test_app("basic", conf=PROFILE)
+    app.build()
+
+    report = json.loads((app.outdir / "profile.json").read_text())
+    objects = {entry["name"]: entry for entry in report["objects"]}
+    totals = [entry["total"] for entry in report["objects"]]
+
+    assert totals == sorted(totals, reverse=True)
+    assert objects["target.check_model.TestModel"]["documenter"] == (
+        "pandera_model"
+    )
+    assert objects["target.check_model.TestModel.Config"]["documenter"] == (
+        "pandera_model_config"
+    )
+    assert objects["target.check_schema.Evaluations"]["dominant"] in PHASES
+    assert set(report["documenters"]) == {
+        "pandera_model",
+        "pandera_model_config",
+        "pandera_field",
+        "pandera_check",
+        "pandera_schema",
+    }
+
+
+def test_describing_timed_apart_from_converting(test_app):
+    app = test_app("basic", conf=PROFILE)
+    app.build()
+
+    report = json.loads((app.outdir / "profile.json").read_text())
+    objects = {entry["name"]: entry for entry in report["objects"]}
+    model = objects["target.check_model.TestModel"]
+    schema = objects["target.check_schema.Evaluations"]
+
+    assert model["to_schema"] > 0
+    assert model["describe"] > 0
+    # schemas are described without being converted
+    assert schema["to_schema"] == 0
+    assert schema["describe"] > 0
+
+
+def test_profile_not_written_by_default(test_app):
+    app = test_app("basic")
+    app.build()
+
+    assert not (app.outdir / "profile.json").exists()
+
+
+def test_members_included_in_model_totals():
+    profiler = Profiler()
+    profiler.add("index", "mod.Model", "pandera_model", "import", 1.0)
+    profiler.add("index", "mod.Model.field", "pandera_field", "render", 3.0)
+    profiler.add("other", "mod.Model.field", "pandera_field", "render", 1.0)
+
+    report = profiler.report()
+    model, field = report["objects"]
+
+    assert model["name"] == "mod.Model"
+    assert model["total"] == 5.0
+    assert model["dominant"] == "render"
+    assert field["total"] == 4.0
+    assert report["documenters"]["pandera_model"]["total"] == 1.0
+    assert report["total"] == 5.0
+
+
+def test_nested_phases_are_exclusive():
+    profiler = Profiler()
+    with profiler.phase("mod.Model", "pandera_model", "render", "index"):
+        with profiler.phase("mod.Model", "pandera_model", "to_schema"):
+            pass
+
+    timing = profiler.timings["index"]["mod.Model"]
+    report = profiler.report()
+
+    assert timing["to_schema"] > 0
+    assert report["total"] == timing["render"] + timing["to_schema"]
@@ -0,0 +1,107 @@
+import importlib
+import json
+import sys
+
+import pandera.pandas as pa
+import pytest
+
+from sphinxcontrib.sphinx_pandera.metadata import describe_schema
+from sphinxcontrib.sphinx_pandera.profiling import get_profiler
+from sphinxcontrib.sphinx_pandera.serialization import (
+    describe_serialized,
+    load_yaml,
+)
+from tests.conftest import do_autodoc
+
+NO_VALUE = {"no-value": ""}
+
+
+@pytest.mark.parametrize("suffix", [".yaml", ".json"])
+@pytest.mark.parametrize(
+    "object_path",
+    [
+        "target.basic_schema.basic_schema",
+        "target.index_schema.single_index_schema",
+        "target.index_schema.multi_index_schema",
+    ],
+)
+def test_schema_file_matches_schema(test_app, object_path, suffix):
+    app = test_app("basic")
+    expected = do_autodoc(app, "pandera_schema", object_path, NO_VALUE)
+
+    modname, name = object_path.rsplit(".", 1)
+    schema = getattr(sys.modules[modname], name)
+    path = app.srcdir / f"{name}{suffix}"
+    if suffix == ".json":
+        path.write_text(schema.to_json(), encoding="utf-8")
+    else:
+        path.write_text(schema.to_yaml(), encoding="utf-8")
+
+    app.env.ref_context["py:module"] = modname
+    result = do_autodoc(app, "pandera_schema_file", path.name)
+
+    assert result == expected
+
+
+def test_serialized_checks():
+    schema = pa.DataFrameSchema(
+        {
+            "a": pa.Column(
+                int,
+                [
+                    pa.Check.isin([1, 2]),
+                    pa.Check.in_range(0, 5),
+                    pa.Check.str_length(1, 3),
+                    pa.Check.ge(0, ignore_na=False),
+                ],
+                nullable=True,
+                coerce=True,
+            ),
+            ("b", "c"): pa.Column(str, pa.Check.str_length(2)),
+        },
+        checks=[pa.Check.gt(0)],
+        index=pa.MultiIndex(
+            [
+                pa.Index(int, pa.Check.between(1, 2), name="i"),
+                pa.Index(str),
+            ]
+        ),
+        name="checked",
+        ordered=True,
+    )
+    assert describe_serialized(
+        json.loads(schema.to_json())
+    ) == describe_schema(schema)
+
+
+def test_missing_schema_file(test_app):
+    app = test_app("basic")
+
+    assert do_autodoc(app, "pandera_schema_file", "missing.yaml") == []
+
+
+def test_yaml_requires_extra(tmp_path, monkeypatch):
+    path = tmp_path / "schema.yaml"
+    path.write_text("schema_type: dataframe\n", encoding="utf-8")
+    # PyYAML is not installed
+    monkeypatch.setitem(sys.modules, "yaml", None)
+
+    with pytest.raises(ImportError, match=r"sphinx-pandera\[yaml\]"):
+        load_yaml(path)
+
+
+def test_schema_file_profiled(test_app):
+    app = test_app("basic", conf={"sphinx_pandera_profile": "profile.json"})
+    schema = importlib.import_module("target.basic_schema").basic_schema
+    (app.srcdir / "basic_schema.yaml").write_text(
+        schema.to_yaml(), encoding="utf-8"
+    )
+    app.env.ref_context["py:module"] = "target.basic_schema"
+    do_autodoc(app, "pandera_schema_file", "basic_schema.yaml")
+
+    report = get_profiler(app.env).report()
+    objects = {entry["name"]: entry for entry in report["objects"]}
+    timing = objects["target.basic_schema.basic_schema"]
+    assert timing["documenter"] == "pandera_schema_file"
+    assert timing["import"] > 0
+    assert timing["render"] > 0
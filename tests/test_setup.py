@@ -0,0 +1,37 @@
+import subprocess
+import sys
+import textwrap
+
+
+def test_setup_does_not_import_pandas(tmp_path):
+    (tmp_path / "conf.py").write_text(
+        'extensions = ["sphinxcontrib.sphinx_pandera"]\n'
+    )
+    (tmp_path / "index.rst").write_text("Index\n=====\n")
+    code = textwrap.dedent(
+        f"""
+        import sys
+        from sphinx.application import Sphinx
+
+        app = Sphinx(
+            srcdir={str(tmp_path)!r},
+            confdir={str(tmp_path)!r},
+            outdir={str(tmp_path / "_build")!r},
+            doctreedir={str(tmp_path / "_doctrees")!r},
+            buildername="html",
+            status=None,
+        )
+        assert "sphinx_pandera_model_signature_prefix" in app.config
+        assert "pandas" not in sys.modules, "pandas imported by setup()"
+        assert "pandera" not in sys.modules, "pandera imported by setup()"
+        """
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,168 @@
+import multiprocessing
+import time
+
+import pytest
+
+from sphinxcontrib.sphinx_pandera import cache as cache_module
+from sphinxcontrib.sphinx_pandera.cache import (
+    SHARED_STORE,
+    SchemaCache,
+    get_schema_cache,
+)
+from sphinxcontrib.sphinx_pandera.store import (
+    STORE_TIMEOUT,
+    DiskCache,
+    SharedStore,
+)
+from tests.conftest import unload_modules
+
+
+def put_description(path, index):
+    SharedStore(path).put(f"model{index}", "key", {"index": index})
+
+
+def get_description(path, queue):
+    queue.put(SharedStore(path).get("model", "key"))
+
+
+def test_descriptions_stored_with_key(tmp_path):
+    store = SharedStore(tmp_path / "store.sqlite")
+
+    assert store.get("model", "key") is None
+    store.put("model", "key", {"fields": []})
+    assert store.get("model", "key") == {"fields": []}
+    assert store.get("model", "other") is None
+
+
+def test_descriptions_shared_between_processes(tmp_path):
+    path = tmp_path / "store.sqlite"
+    context = multiprocessing.get_context("fork")
+    processes = [
+        context.Process(target=put_description, args=(path, index))
+        for index in range(4)
+    ]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    store = SharedStore(path)
+    assert [store.get(f"model{index}", "key") for index in range(4)] == [
+        {"index": index} for index in range(4)
+    ]
+
+
+def test_connection_opened_once(tmp_path):
+    store = SharedStore(tmp_path / "store.sqlite")
+
+    assert store.connect() is SharedStore(store.path).connect()
+    store.reset()
+    assert not store.path.exists()
+
+
+def test_claimed_objects_awaited(tmp_path):
+    store = SharedStore(tmp_path / "store.sqlite")
+    # this process claims the object
+    assert store.get("model", "key") is None
+
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    process = context.Process(target=get_description, args=(store.path, queue))
+    process.start()
+    time.sleep(0.2)
+    store.put("model", "key", {"fields": []})
+    process.join()
+
+    assert queue.get(timeout=5) == {"fields": []}
+
+
+def test_claims_of_dead_processes_taken_over(tmp_path):
+    store = SharedStore(tmp_path / "store.sqlite")
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    # the other process claims the object and exits without describing it
+    process = context.Process(target=get_description, args=(store.path, queue))
+    process.start()
+    process.join()
+    assert queue.get(timeout=5) is None
+
+    start = time.monotonic()
+    assert store.get("model", "key") is None
+    assert time.monotonic() - start < STORE_TIMEOUT
+
+
+def test_released_claims_taken_over(tmp_path):
+    store = SharedStore(tmp_path / "store.sqlite")
+    assert store.get("model", "key") is None
+    store.release("model", "key")
+
+    context = multiprocessing.get_context("fork")
+    queue = context.Queue()
+    process = context.Process(target=get_description, args=(store.path, queue))
+    process.start()
+    process.join(timeout=STORE_TIMEOUT)
+    assert queue.get(timeout=5) is None
+
+
+def test_objects_described_once(test_app, tmp_path, mocker):
+    test_app("basic")
+    from target.check_model import (  # pylint: disable=import-outside-toplevel
+        TestModel,
+    )
+
+    store = SharedStore(tmp_path / "store.sqlite")
+    expected = SchemaCache(store).description(TestModel)
+
+    # another reader, with a cache of its own
+    describe_model = mocker.spy(cache_module, "describe_model")
+    assert SchemaCache(store).description(TestModel) == expected
+    assert describe_model.call_count == 0
+
+
+def test_store_of_parallel_builds(test_app, make_app, tmp_path):
+    srcdir = test_app("basic").srcdir
+
+    app = make_app("html", srcdir=srcdir, parallel=4)
+    assert get_schema_cache(app.env).disk is None
+
+    conf = {"sphinx_pandera_shared_store": True}
+    app = make_app("html", srcdir=srcdir, confoverrides=conf, parallel=4)
+    store = get_schema_cache(app.env).disk
+    assert isinstance(store, SharedStore)
+    assert store.path == app.doctreedir / SHARED_STORE
+
+    app = make_app("html", srcdir=srcdir, confoverrides=conf)
+    assert get_schema_cache(app.env).disk is None
+
+    conf["sphinx_pandera_cache_dir"] = str(tmp_path / "cache")
+    app = make_app("html", srcdir=srcdir, confoverrides=conf, parallel=4)
+    assert isinstance(get_schema_cache(app.env).disk, DiskCache)
+
+
+@pytest.mark.usefixtures("fresh_imports")
+def test_store_reset_between_builds(test_app, make_app):
+    srcdir = test_app("imports").srcdir
+    conf = {"sphinx_pandera_shared_store": True}
+    app = make_app("html", srcdir=srcdir, confoverrides=conf, parallel=4)
+    assert app.is_parallel_allowed("read")
+    assert len(app.env.found_docs) > 5
+    app.build()
+    html = (app.outdir / "base.html").read_text(encoding="utf-8")
+    assert "less_than_or_equal_to(10)" in html
+
+    store = get_schema_cache(app.env).disk
+    store.put("scores.base.ScoreModel", "stale", {"fields": []})
+    (srcdir / "scores" / "consts.py").write_text(
+        "MAX_SCORE = 99\n", encoding="utf-8"
+    )
+    unload_modules("scores")
+
+    app = make_app(
+        "html", srcdir=srcdir, confoverrides=conf, freshenv=True, parallel=4
+    )
+    assert store.get("scores.base.ScoreModel", "stale") is None
+    app.build()
+
+    for name in ("base.html", "schema.html"):
+        html = (app.outdir / name).read_text(encoding="utf-8")
+        assert "less_than_or_equal_to(99)" in html
@@ -0,0 +1,103 @@
+from sphinxcontrib.sphinx_pandera.environment import get_fingerprints
+from sphinxcontrib.sphinx_pandera.split import (
+    get_slices,
+    get_split_objects,
+    split_name,
+)
+
+SPLIT = {"sphinx_pandera_split_threshold": 3, "sphinx_pandera_split_size": 2}
+
+
+def test_slices(test_app):
+    app = test_app("basic", conf=SPLIT)
+
+    assert get_slices(3, app.config) == []
+    assert get_slices(5, app.config) == [(0, 2), (2, 4), (4, 5)]
+
+
+def test_split_name(test_app):
+    test_app("basic")
+
+    assert split_name("target.check_model.TestModel") == (
+        "target.check_model",
+        "TestModel",
+    )
+    assert split_name("target.check_model::TestModel") == (
+        "target.check_model",
+        "TestModel",
+    )
+    assert split_name("unknown.Model") is None
+
+
+def test_fields_documented_on_pages(test_app):
+    app = test_app("basic", conf=SPLIT)
+    app.build()
+
+    pages = sorted(
+        path.name for path in (app.srcdir / "_pandera").glob("*.rst")
+    )
+    assert pages[:3] == [
+        "target.check_model.TestModel.1.rst",
+        "target.check_model.TestModel.2.rst",
+        "target.check_model.TestModel.3.rst",
+    ]
+    assert "target.basic_model.TestModel.1.rst" not in pages
+
+    objects = app.env.get_domain("py").objects
+    assert objects["target.check_model.TestModel.latitude"].docname == (
+        "_pandera/target.check_model.TestModel.2"
+    )
+    assert objects["target.check_model.TestModel.check_num_finess_format"]
+    html = (app.outdir / "models.html").read_text(encoding="utf-8")
+    assert 'href="_pandera/target.check_model.TestModel.1.html"' in html
+
+    fingerprints = get_fingerprints(app.env)
+    assert list(fingerprints["_pandera/target.check_model.TestModel.2"]) == [
+        ("target.check_model", "TestModel[2:4]")
+    ]
+
+
+def test_stale_pages_removed(test_app, make_app):
+    app = test_app("basic", conf=SPLIT)
+    stale = app.srcdir / "_pandera" / "target.removed.Model.1.rst"
+    stale.write_text("Removed\n=======\n", encoding="utf-8")
+    kept = app.srcdir / "_pandera" / "target.check_model.TestModel.1.rst"
+    mtime = kept.stat().st_mtime_ns
+
+    make_app("html", srcdir=app.srcdir, confoverrides=SPLIT)
+
+    assert not stale.exists()
+    assert kept.stat().st_mtime_ns == mtime
+
+
+def test_objects_without_pages_not_split(test_app, make_app):
+    srcdir = test_app("basic").srcdir
+    (srcdir / "target" / "order_model.py").write_text(
+        "import pandera.pandas as pa\n"
+        "from pandera.typing import Series\n\n\n"
+        "class OrderModel(pa.DataFrameModel):\n"
+        "    amount: Series[float]\n"
+        "    price: Series[float]\n"
+        "    quantity: Series[int]\n",
+        encoding="utf-8",
+    )
+    (srcdir / "relative.rst").write_text(
+        "Relative\n========\n\n"
+        ".. py:currentmodule:: target.order_model\n\n"
+        ".. autopandera_model:: OrderModel\n",
+        encoding="utf-8",
+    )
+    conf = {
+        "sphinx_pandera_split_threshold": 2,
+        "sphinx_pandera_split_size": 2,
+    }
+
+    app = make_app("html", srcdir=srcdir, confoverrides=conf)
+    app.build()
+
+    # pages are only generated for fully qualified names
+    assert not list(srcdir.glob("_pandera/target.order_model.*"))
+    assert "target.check_model.TestModel" in get_split_objects(app.env)
+    html = (app.outdir / "relative.html").read_text(encoding="utf-8")
+    assert "_pandera/" not in html
+    assert 'id="target.order_model.OrderModel.amount"' in html
@@ -0,0 +1,246 @@
+import builtins
+import importlib
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from sphinxcontrib.sphinx_pandera.metadata import (
+    describe_model,
+    describe_schema,
+    fingerprint,
+)
+from sphinxcontrib.sphinx_pandera.static import (
+    BUILTIN_DTYPES,
+    STRING_DTYPES,
+    builtin_check,
+    get_static_object,
+)
+from tests.conftest import do_autodoc
+
+STATIC = {"sphinx_pandera_static": True}
+
+STATIC_OBJECTS = [
+    "target.index_model.TestSingleIndexModel",
+    "target.index_model.TestMultiIndexModel",
+    "target.basic_schema.basic_schema",
+    "target.index_schema.single_index_schema",
+    "target.index_schema.multi_index_schema",
+]
+
+
+@pytest.mark.parametrize(
+    "documenter,object_path",
+    [
+        ("pandera_model", "target.index_model.TestSingleIndexModel"),
+        ("pandera_model", "target.index_model.TestMultiIndexModel"),
+        ("pandera_schema", "target.basic_schema.basic_schema"),
+        ("pandera_schema", "target.index_schema.single_index_schema"),
+        ("pandera_schema", "target.index_schema.multi_index_schema"),
+    ],
+)
+def test_static_matches_import(test_app, documenter, object_path):
+    # values of schemas are only rendered once imported
+    options = {"no-value": ""} if documenter == "pandera_schema" else {}
+    expected = do_autodoc(test_app("basic"), documenter, object_path, options)
+    result = do_autodoc(
+        test_app("basic", conf=STATIC), documenter, object_path, options
+    )
+
+    assert get_static_object(*object_path.rsplit(".", 1)) is not None
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "documenter,object_path",
+    [
+        # annotated with a data type instance
+        ("pandera_model", "target.check_model.TestModel"),
+        # columns of a custom data type
+        ("pandera_schema", "target.check_schema.Evaluations"),
+        # config generated by pandera
+        ("pandera_model", "target.basic_model.TestModel"),
+    ],
+)
+def test_unresolved_objects_are_imported(test_app, documenter, object_path):
+    options = {"no-value": ""} if documenter == "pandera_schema" else {}
+    expected = do_autodoc(test_app("basic"), documenter, object_path, options)
+    result = do_autodoc(
+        test_app("basic", conf=STATIC), documenter, object_path, options
+    )
+
+    assert get_static_object(*object_path.rsplit(".", 1)) is None
+    assert result == expected
+
+
+@pytest.mark.parametrize("object_path", STATIC_OBJECTS)
+def test_static_description_matches_import(test_app, object_path):
+    test_app("basic")
+    modname, name = object_path.rsplit(".", 1)
+    obj = getattr(importlib.import_module(modname), name)
+    if isinstance(obj, type):
+        expected = describe_model(obj, obj.to_schema())
+    else:
+        expected = describe_schema(obj)
+
+    description = get_static_object(modname, name).description
+
+    assert description == expected
+    assert fingerprint(description) == fingerprint(expected)
+
+
+def test_static_data_types_match_pandera():
+    # pylint: disable-next=import-outside-toplevel
+    from pandera.engines import pandas_engine
+
+    for name, dtype in BUILTIN_DTYPES.items():
+        assert (
+            str(pandas_engine.Engine.dtype(getattr(builtins, name))) == dtype
+        )
+    for name, dtype in STRING_DTYPES.items():
+        assert str(pandas_engine.Engine.dtype(name)) == dtype
+
+
+@pytest.mark.parametrize(
+    "name,args,kwargs",
+    [
+        ("eq", [1], {}),
+        ("ne", ["a"], {}),
+        ("gt", [0], {}),
+        ("ge", [0.5], {}),
+        ("lt", [5], {}),
+        ("le", [5], {}),
+        ("between", [0, 5], {}),
+        ("in_range", [0, 5], {"include_min": False}),
+        ("in_range", [], {"min_value": 0, "max_value": 5}),
+        ("isin", [[1, 2]], {}),
+        ("notin", [("a", "b")], {}),
+        ("unique_values_eq", [[1, 2]], {}),
+        ("str_matches", ["^a"], {}),
+        ("str_contains", ["a"], {}),
+        ("str_startswith", ["a"], {}),
+        ("str_endswith", ["a"], {}),
+        ("str_length", [1, 3], {}),
+        ("str_length", [2], {}),
+        ("str_length", [], {"max_value": 3}),
+    ],
+)
+def test_static_builtin_checks_match_pandera(name, args, kwargs):
+    # pylint: disable-next=import-outside-toplevel
+    import pandera.pandas as pa
+
+    check = getattr(pa.Check, name)(*args, **kwargs)
+
+    assert builtin_check(name, args, kwargs) == {
+        "name": check.name,
+        "error": check.error,
+        "description": None,
+        "doc": None,
+    }
+
+
+def test_static_never_imports(test_app, tmp_path, monkeypatch):
+    (tmp_path / "production.py").write_text(
+        textwrap.dedent(
+            '''
+            import pandera.pandas as pa
+            import some_database_driver
+
+            class Orders(pa.DataFrameModel):
+                """Orders of the day"""
+
+                _precision = 2
+
+                class Config:
+                    strict = True
+
+                amount: pa.typing.Series[float] = pa.Field(ge=0)
+
+                @pa.check("amount")
+                def round_amount(cls, amount):
+                    """Amounts are rounded to cents"""
+                    return amount.round(2) == amount
+
+            orders = pa.DataFrameSchema(
+                {"amount": pa.Column(float, pa.Check.isin([1, 2]))}
+            )
+            '''
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    app = test_app("basic", conf=STATIC)
+
+    model = do_autodoc(app, "pandera_model", "production.Orders")
+    schema = do_autodoc(app, "pandera_schema", "production.orders")
+    module = do_autodoc(app, "pandera_module", "production")
+
+    assert "production" not in sys.modules
+    assert "   .. py:pandera_check:: Orders.round_amount(amount)" in model
+    assert "         - **greater_than_or_equal_to(0)**" in model
+    assert (
+        "         - :pandera:check:`round_amount "
+        "<production.Orders.round_amount>`"
+    ) in model
+    assert "         - **isin([1, 2])**" in schema
+    assert module == model + schema
+
+
+def test_static_build_never_imports_pandera(tmp_path):
+    (tmp_path / "conf.py").write_text(
+        'extensions = ["sphinxcontrib.sphinx_pandera"]\n'
+        "sphinx_pandera_static = True\n"
+    )
+    (tmp_path / "index.rst").write_text(
+        "Index\n=====\n\n.. autopandera_module:: production\n\n"
+        ".. autopandera_model:: production.Orders\n"
+        "   :no-index:\n"
+    )
+    (tmp_path / "production.py").write_text(
+        textwrap.dedent(
+            '''
+            import pandera.pandas as pa
+
+            class Orders(pa.DataFrameModel):
+                """Orders of the day"""
+
+                class Config:
+                    strict = True
+
+                amount: pa.typing.Series[float] = pa.Field(ge=0)
+            '''
+        )
+    )
+    code = textwrap.dedent(
+        f"""
+        import sys
+        from sphinx.application import Sphinx
+
+        sys.path.insert(0, {str(tmp_path)!r})
+        app = Sphinx(
+            srcdir={str(tmp_path)!r},
+            confdir={str(tmp_path)!r},
+            outdir={str(tmp_path / "_build")!r},
+            doctreedir={str(tmp_path / "_doctrees")!r},
+            buildername="html",
+            status=None,
+        )
+        app.build()
+        assert app.statuscode == 0
+        assert "greater_than_or_equal_to(0)" in (
+            app.outdir / "index.html"
+        ).read_text(encoding="utf-8")
+        assert "production" not in sys.modules, "documented module imported"
+        assert "pandas" not in sys.modules, "pandas imported by the build"
+        assert "pandera" not in sys.modules, "pandera imported by the build"
+        """
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr